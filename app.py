@@ -1,18 +1,22 @@
 from fastapi import FastAPI, Request, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from uvicorn import run as app_run
 from typing import Optional
 import numpy as np
 
-from src.constants_component import APP_HOST, APP_PORT
+from src.constants_component import APP_HOST, APP_PORT, APP_WORKERS
 from src.pipeline_component.prediction_pipeline import LaptopData, LaptopPredictor
-from src.pipeline_component.training_pipeline import TrainingPipeline
+from src.pipeline_component.model_watcher import ModelWatcher
+from src.pipeline_component.prediction_executor import PredictionExecutor, PredictionRejected
+from src.pipeline_component.micro_batcher import MicroBatcher
+from src.pipeline_component.training_job_runner import TrainingJobRunner
+from src.utils_component.helper_functions_ import feature_cache_stats
 from src.logging_component import logger
-from src.exception_component import MyException
-import sys
+import json
+import threading
 
 # ==========================================================
 # FastAPI App Initialization
@@ -37,6 +41,79 @@ app.add_middleware(
 )
 
 
+# ==========================================================
+# Shared Model - loaded once per process
+# ==========================================================
+laptop_predictor = LaptopPredictor()
+model_watcher = ModelWatcher(
+    model_cache=laptop_predictor.model_cache,
+    poll_interval_seconds=laptop_predictor.prediction_pipeline_config.model_reload_interval_seconds,
+)
+
+# each worker process would get its own runner, so neither "one job at a time"
+# nor GET /train/{job_id} would hold across workers: with APP_WORKERS > 1
+# /train is refused and training runs separately (python demo.py)
+training_job_runner = TrainingJobRunner() if APP_WORKERS == 1 else None
+
+# prediction work runs here, never on the event loop
+prediction_executor = PredictionExecutor(
+    max_workers=laptop_predictor.prediction_pipeline_config.prediction_workers,
+    max_queue_size=laptop_predictor.prediction_pipeline_config.prediction_queue_size,
+    min_retry_after_seconds=laptop_predictor.prediction_pipeline_config.retry_after_seconds,
+)
+
+
+# optional: concurrent /predict requests scored together, one executor call per batch
+micro_batcher = None
+if laptop_predictor.prediction_pipeline_config.batching_enabled:
+    micro_batcher = MicroBatcher(
+        score_batch=lambda laptops: prediction_executor.run(laptop_predictor.predict_laptops, laptops),
+        max_rows=laptop_predictor.prediction_pipeline_config.batch_max_rows,
+        max_delay_ms=laptop_predictor.prediction_pipeline_config.batch_max_delay_ms,
+    )
+
+
+def overloaded_headers(e: PredictionRejected) -> dict:
+    return {"Retry-After": str(e.retry_after_seconds)}
+
+
+def training_disabled_response() -> JSONResponse:
+    return JSONResponse(
+        status_code=409,
+        content={"error": f"Training is disabled with {APP_WORKERS} app workers; run it separately (python demo.py)"},
+    )
+
+
+def preload_model():
+    """
+    Download and warm up the model so the first request does not pay for it
+    """
+    try:
+        laptop_predictor.model_cache.get_model()
+    except Exception as e:
+        # keep serving; /ready stays 503 until the watcher or a request loads a model
+        logger.error(f"Model preload failed: {str(e)}")
+
+
+@app.on_event("startup")
+async def load_model_on_startup():
+    """
+    Preload the model in the background, so /health answers right away and
+    /ready turns 200 once the model is resident and warm, then start watching
+    S3 for newly pushed models
+    """
+    threading.Thread(target=preload_model, name="model-preload", daemon=True).start()
+    model_watcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    model_watcher.stop()
+    if training_job_runner is not None:
+        training_job_runner.shutdown()
+    prediction_executor.shutdown()
+
+
 # ==========================================================
 # Home Page - Display Form
 # ==========================================================
@@ -52,22 +129,39 @@ async def index(request: Request):
 
 
 # ==========================================================
-# Training Endpoint
+# Training Endpoints
 # ==========================================================
-@app.get("/train")
-async def train_route():
+@app.post("/train", status_code=202)
+@app.get("/train", status_code=202)
+async def train_route(resume: Optional[str] = None):
     """
-    Trigger the ML training pipeline
+    Start the ML training pipeline in a background process.
+    Returns the job id immediately; poll GET /train/{job_id} for progress.
+    Only one training job runs at a time, repeated triggers get the running job back.
+    ?resume=<run_id> continues a failed run from its first incomplete stage.
+    Refused (409) when serving with several workers.
     """
+    if training_job_runner is None:
+        return training_disabled_response()
     try:
-        logger.info("Starting training pipeline...")
-        train_pipeline = TrainingPipeline()
-        train_pipeline.run_pipeline()
-        logger.info("Training completed successfully")
-        return Response("✅ Training completed successfully!")
+        job, created = training_job_runner.submit(resume=resume)
+        return {**job, "deduplicated": not created}
     except Exception as e:
-        logger.error(f"Training failed: {str(e)}")
-        return Response(f"❌ Training failed: {str(e)}")
+        logger.error(f"Training failed to start: {str(e)}")
+        return JSONResponse(status_code=500, content={"error": f"Training failed to start: {str(e)}"})
+
+
+@app.get("/train/{job_id}")
+async def train_status_route(job_id: str):
+    """
+    Report the status and per-stage progress of a training job
+    """
+    if training_job_runner is None:
+        return training_disabled_response()
+    job = training_job_runner.get(job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": f"Unknown training job {job_id}"})
+    return job
 
 
 # ==========================================================
@@ -94,13 +188,8 @@ async def predict_route(
         logger.info("Prediction request received")
         logger.info(f"Input data - Company: {Company}, TypeName: {TypeName}, Inches: {Inches}")
 
-        # Ensure Ram has "GB" suffix
-        if 'GB' not in str(Ram).upper():
-            Ram = f"{Ram}GB"
-        
-        # Ensure Weight has "kg" suffix
-        if 'kg' not in str(Weight).lower():
-            Weight = f"{Weight}kg"
+        # Ensure Ram has "GB" and Weight has "kg" suffix
+        Ram, Weight = LaptopData.normalize_units(Ram, Weight)
 
         # Create LaptopData object
         laptop_data = LaptopData(
@@ -116,15 +205,14 @@ async def predict_route(
             Weight=Weight
         )
 
-        # Get DataFrame
-        laptop_df = laptop_data.get_input_data_frame()
-        logger.info(f"Input DataFrame created: {laptop_df.shape}")
+        # Make prediction (compiled single-record path, coalesced with
+        # concurrent requests when micro-batching is on)
+        if micro_batcher is not None:
+            prediction = await micro_batcher.submit(laptop_data)
+        else:
+            prediction = await prediction_executor.run(laptop_predictor.predict_laptop, laptop_data)
 
-        # Make prediction
-        predictor = LaptopPredictor()
-        prediction = predictor.predict(dataframe=laptop_df)
-        
-        predicted_price = round(float(prediction[0]), 2)
+        predicted_price = round(prediction, 2)
         logger.info(f"Prediction successful: ${predicted_price}")
 
         return templates.TemplateResponse(
@@ -149,6 +237,19 @@ async def predict_route(
             }
         )
 
+    except PredictionRejected as e:
+        return templates.TemplateResponse(
+            "index.html",
+            {
+                "request": request,
+                "prediction": None,
+                "error": "The server is busy, please try again shortly",
+                "form_data": {}
+            },
+            status_code=503,
+            headers=overloaded_headers(e),
+        )
+
     except Exception as e:
         logger.error(f"Prediction failed: {str(e)}")
         error_message = str(e)
@@ -164,19 +265,119 @@ async def predict_route(
         )
 
 
+# ==========================================================
+# Batch Prediction Endpoint
+# ==========================================================
+@app.post("/predict/batch")
+async def predict_batch_route(request: Request):
+    """
+    Score many laptops in one call.
+    Accepts a JSON array of LaptopData records, or NDJSON
+    (one record per line) with Content-Type application/x-ndjson.
+    """
+    try:
+        body = await request.body()
+        content_type = request.headers.get("content-type", "")
+
+        try:
+            if "ndjson" in content_type:
+                records = [json.loads(line) for line in body.splitlines() if line.strip()]
+            else:
+                records = json.loads(body)
+        except ValueError as e:
+            return JSONResponse(status_code=400, content={"error": f"Invalid JSON: {str(e)}"})
+
+        if not isinstance(records, list):
+            return JSONResponse(status_code=400, content={"error": "Expected a JSON array of records"})
+
+        max_batch_size = laptop_predictor.prediction_pipeline_config.max_batch_size
+        if len(records) > max_batch_size:
+            return JSONResponse(
+                status_code=413,
+                content={"error": f"Batch of {len(records)} records exceeds the limit of {max_batch_size}"}
+            )
+
+        logger.info(f"Batch prediction request received with {len(records)} records")
+        results = await prediction_executor.run(laptop_predictor.predict_batch, records)
+        failed = sum(1 for result in results if "error" in result)
+
+        return {
+            "count": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "results": results,
+        }
+
+    except PredictionRejected as e:
+        return JSONResponse(status_code=503, content={"error": str(e)}, headers=overloaded_headers(e))
+
+    except Exception as e:
+        logger.error(f"Batch prediction failed: {str(e)}")
+        return JSONResponse(status_code=500, content={"error": f"Batch prediction failed: {str(e)}"})
+
+
 # ==========================================================
 # Health Check Endpoint
 # ==========================================================
 @app.get("/health")
 async def health_check():
     """
-    Check if the API is running
+    Check if the API is running (liveness; see /ready for the model)
     """
     return {"status": "healthy", "message": "Laptop Price Predictor API is running"}
 
 
+# ==========================================================
+# Readiness Endpoint
+# ==========================================================
+@app.get("/ready")
+async def readiness_check():
+    """
+    200 once a warmed-up model is resident, 503 before that,
+    so the load balancer keeps cold instances out of rotation
+    """
+    stats = laptop_predictor.model_cache.stats()
+    content = {
+        "status": "ready" if stats["is_loaded"] else "not ready",
+        "model_version": stats["model_version"],
+        "loaded_at": stats["loaded_at"],
+        "load_seconds": stats["last_load_seconds"],
+        "warmup_seconds": stats["last_warmup_seconds"],
+        "warmup_predictions": stats["warmup_predictions"],
+        "last_load_error": stats["last_load_error"],
+    }
+    return JSONResponse(status_code=200 if stats["is_loaded"] else 503, content=content)
+
+
+# ==========================================================
+# Model Cache Stats Endpoint
+# ==========================================================
+@app.get("/model/stats")
+async def model_stats():
+    """
+    Report model cache hits, misses, load time, hot-reload status,
+    prediction queue depth / wait / execution times, micro-batch sizes,
+    feature helper and prediction cache hit rates
+    """
+    return {
+        "model_cache": laptop_predictor.model_cache.stats(),
+        "model_watcher": model_watcher.stats(),
+        "prediction_executor": prediction_executor.stats(),
+        "micro_batcher": micro_batcher.stats() if micro_batcher is not None else None,
+        "feature_cache": feature_cache_stats(),
+        "prediction_cache": (
+            laptop_predictor.prediction_cache.stats()
+            if laptop_predictor.prediction_cache is not None else None
+        ),
+    }
+
+
 # ==========================================================
 # App Runner
 # ==========================================================
 if __name__ == "__main__":
-    app_run(app, host=APP_HOST, port=APP_PORT)
\ No newline at end of file
+    if APP_WORKERS > 1:
+        # each worker imports the app itself; the model is shared through memory-mapped files
+        app_run("app:app", host=APP_HOST, port=APP_PORT, workers=APP_WORKERS)
+    else:
+        app_run(app, host=APP_HOST, port=APP_PORT)
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Request-time preprocessing: ColumnTransformer vs CompiledPreprocessor.
+
+    python -m benchmarks.bench_compiled_preprocessor [--repeats 2000]
+
+Times one record through the DataFrame path (prepare_features + ColumnTransformer.transform)
+and through CompiledPreprocessor.transform_record, then a whole engineered frame
+through ColumnTransformer.transform and CompiledPreprocessor.transform,
+after checking both give the same output.
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from src.Data_transformation_component import DataTransformation
+from src.entity_component.compiled_preprocessor import CompiledPreprocessor
+from src.entity_component.estimator import ModelPredictor
+from src.pipeline_component.prediction_pipeline import LaptopData
+
+
+LAPTOP_DATA_FILE_PATH = "Notebook_experiments/laptop_data.csv"
+
+
+def to_dense(matrix) -> np.ndarray:
+    return matrix.toarray() if sparse.issparse(matrix) else matrix
+
+
+def time_calls(func, items, repeats: int) -> np.ndarray:
+    """
+    Seconds per call, cycling through items.
+    """
+    timings = np.empty(repeats)
+    for i in range(repeats):
+        item = items[i % len(items)]
+        start = time.perf_counter()
+        func(item)
+        timings[i] = time.perf_counter() - start
+    return timings
+
+
+def report(name: str, timings: np.ndarray) -> None:
+    micros = timings * 1e6
+    print(f"{name:<42} p50 {np.percentile(micros, 50):>10.1f} us   p99 {np.percentile(micros, 99):>10.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=2000)
+    args = parser.parse_args()
+    # prepare_features logs every call
+    logging.disable(logging.CRITICAL)
+
+    laptop_data = pd.read_csv(LAPTOP_DATA_FILE_PATH).drop(columns=["Unnamed: 0"])
+    train = DataTransformation.apply_custom_feature_engineering(laptop_data)
+    preprocessor = DataTransformation(None, None).get_data_transformer_object()
+    preprocessor.fit(train.drop(columns=DataTransformation.schema["target_column"]))
+    compiled = CompiledPreprocessor(preprocessor)
+
+    predictor = ModelPredictor(preprocessing_object=preprocessor, trained_model_object=None)
+    laptops = [LaptopData.from_record(record) for record in laptop_data.drop(columns=["Price"]).to_dict("records")]
+    engineered = predictor.prepare_features(LaptopData.to_data_frame(laptops))
+
+    expected = to_dense(preprocessor.transform(engineered))
+    assert np.array_equal(to_dense(compiled.transform(engineered)), expected)
+    assert np.array_equal(np.vstack([compiled.transform_record(laptop) for laptop in laptops]), expected)
+    print(f"{compiled}, output identical to the ColumnTransformer on {len(laptops)} records\n")
+
+    report(
+        "single record, ColumnTransformer",
+        time_calls(lambda laptop: preprocessor.transform(predictor.prepare_features(laptop.get_input_data_frame())),
+                   laptops, args.repeats),
+    )
+    report("single record, CompiledPreprocessor", time_calls(compiled.transform_record, laptops, args.repeats))
+
+    batch_repeats = max(1, args.repeats // 100)
+    report(f"{len(engineered)} rows, ColumnTransformer",
+           time_calls(preprocessor.transform, [engineered], batch_repeats))
+    report(f"{len(engineered)} rows, CompiledPreprocessor",
+           time_calls(compiled.transform, [engineered], batch_repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Feature engineering: row-by-row reference vs vectorized FeatureEngineering.
+
+    python -m benchmarks.bench_feature_engineering [--rows 1000000] [--skip-reference]
+
+laptop_data.csv is tiled to --rows rows and run through the prediction and
+training feature engineering; the vectorized output is checked against the
+reference before anything is timed. Small frames (the /predict path, at and
+around SCALAR_PATH_MAX_ROWS) are timed as well.
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.Data_transformation_component import DataTransformation
+from src.Data_transformation_component.FeatureEngineeringModule import FeatureEngineering, SCALAR_PATH_MAX_ROWS
+from tests.feature_engineering_reference import reference_feature_engineering
+
+
+LAPTOP_DATA_FILE_PATH = "Notebook_experiments/laptop_data.csv"
+TRAINING_COLUMNS = DataTransformation.schema["columns_after_transformation"]
+PREDICTION_COLUMNS = DataTransformation.schema["columns_after_transformation_for_prediction"]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def best_of(repeats: int, func, *args, **kwargs) -> float:
+    return min(timed(func, *args, **kwargs)[1] for _ in range(repeats))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--skip-reference", action="store_true", help="only time the vectorized code")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    laptop_data = pd.read_csv(LAPTOP_DATA_FILE_PATH).drop(columns=["Unnamed: 0"])
+    repeats = -(-args.rows // len(laptop_data))
+    data = pd.concat([laptop_data] * repeats, ignore_index=True).iloc[:args.rows]
+    print(f"{len(data)} rows, {data['Memory'].nunique()} distinct Memory / {data['Cpu'].nunique()} Cpu strings\n")
+
+    for name, columns, training in (("prediction", PREDICTION_COLUMNS, False), ("training", TRAINING_COLUMNS, True)):
+        frame = data if training else data.drop(columns=["Price"])
+        vectorized, vectorized_seconds = timed(FeatureEngineering.transform, frame, columns=columns, training=training)
+        line = f"{name:<10} vectorized {vectorized_seconds:8.2f} s"
+
+        if not args.skip_reference:
+            reference, reference_seconds = timed(reference_feature_engineering, frame, columns, training)
+            pd.testing.assert_frame_equal(vectorized, reference)
+            line += f"   row-by-row {reference_seconds:8.2f} s   {reference_seconds / vectorized_seconds:6.1f}x, identical"
+        print(line)
+
+    print()
+    small = data.drop(columns=["Price"])
+    for rows in (1, SCALAR_PATH_MAX_ROWS, SCALAR_PATH_MAX_ROWS + 1, 64):
+        frame = small.iloc[:rows]
+        path = "scalar" if rows <= SCALAR_PATH_MAX_ROWS else "vectorized"
+        seconds = best_of(50, FeatureEngineering.transform, frame, columns=PREDICTION_COLUMNS, training=False)
+        line = f"{rows:>4} rows  {path:<10} {seconds * 1e3:7.3f} ms"
+        if not args.skip_reference:
+            reference_seconds = best_of(50, reference_feature_engineering, frame, PREDICTION_COLUMNS, False)
+            line += f"   row-by-row {reference_seconds * 1e3:7.3f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
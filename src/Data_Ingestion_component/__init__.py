@@ -4,6 +4,16 @@ from src.constants_component import *
 from src.logging_component import logger
 from src.exception_component import MyException
 from src.data_access.get_data_in_correct_order_module import GetData
+from src.utils_component.main_utils import (
+    read_yaml_file,
+    write_yaml_file,
+    save_dataframe,
+    load_dataframe,
+    load_dataframe_schema,
+    append_dataframe,
+    remove_dataset
+)
+from typing import Optional
 import os
 import sys
 import pandas as pd
@@ -13,42 +23,111 @@ from sklearn.model_selection import train_test_split
 
 
 class DataIngestion:
-    def __init__(self, data_ingestion_config=DataIngestionConfig):
+    def __init__(self, data_ingestion_config=DataIngestionConfig, mongo_client=None):
         """
         Initialize DataIngestion class with config and artifact.
+        mongo_client: optional pymongo-compatible client passed to GetData (e.g. mongomock)
         """
         self.data_ingestion_config = data_ingestion_config
+        self.mongo_client = mongo_client
         self.data_ingestion_artifact = DataIngestionArtifact(
             self.data_ingestion_config.training_file_path,
             self.data_ingestion_config.test_file_path
         )
 
+    def read_watermark(self) -> Optional[str]:
+        """
+        Returns the _id of the last ingested document, None when nothing was ingested yet.
+        Falls back to the feature store itself when the watermark file is missing.
+        A watermark left behind by a deleted feature store is discarded, so the
+        whole collection is read again and the watermark rewritten.
+        """
+        try:
+            watermark_file = self.data_ingestion_config.data_ingestion_watermark_file
+            feature_store_file = self.data_ingestion_config.data_ingestion_feature_store_file
+
+            if not os.path.exists(feature_store_file):
+                if os.path.exists(watermark_file):
+                    logger.info("Feature store missing, discarding the watermark and reading the whole collection")
+                    os.remove(watermark_file)
+                return None
+
+            if os.path.exists(watermark_file):
+                return read_yaml_file(watermark_file).get("last_id")
+
+            ids = load_dataframe(feature_store_file, columns=["_id"])["_id"]
+            return None if ids.empty else ids.max()  # ObjectId hex strings sort in _id order
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+
+    def write_watermark(self, last_id: str, appended_rows: int) -> None:
+        write_yaml_file(
+            self.data_ingestion_config.data_ingestion_watermark_file,
+            {"last_id": last_id, "appended_rows": appended_rows, "updated_at": CURRENT_DATE_TIME},
+            replace=True
+        )
+
+
     def import_data_and_put_into_feature_store(self) -> pd.DataFrame:
         """
-        Import data from MongoDB and store it in feature store as CSV.
+        Bring the local feature store up to date with MongoDB and return its contents.
+        Only documents with an _id above the stored watermark are fetched and appended;
+        rows ingested by earlier runs are read back from local disk.
+        Deleted or edited documents are only picked up by a full refresh
+        (DATA_INGESTION_INCREMENTAL=false).
         """
         try:
             logger.info(
                 "Entered DataIngestion.import_data_and_put_into_feature_store method"
             )
 
-            # Step 1: Get data from MongoDB
-            gf = GetData()
-            dataFrame = gf.get_data_in_correct_form(
-                database_name=DATABASE_NAME, collection_name=COLLECTION_NAME
-            )
-            logger.info(f"Shape of dataframe : {dataFrame.shape}")
-
-           
-           
-            # Step 2: Ensure feature store directory exists
             feature_store_dir = self.data_ingestion_config.data_ingestion_feature_store_dir
+            feature_store_file_path = self.data_ingestion_config.data_ingestion_feature_store_file
             os.makedirs(feature_store_dir, exist_ok=True)
 
-            # Step 3: Save dataframe to feature store CSV
-            feature_store_file_path = self.data_ingestion_config.data_ingestion_feature_store_file
-            logger.info(f"Saving imported data to feature store at: {feature_store_file_path}")
-            dataFrame.to_csv(feature_store_file_path, index=False, header=True)
+            # Step 1: Decide between an incremental update and a full refresh
+            watermark = None
+            if self.data_ingestion_config.incremental_ingestion:
+                watermark = self.read_watermark()
+            elif os.path.exists(feature_store_file_path):
+                logger.info("Incremental ingestion disabled, rebuilding the feature store")
+                remove_dataset(feature_store_file_path)
+            logger.info(f"Ingestion watermark: {watermark}")
+
+            # Step 2: Append the new documents from MongoDB to the feature store
+            gf = GetData(mongo_client=self.mongo_client)
+            new_rows = 0
+            stored_schema = (
+                load_dataframe_schema(feature_store_file_path)
+                if os.path.exists(feature_store_file_path) else None
+            )
+            for chunk in gf.iter_data_chunks(
+                database_name=DATABASE_NAME, collection_name=COLLECTION_NAME,
+                after_id=watermark, include_id=True
+            ):
+                if stored_schema is None:
+                    stored_schema = chunk.head(0)
+                else:
+                    # every part file of the store must have the same columns and dtypes
+                    chunk = chunk.reindex(columns=stored_schema.columns).astype(stored_schema.dtypes.to_dict())
+                append_dataframe(feature_store_file_path, chunk)
+                new_rows += len(chunk)
+                watermark = chunk["_id"].iloc[-1]
+                self.write_watermark(watermark, new_rows)
+
+            logger.info(f"Appended {new_rows} new documents to feature store at: {feature_store_file_path}")
+
+            if not os.path.exists(feature_store_file_path):
+                raise Exception(f"No data found in collection '{COLLECTION_NAME}'")
+
+            # Step 3: Load the full feature store from local disk
+            dataFrame = load_dataframe(feature_store_file_path)
+            # a crash between appending a chunk and writing the watermark can repeat that chunk
+            dataFrame = dataFrame.drop_duplicates(subset="_id", keep="last").drop(columns="_id")
+            dataFrame = dataFrame.reset_index(drop=True)
+            logger.info(f"Shape of dataframe : {dataFrame.shape}")
 
             return dataFrame
 
@@ -59,6 +138,15 @@ class DataIngestion:
             raise MyException(e, sys)
 
 
+    @staticmethod
+    def to_categorical(dataFrame: pd.DataFrame) -> pd.DataFrame:
+        string_columns = [
+            col for col in dataFrame.columns
+            if pd.api.types.is_object_dtype(dataFrame[col]) or pd.api.types.is_string_dtype(dataFrame[col])
+        ]
+        return dataFrame.astype({col: "category" for col in string_columns})
+
+
     def split_data_as_train_test(self, dataFrame: pd.DataFrame):
         """
         Split the dataframe into train and test sets based on configured ratio.
@@ -80,10 +168,21 @@ class DataIngestion:
             os.makedirs(train_dir, exist_ok=True)
             os.makedirs(test_dir, exist_ok=True)
 
-            # Step 3: Export train and test sets
-            logger.info("Exporting train and test datasets to CSV")
-            train_set.to_csv(self.data_ingestion_config.training_file_path, index=False, header=True)
-            test_set.to_csv(self.data_ingestion_config.test_file_path, index=False, header=True)
+            # Step 3: Export train and test sets; string columns are stored as
+            # categoricals so later stages read them back typed and dictionary encoded
+            train_set = self.to_categorical(train_set)
+            test_set = self.to_categorical(test_set)
+            logger.info("Exporting train and test datasets to the feature store format")
+            save_dataframe(self.data_ingestion_config.training_file_path, train_set)
+            save_dataframe(self.data_ingestion_config.test_file_path, test_set)
+
+            if self.data_ingestion_config.export_csv:
+                for file_path, data in [
+                    (self.data_ingestion_config.training_file_path, train_set),
+                    (self.data_ingestion_config.test_file_path, test_set)
+                ]:
+                    save_dataframe(os.path.splitext(file_path)[0] + ".csv", data)
+                logger.info("Exported CSV copies of the train and test datasets")
             logger.info("Exported train and test datasets successfully")
 
         except Exception as e:
@@ -0,0 +1,217 @@
+import re
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
+
+from src.utils_component.helper_functions_ import (
+    parse_memory_column,
+    cached_categorize_cpu,
+    cached_categorize_gpu,
+    cached_categorize_opsys,
+    cached_parse_screen_resolution,
+    cached_parse_memory
+)
+
+
+# "... 1920x1080": digits right before the first "x", and everything up to the next "x"
+RESOLUTION_PATTERN = re.compile(r"^[^x]*?(\d+)x([^x]*)")
+
+# frames up to this many rows (single /predict requests) go through the
+# memoized scalar helpers; pandas string machinery costs more than it saves there
+SCALAR_PATH_MAX_ROWS = 16
+
+
+def _to_lower_str(series: Series) -> Series:
+    if not pd.api.types.is_string_dtype(series):
+        series = series.astype(str)
+    return series.str.lower()
+
+
+def _contains(series: Series, pattern: str) -> np.ndarray:
+    return series.str.contains(pattern, regex=False, na=False).to_numpy(dtype=bool)
+
+
+def _on_unique_values(series: Series, vectorized) -> np.ndarray:
+    """
+    Runs `vectorized` over the distinct values of series only and broadcasts
+    the result back with the factorized codes.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    return np.asarray(vectorized(Series(uniques)))[codes]
+
+
+class FeatureEngineering:
+    """
+    Vectorized version of the laptop.ipynb feature engineering.
+    Uses pandas string accessors and np.select instead of per-row lambdas,
+    and gives the same values as the helpers in helper_functions_.
+    String columns are categorized once per distinct value, and Memory is
+    parsed once into all four storage columns.
+    """
+
+    # --------------------------------------------------
+    # vectorized kernels, run on the distinct values
+    # --------------------------------------------------
+    @staticmethod
+    def _screen_kernel(screen_resolution: Series) -> np.ndarray:
+        res = screen_resolution.str.extract(RESOLUTION_PATTERN)
+        return np.column_stack([
+            screen_resolution.str.contains('Touchscreen', regex=False).astype(np.int64),
+            screen_resolution.str.contains('IPS', regex=False).astype(np.int64),
+            res[0].astype(int),
+            res[1].astype(int),
+        ]).astype(np.int64)
+
+    @staticmethod
+    def _cpu_kernel(cpu: Series) -> np.ndarray:
+        cpu = _to_lower_str(cpu)
+        return np.select(
+            [_contains(cpu, "i5"), _contains(cpu, "i7"), _contains(cpu, "intel"), _contains(cpu, "amd")],
+            [0, 1, 2, 3],
+            default=4,
+        ).astype(np.int64)
+
+    @staticmethod
+    def _gpu_kernel(gpu: Series) -> np.ndarray:
+        gpu = _to_lower_str(gpu)
+        return np.select(
+            [_contains(gpu, "intel"), _contains(gpu, "amd"), _contains(gpu, "nvidia")],
+            ["intel", "Amd", "Nividia"],
+            default="other",
+        )
+
+    @staticmethod
+    def _opsys_kernel(opsys: Series) -> np.ndarray:
+        opsys = _to_lower_str(opsys)
+        return np.select(
+            [
+                _contains(opsys, "windows 10"),
+                _contains(opsys, "windows 7"),
+                _contains(opsys, "linux"),
+                _contains(opsys, "macos"),
+            ],
+            ["Windows 10", "Windows 7", "linux", "Macos"],
+            default="other",
+        )
+
+    # --------------------------------------------------
+    # column features
+    # --------------------------------------------------
+    @classmethod
+    def screen_features(cls, screen_resolution: Series) -> np.ndarray:
+        """
+        (n_rows, 4) int64 matrix of Touchscreen, IPS, X_res and Y_res.
+        """
+        if len(screen_resolution) <= SCALAR_PATH_MAX_ROWS:
+            return np.array(
+                [cached_parse_screen_resolution(value) for value in screen_resolution],
+                dtype=np.int64
+            ).reshape(-1, 4)
+        return _on_unique_values(screen_resolution, cls._screen_kernel)
+
+    @staticmethod
+    def ppi(x_res: np.ndarray, y_res: np.ndarray, inches: Series) -> np.ndarray:
+        return ((x_res ** 2 + y_res ** 2) ** 0.5) / inches.to_numpy(dtype=float)
+
+    @classmethod
+    def cpu_category(cls, cpu: Series) -> np.ndarray:
+        if len(cpu) <= SCALAR_PATH_MAX_ROWS:
+            return np.array([cached_categorize_cpu(value) for value in cpu], dtype=np.int64)
+        return _on_unique_values(cpu, cls._cpu_kernel)
+
+    @staticmethod
+    def memory_capacities(memory: Series) -> np.ndarray:
+        """
+        (n_rows, 4) int64 matrix of SSD, HDD, Flash_Storage and Hybrid capacities in GB.
+        """
+        if len(memory) <= SCALAR_PATH_MAX_ROWS:
+            return np.array(
+                [cached_parse_memory(value) for value in memory],
+                dtype=np.int64
+            ).reshape(-1, 4)
+        return parse_memory_column(memory)
+
+    @classmethod
+    def gpu_category(cls, gpu: Series) -> list:
+        if len(gpu) <= SCALAR_PATH_MAX_ROWS:
+            return [cached_categorize_gpu(value) for value in gpu]
+        return _on_unique_values(gpu, cls._gpu_kernel).tolist()
+
+    @classmethod
+    def opsys_category(cls, opsys: Series) -> list:
+        if len(opsys) <= SCALAR_PATH_MAX_ROWS:
+            return [cached_categorize_opsys(value) for value in opsys]
+        return _on_unique_values(opsys, cls._opsys_kernel).tolist()
+
+    @staticmethod
+    def transform_record(record) -> dict:
+        """
+        Engineered features of a single raw record (any object with the raw
+        column attributes, e.g. LaptopData), without building a DataFrame.
+        Same values as one row of transform(..., training=False).
+        """
+        touchscreen, ips, x_res, y_res = cached_parse_screen_resolution(record.ScreenResolution)
+        ssd, hdd, flash_storage, hybrid = cached_parse_memory(record.Memory)
+
+        return {
+            'Company': record.Company,
+            'TypeName': record.TypeName,
+            'Ram': int(str(record.Ram).replace('GB', '')),
+            'Weight': float(str(record.Weight).replace('kg', '')),
+            'Touchscreen': touchscreen,
+            'IPS': ips,
+            # np.sqrt like the vectorized "** 0.5", so the value is bit for bit the same
+            'ppi': float(np.sqrt(float(x_res ** 2 + y_res ** 2)) / float(record.Inches)),
+            'Cpu_Category': cached_categorize_cpu(record.Cpu),
+            'SSD': ssd,
+            'HDD': hdd,
+            'Flash_Storage': flash_storage,
+            'Hybrid': hybrid,
+            'Gpu_category': cached_categorize_gpu(record.Gpu),
+            'categorize_opsys': cached_categorize_opsys(record.OpSys),
+        }
+
+    @classmethod
+    def transform(cls, data: DataFrame, columns: list, training: bool) -> DataFrame:
+        """
+        Builds the engineered frame in one go instead of copying it after every drop.
+        training=True applies the Price IQR outlier filter and drops rows whose GPU is "other".
+        """
+        if training:
+            q1 = data['Price'].quantile(0.25)
+            q3 = data['Price'].quantile(0.75)
+            iqr = q3 - q1
+            data = data[
+                (data['Price'] >= q1 - 1.5 * iqr) &
+                (data['Price'] <= q3 + 1.5 * iqr)
+            ]
+
+        screen = cls.screen_features(data['ScreenResolution'])
+        memory = cls.memory_capacities(data['Memory'])
+
+        features = {
+            'Company': data['Company'],
+            'TypeName': data['TypeName'],
+            'Ram': data['Ram'].str.replace('GB', '', regex=False).astype(int),
+            'Weight': data['Weight'].str.replace('kg', '', regex=False).astype(float),
+            'Touchscreen': screen[:, 0],
+            'IPS': screen[:, 1],
+            'ppi': cls.ppi(screen[:, 2], screen[:, 3], data['Inches']),
+            'Cpu_Category': cls.cpu_category(data['Cpu']),
+            'SSD': memory[:, 0],
+            'HDD': memory[:, 1],
+            'Flash_Storage': memory[:, 2],
+            'Hybrid': memory[:, 3],
+            'Gpu_category': cls.gpu_category(data['Gpu']),
+            'categorize_opsys': cls.opsys_category(data['OpSys']),
+        }
+        if 'Price' in data.columns:
+            features['Price'] = data['Price']
+
+        frame = DataFrame({column: features[column] for column in columns})
+
+        if training:
+            frame = frame[frame['Gpu_category'] != 'other']
+
+        return frame.reset_index(drop=True)
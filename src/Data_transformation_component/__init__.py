@@ -1,6 +1,5 @@
 import sys
 import numpy as np
-import pandas as pd
 from pandas import DataFrame
 
 from sklearn.pipeline import Pipeline
@@ -16,17 +15,13 @@ from src.entity_component.artifact_entity import (
     DataTransformationArtifact
 )
 
-from src.utils_component.helper_functions_ import (
-    categorize_cpu,
-    extract_memory,
-    categorize_gpu,
-    categorize_opsys
-)
+from src.Data_transformation_component.FeatureEngineeringModule import FeatureEngineering
 
 from src.utils_component.main_utils import (
     save_object,
     save_numpy_array_data,
-    read_yaml_file
+    read_yaml_file,
+    load_dataframe
 )
 
 from src.constants_component import SCHEMA_FILE_PATH
@@ -58,7 +53,8 @@ class DataTransformation:
     @staticmethod
     def read_data(file_path: str) -> DataFrame:
         try:
-            return pd.read_csv(file_path)
+            # only the raw schema columns are read from disk
+            return load_dataframe(file_path, columns=DataTransformation.schema["columns"])
         except Exception as e:
             raise MyException(e, sys)
 
@@ -74,68 +70,13 @@ class DataTransformation:
         try:
             logger.info("Applying feature engineering (training)")
 
-            data = data.copy()
-
-            # Ram & Weight
-            data['Ram'] = data['Ram'].str.replace('GB', '', regex=False).astype(int)
-            data['Weight'] = data['Weight'].str.replace('kg', '', regex=False).astype(float)
-
-            # IQR outlier removal (uses Price)
-            Q1 = data['Price'].quantile(0.25)
-            Q3 = data['Price'].quantile(0.75)
-            IQR = Q3 - Q1
-
-            data = data[
-                (data['Price'] >= Q1 - 1.5 * IQR) &
-                (data['Price'] <= Q3 + 1.5 * IQR)
-            ]
-
-            # Screen
-            data['Touchscreen'] = data['ScreenResolution'].apply(
-                lambda x: 1 if 'Touchscreen' in x else 0
-            )
-            data['IPS'] = data['ScreenResolution'].apply(
-                lambda x: 1 if 'IPS' in x else 0
-            )
-
-            res = data['ScreenResolution'].str.split('x', expand=True)
-            data['X_res'] = res[0].str.extract(r'(\d+)$').astype(int)
-            data['Y_res'] = res[1].astype(int)
-
-            data['ppi'] = (
-                ((data['X_res'] ** 2 + data['Y_res'] ** 2) ** 0.5)
-                / data['Inches']
-            )
-
-            data = data.drop(
-                columns=['ScreenResolution', 'X_res', 'Y_res', 'Inches']
+            # IQR outlier removal on Price and GPU "other" filtering happen inside
+            return FeatureEngineering.transform(
+                data,
+                columns=DataTransformation.schema["columns_after_transformation"],
+                training=True
             )
 
-            # CPU
-            data['Cpu_Category'] = data['Cpu'].apply(categorize_cpu)
-            data = data.drop(columns=['Cpu'])
-
-            # Memory
-            data['SSD'] = data['Memory'].apply(lambda x: extract_memory(x, 'ssd'))
-            data['HDD'] = data['Memory'].apply(lambda x: extract_memory(x, 'hdd'))
-            data['Flash_Storage'] = data['Memory'].apply(lambda x: extract_memory(x, 'flash'))
-            data['Hybrid'] = data['Memory'].apply(lambda x: extract_memory(x, 'hybrid'))
-            data = data.drop(columns=['Memory'])
-
-            # GPU (filtering allowed in training)
-            data['Gpu_category'] = data['Gpu'].apply(categorize_gpu)
-            data = data[data['Gpu_category'] != 'other']
-            data = data.drop(columns=['Gpu'])
-
-            # OS
-            data['categorize_opsys'] = data['OpSys'].apply(categorize_opsys)
-            data = data.drop(columns=['OpSys'])
-
-            # Schema enforcement
-            data = data[DataTransformation.schema["columns_after_transformation"]]
-
-            return data.reset_index(drop=True)
-
         except Exception as e:
             raise MyException(e, sys)
 
@@ -152,57 +93,12 @@ class DataTransformation:
         try:
             logger.info("Applying feature engineering (prediction)")
 
-            data = data.copy()
-
-            # Ram & Weight
-            data['Ram'] = data['Ram'].str.replace('GB', '', regex=False).astype(int)
-            data['Weight'] = data['Weight'].str.replace('kg', '', regex=False).astype(float)
-
-            # Screen
-            data['Touchscreen'] = data['ScreenResolution'].apply(
-                lambda x: 1 if 'Touchscreen' in x else 0
-            )
-            data['IPS'] = data['ScreenResolution'].apply(
-                lambda x: 1 if 'IPS' in x else 0
-            )
-
-            res = data['ScreenResolution'].str.split('x', expand=True)
-            data['X_res'] = res[0].str.extract(r'(\d+)$').astype(int)
-            data['Y_res'] = res[1].astype(int)
-
-            data['ppi'] = (
-                ((data['X_res'] ** 2 + data['Y_res'] ** 2) ** 0.5)
-                / data['Inches']
+            return FeatureEngineering.transform(
+                data,
+                columns=DataTransformation.schema["columns_after_transformation_for_prediction"],
+                training=False
             )
 
-            data = data.drop(
-                columns=['ScreenResolution', 'X_res', 'Y_res', 'Inches']
-            )
-
-            # CPU
-            data['Cpu_Category'] = data['Cpu'].apply(categorize_cpu)
-            data = data.drop(columns=['Cpu'])
-
-            # Memory
-            data['SSD'] = data['Memory'].apply(lambda x: extract_memory(x, 'ssd'))
-            data['HDD'] = data['Memory'].apply(lambda x: extract_memory(x, 'hdd'))
-            data['Flash_Storage'] = data['Memory'].apply(lambda x: extract_memory(x, 'flash'))
-            data['Hybrid'] = data['Memory'].apply(lambda x: extract_memory(x, 'hybrid'))
-            data = data.drop(columns=['Memory'])
-
-            # GPU (NO FILTERING)
-            data['Gpu_category'] = data['Gpu'].apply(categorize_gpu)
-            data = data.drop(columns=['Gpu'])
-
-            # OS
-            data['categorize_opsys'] = data['OpSys'].apply(categorize_opsys)
-            data = data.drop(columns=['OpSys'])
-
-            # Schema enforcement
-            data = data[DataTransformation.schema["columns_after_transformation_for_prediction"]]
-
-            return data.reset_index(drop=True)
-
         except Exception as e:
             raise MyException(e, sys)
 
@@ -2,7 +2,7 @@ from src.entity_component.config_entity import DataValidationConfig
 from src.entity_component.artifact_entity import DataValidationArtifact, DataIngestionArtifact
 from src.logging_component import logger
 from src.exception_component import MyException
-from src.utils_component.main_utils import read_yaml_file, write_yaml_file
+from src.utils_component.main_utils import read_yaml_file, write_yaml_file, load_dataframe
 from src.constants_component import *
 import sys
 import pandas as pd
@@ -35,9 +35,9 @@ class DataValidation:
 
     @staticmethod
     def read_data(file_path: str) -> DataFrame:
-        """Read CSV file into DataFrame."""
+        """Read a feature store file into DataFrame."""
         try:
-            df = pd.read_csv(file_path)
+            df = load_dataframe(file_path)
             return df
         except Exception as e:
             raise MyException(e, sys)
@@ -0,0 +1,153 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from scipy import stats
+from sklearn.pipeline import Pipeline
+from sklearn.model_selection import GridSearchCV, KFold, ParameterSampler
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingGridSearchCV
+
+from src.Model_Trainer_component.ModelFactoryModule import ModelFactory
+from src.logging_component import logger
+
+
+SEARCH_METHODS = ("grid", "random", "halving_grid", "halving_random")
+
+# distributions a random search space may use instead of a list of values
+DISTRIBUTIONS = {
+    "randint": lambda low, high: stats.randint(low, high + 1),
+    "uniform": lambda low, high: stats.uniform(low, high - low),
+    "loguniform": lambda low, high: stats.loguniform(low, high),
+}
+
+
+class HyperparameterSearch:
+    """
+    Cross-validated search over the ModelFactory models described in the
+    `search` section of model.yaml.
+
+    Every model space becomes one entry of a param grid over a single
+    Pipeline step, so one search compares all models. Candidates are fitted
+    in parallel worker processes (joblib), each candidate single threaded;
+    memory-mapped training arrays are shared with the workers instead of
+    being copied. The halving methods fit every candidate on a small sample
+    first and only keep the best 1/factor of them for the next, larger round.
+    """
+
+    def __init__(self, search_config: dict, n_jobs: Optional[int] = None):
+        self.method = search_config.get("method", "halving_random")
+        if self.method not in SEARCH_METHODS:
+            raise ValueError(f"Unsupported search method: {self.method}, expected one of {SEARCH_METHODS}")
+
+        self.spaces = search_config.get("spaces") or []
+        if not self.spaces:
+            raise ValueError("Search is enabled but model.yaml declares no search spaces")
+
+        self.cv = search_config.get("cv", 3)
+        self.factor = search_config.get("factor", 3)
+        self.n_candidates = search_config.get("n_candidates", 20)
+        self.scoring = search_config.get("scoring", "r2")
+        self.random_state = search_config.get("random_state", 42)
+        self.n_jobs = n_jobs
+
+    def _values(self, name: str, spec):
+        if isinstance(spec, dict):
+            if self.method not in ("random", "halving_random"):
+                raise ValueError(f"Distribution for {name} can only be used with a random search")
+            distribution = spec.get("distribution")
+            if distribution not in DISTRIBUTIONS:
+                raise ValueError(f"Unsupported distribution for {name}: {distribution}")
+            return DISTRIBUTIONS[distribution](spec["low"], spec["high"])
+        return spec if isinstance(spec, list) else [spec]
+
+    def _sample(self, space_grid: dict, n_iter: int) -> list:
+        """
+        Up to n_iter distinct random candidates of one model space, as single point grids.
+        """
+        if all(isinstance(values, list) for values in space_grid.values()):
+            # a finite space smaller than n_iter is simply enumerated
+            n_iter = min(n_iter, int(np.prod([len(values) for values in space_grid.values()])))
+
+        candidates, seen = [], set()
+        for params in ParameterSampler(space_grid, n_iter=n_iter, random_state=self.random_state):
+            key = repr(sorted((name, value) for name, value in params.items() if name != "model"))
+            if key not in seen:
+                seen.add(key)
+                candidates.append({name: [value] for name, value in params.items()})
+        return candidates
+
+    def param_grid(self) -> list:
+        """
+        One grid per model space, addressed through the pipeline's "model" step.
+        Random methods sample their candidates per space (n_candidates split evenly),
+        so a model with a small space is not drawn over and over again.
+        """
+        grid = []
+        per_space = max(1, -(-self.n_candidates // len(self.spaces)))
+        for space in self.spaces:
+            # each candidate fits on one core; the parallelism is across candidates
+            model = ModelFactory.get_model(space["name"], space.get("fixed_params") or {}, n_jobs=1)
+            entry = {"model": [model]}
+            for name, spec in (space.get("params") or {}).items():
+                entry[f"model__{name}"] = self._values(name, spec)
+
+            if self.method in ("random", "halving_random"):
+                grid.extend(self._sample(entry, per_space))
+            else:
+                grid.append(entry)
+        return grid
+
+    def _search_cv(self):
+        estimator = Pipeline([("model", ModelFactory.get_model(self.spaces[0]["name"], {}))])
+        cv = KFold(n_splits=self.cv, shuffle=True, random_state=self.random_state)
+        common = dict(estimator=estimator, cv=cv, scoring=self.scoring, n_jobs=self.n_jobs, refit=True)
+
+        # random candidates are drawn up front in param_grid, so both searches
+        # are grid searches over an explicit candidate list
+        if self.method in ("grid", "random"):
+            return GridSearchCV(param_grid=self.param_grid(), **common)
+
+        # "exhaust": the first round is as small as needed for the last one to use all the rows
+        return HalvingGridSearchCV(
+            param_grid=self.param_grid(), factor=self.factor, min_resources="exhaust",
+            random_state=self.random_state, **common
+        )
+
+    @staticmethod
+    def search_log(cv_results: dict) -> DataFrame:
+        """
+        One row per evaluated candidate (per halving round), best first.
+        """
+        log = pd.DataFrame(cv_results)
+        columns = [col for col in ["iter", "n_resources", "mean_test_score", "std_test_score",
+                                   "rank_test_score", "mean_fit_time", "params"] if col in log.columns]
+        log = log[columns].copy()
+        log["model"] = [type(params["model"]).__name__ for params in log["params"]]
+        log["params"] = [
+            {name.replace("model__", ""): value for name, value in params.items() if name != "model"}
+            for params in log["params"]
+        ]
+        log["params"] = log["params"].astype(str)
+        sort_columns = ["iter", "mean_test_score"] if "iter" in log.columns else ["mean_test_score"]
+        return log.sort_values(sort_columns, ascending=False).reset_index(drop=True)
+
+    def search(self, X_train, y_train) -> Tuple[object, DataFrame]:
+        """
+        Runs the search and returns (best model refitted on all of X_train, search log).
+        """
+        search_cv = self._search_cv()
+        logger.info(
+            f"Hyperparameter search: method={self.method}, models={[space['name'] for space in self.spaces]}, "
+            f"cv={self.cv}, n_jobs={self.n_jobs}"
+        )
+        search_cv.fit(X_train, y_train)
+
+        best_model = search_cv.best_estimator_.named_steps["model"]
+        log = self.search_log(search_cv.cv_results_)
+        logger.info(
+            f"Hyperparameter search done: {len(log)} fits, best {type(best_model).__name__} "
+            f"{log['params'].iloc[0]} with CV {self.scoring} {search_cv.best_score_:.4f}"
+        )
+        return best_model, log
@@ -0,0 +1,171 @@
+import io
+import time
+from typing import Callable, Optional, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from sklearn.metrics import r2_score, mean_absolute_error, mean_squared_error
+
+from src.Model_Trainer_component.ModelFactoryModule import ModelFactory
+from src.entity_component.flat_forest import FlatForest
+from src.constants_component import FLAT_FOREST_MAX_ROWS
+from src.logging_component import logger
+
+
+# metric -> True when higher is better
+SELECTION_METRICS = {"r2": True, "mae": False, "rmse": False}
+
+
+class Leaderboard:
+    """
+    Fits every candidate listed in the `leaderboard` section of model.yaml and
+    records what matters for serving next to accuracy: fit time, single-row
+    and batch inference latency and serialized size.
+
+    Latency is measured on the fitted model alone, with the inference n_jobs
+    setting and the engine serving would use: with flat_forest (model.yaml
+    inference.flat_forest) tree models are timed through their FlatForest
+    export for batches up to FLAT_FOREST_MAX_ROWS rows, like ModelPredictor
+    serves them. Feature engineering and preprocessing cost the same for
+    every candidate. The best model by the selection metric among the ones
+    within the latency / size budget is selected.
+    """
+
+    def __init__(self, leaderboard_config: dict, training_n_jobs: Optional[int] = None,
+                 inference_n_jobs: Optional[int] = None, flat_forest: bool = False):
+        self.candidates = leaderboard_config.get("candidates") or []
+        if not self.candidates:
+            raise ValueError("Leaderboard is enabled but model.yaml declares no candidates")
+
+        selection = leaderboard_config.get("selection") or {}
+        self.metric = selection.get("metric", "r2")
+        if self.metric not in SELECTION_METRICS:
+            raise ValueError(f"Unsupported selection metric: {self.metric}, expected one of {list(SELECTION_METRICS)}")
+        self.max_p99_ms = selection.get("max_p99_ms")
+        self.max_size_mb = selection.get("max_size_mb")
+
+        self.latency_repeats = leaderboard_config.get("latency_repeats", 200)
+        self.training_n_jobs = training_n_jobs
+        self.inference_n_jobs = inference_n_jobs
+        self.flat_forest = flat_forest
+
+    def _serving_predict(self, model) -> Tuple[Callable, str]:
+        """
+        (predict function, engine name) of the fitted model as serving runs it.
+        """
+        if not (self.flat_forest and FlatForest.supports(model)):
+            return model.predict, "estimator"
+
+        flat_model = FlatForest.from_estimator(model)
+
+        def predict(X):
+            return flat_model.predict(X) if X.shape[0] <= FLAT_FOREST_MAX_ROWS else model.predict(X)
+        return predict, "flat_forest"
+
+    def _single_row_latencies_ms(self, predict: Callable, X) -> np.ndarray:
+        rows = [X[i:i + 1] for i in range(min(X.shape[0], self.latency_repeats))]
+        for row in rows[:5]:
+            predict(row)  # warm up
+
+        latencies = np.empty(self.latency_repeats)
+        for i in range(self.latency_repeats):
+            row = rows[i % len(rows)]
+            started = time.perf_counter()
+            predict(row)
+            latencies[i] = time.perf_counter() - started
+        return latencies * 1000
+
+    @staticmethod
+    def _batch_ms_per_1k_rows(predict: Callable, X) -> float:
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            predict(X)
+            timings.append(time.perf_counter() - started)
+        return min(timings) * 1000 * 1000 / X.shape[0]
+
+    @staticmethod
+    def _size_mb(model) -> float:
+        buffer = io.BytesIO()
+        joblib.dump(model, buffer)
+        return buffer.tell() / (1024 * 1024)
+
+    def evaluate_candidate(self, name: str, params: dict, X_train, y_train, X_test, y_test) -> Tuple[object, dict]:
+        model = ModelFactory.get_model(name, params, n_jobs=self.training_n_jobs)
+
+        started = time.perf_counter()
+        model.fit(X_train, y_train)
+        fit_seconds = time.perf_counter() - started
+
+        ModelFactory.set_n_jobs(model, self.inference_n_jobs)
+        y_pred = model.predict(X_test)
+        predict, engine = self._serving_predict(model)
+        latencies = self._single_row_latencies_ms(predict, X_test)
+
+        row = {
+            "model": name,
+            "params": str(params),
+            "r2": r2_score(y_test, y_pred),
+            "mae": mean_absolute_error(y_test, y_pred),
+            "rmse": float(np.sqrt(mean_squared_error(y_test, y_pred))),
+            "fit_seconds": fit_seconds,
+            "serving_engine": engine,
+            "single_row_p50_ms": float(np.percentile(latencies, 50)),
+            "single_row_p99_ms": float(np.percentile(latencies, 99)),
+            "batch_ms_per_1k_rows": self._batch_ms_per_1k_rows(predict, X_test),
+            "size_mb": self._size_mb(model),
+        }
+        return model, row
+
+    def within_budget(self, row: dict) -> bool:
+        if self.max_p99_ms is not None and row["single_row_p99_ms"] > self.max_p99_ms:
+            return False
+        if self.max_size_mb is not None and row["size_mb"] > self.max_size_mb:
+            return False
+        return True
+
+    def run(self, X_train, y_train, X_test, y_test) -> Tuple[object, DataFrame]:
+        """
+        Returns (selected fitted model, leaderboard sorted by the selection metric).
+        """
+        models, rows = [], []
+        for candidate in self.candidates:
+            name, params = candidate["name"], candidate.get("params") or {}
+            try:
+                model, row = self.evaluate_candidate(name, params, X_train, y_train, X_test, y_test)
+            except ImportError as e:
+                # an optional library (xgboost, catboost) that is not installed;
+                # any other error is a real failure and stops training
+                logger.warning(f"Leaderboard: skipping {name}: {e}")
+                continue
+
+            row["within_budget"] = self.within_budget(row)
+            logger.info(
+                f"Leaderboard: {name} r2={row['r2']:.4f} fit={row['fit_seconds']:.2f}s "
+                f"p99={row['single_row_p99_ms']:.3f}ms size={row['size_mb']:.2f}MB"
+            )
+            models.append(model)
+            rows.append(row)
+
+        if not rows:
+            raise ValueError("No leaderboard candidate could be trained")
+
+        board = pd.DataFrame(rows)
+        board["model_index"] = range(len(board))
+        board = board.sort_values(self.metric, ascending=not SELECTION_METRICS[self.metric])
+
+        eligible = board[board["within_budget"]]
+        if eligible.empty:
+            raise ValueError(
+                f"No candidate meets the budget (p99 <= {self.max_p99_ms} ms, size <= {self.max_size_mb} MB)"
+            )
+
+        best = eligible.iloc[0]
+        board["selected"] = board["model_index"] == best["model_index"]
+        logger.info(
+            f"Leaderboard selected {best['model']} ({self.metric}={best[self.metric]:.4f}, "
+            f"p99={best['single_row_p99_ms']:.3f}ms)"
+        )
+        return models[int(best["model_index"])], board.drop(columns="model_index").reset_index(drop=True)
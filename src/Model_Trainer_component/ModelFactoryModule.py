@@ -1,5 +1,18 @@
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.linear_model import LinearRegression
+from typing import Optional
+
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
+from sklearn.linear_model import LinearRegression, Ridge
+
+# optional model families, only needed when model.yaml asks for them
+try:
+    from xgboost import XGBRegressor
+except ImportError:
+    XGBRegressor = None
+
+try:
+    from catboost import CatBoostRegressor
+except ImportError:
+    CatBoostRegressor = None
 
 
 class ModelFactory:
@@ -7,14 +20,58 @@ class ModelFactory:
     Creates untrained model objects only
     """
 
+    # defaults applied before the params from model.yaml; CatBoost only reports
+    # params set explicitly, so thread_count is set for set_n_jobs to find it
+    DEFAULT_PARAMS = {
+        "CatBoostRegressor": {"verbose": 0, "allow_writing_files": False, "thread_count": -1},
+    }
+
     @staticmethod
-    def get_model(model_name: str, params: dict):
+    def get_model(model_name: str, params: dict, n_jobs: Optional[int] = None):
+        """
+        n_jobs: cores to use, applied to models that support it; None keeps the model default
+        """
+        params = {**ModelFactory.DEFAULT_PARAMS.get(model_name, {}), **(params or {})}
 
         if model_name == "RandomForestRegressor":
-            return RandomForestRegressor(**params)
+            model = RandomForestRegressor(**params)
 
         elif model_name == "LinearRegression":
-            return LinearRegression(**params)
+            model = LinearRegression(**params)
+
+        elif model_name == "Ridge":
+            model = Ridge(**params)
+
+        elif model_name == "HistGradientBoostingRegressor":
+            model = HistGradientBoostingRegressor(**params)
+
+        elif model_name == "XGBRegressor":
+            if XGBRegressor is None:
+                raise ImportError("XGBRegressor requested but xgboost is not installed")
+            model = XGBRegressor(**params)
+
+        elif model_name == "CatBoostRegressor":
+            if CatBoostRegressor is None:
+                raise ImportError("CatBoostRegressor requested but catboost is not installed")
+            model = CatBoostRegressor(**params)
 
         else:
             raise ValueError(f"Unsupported model: {model_name}")
+
+        return ModelFactory.set_n_jobs(model, n_jobs)
+
+    @staticmethod
+    def set_n_jobs(model, n_jobs: Optional[int]):
+        """
+        Sets n_jobs (thread_count for CatBoost) on a fitted or unfitted estimator if it has that parameter.
+        HistGradientBoostingRegressor has none; it follows the OpenMP thread settings.
+        """
+        if n_jobs is None:
+            return model
+
+        params = model.get_params()
+        if "n_jobs" in params:
+            model.set_params(n_jobs=n_jobs)
+        elif "thread_count" in params:
+            model.set_params(thread_count=n_jobs)
+        return model
@@ -1,7 +1,11 @@
 from src.Model_Trainer_component.ModelFactoryModule import ModelFactory
-from src.utils_component.main_utils import read_yaml_file, load_object
+from src.Model_Trainer_component.HyperparameterSearchModule import HyperparameterSearch
+from src.Model_Trainer_component.LeaderboardModule import Leaderboard
+from src.utils_component.main_utils import read_yaml_file, load_object, save_dataframe
 import sys
 import os
+import io
+import time
 import numpy as np
 import joblib
 
@@ -17,6 +21,8 @@ from src.entity_component.artifact_entity import (
 )
 from src.entity_component.config_entity import ModelTrainerConfig
 from src.entity_component.estimator import ModelPredictor
+from src.entity_component.flat_forest import FlatForest
+from src.entity_component.model_bundle import ModelBundle
 from src.constants_component import MODEL_SCHEMA_FILE_PATH
 
 
@@ -34,18 +40,26 @@ class ModelTrainer:
             self.data_transformation_artifact = data_transformation_artifact
             self.model_trainer_config = model_trainer_config
             self.model_schema = read_yaml_file(MODEL_SCHEMA_FILE_PATH)
+            self.search_log = None
+            self.leaderboard = None
         except Exception as e:
             raise MyException(e, sys)
 
-    def load_data(self):
+    def load_data(self, mmap_mode=None):
+        """
+        mmap_mode="r" maps the arrays instead of reading them, so the search
+        worker processes share one copy through the page cache.
+        """
         try:
             train_arr = np.load(
                 self.data_transformation_artifact.transformed_train_file_path,
-                allow_pickle=True
+                allow_pickle=mmap_mode is None,
+                mmap_mode=mmap_mode
             )
             test_arr = np.load(
                 self.data_transformation_artifact.transformed_test_file_path,
-                allow_pickle=True
+                allow_pickle=mmap_mode is None,
+                mmap_mode=mmap_mode
             )
 
             X_train, y_train = train_arr[:, :-1], train_arr[:, -1]
@@ -56,18 +70,49 @@ class ModelTrainer:
         except Exception as e:
             raise MyException(e, sys)
 
+    @property
+    def search_config(self) -> dict:
+        return self.model_schema.get("search") or {}
+
+    @property
+    def leaderboard_config(self) -> dict:
+        return self.model_schema.get("leaderboard") or {}
+
     def train_and_evaluate(self, X_train, y_train, X_test, y_test):
         try:
             model_config = self.model_schema["model"]
+            parallelism = self.model_schema.get("parallelism") or {}
+            self.search_log = None
+            self.leaderboard = None
+
+            if self.search_config.get("enabled"):
+                model, self.search_log = HyperparameterSearch(
+                    self.search_config,
+                    n_jobs=parallelism.get("training_n_jobs")
+                ).search(X_train, y_train)
+                # the refitted best model was built single threaded for the search
+                ModelFactory.set_n_jobs(model, parallelism.get("training_n_jobs"))
+            elif self.leaderboard_config.get("enabled"):
+                model, self.leaderboard = Leaderboard(
+                    self.leaderboard_config,
+                    training_n_jobs=parallelism.get("training_n_jobs"),
+                    inference_n_jobs=parallelism.get("inference_n_jobs"),
+                    flat_forest=(self.model_schema.get("inference") or {}).get("flat_forest", False)
+                ).run(X_train, y_train, X_test, y_test)
+            else:
+                logger.info(
+                    f"Training model: {model_config['name']} "
+                    f"(n_jobs={parallelism.get('training_n_jobs')})"
+                )
 
-            logger.info(f"Training model: {model_config['name']}")
+                model = ModelFactory.get_model(
+                    model_config["name"],
+                    model_config["params"],
+                    n_jobs=parallelism.get("training_n_jobs")
+                )
 
-            model = ModelFactory.get_model(
-                model_config["name"],
-                model_config["params"]
-            )
+                model.fit(X_train, y_train)
 
-            model.fit(X_train, y_train)
             y_pred = model.predict(X_test)
 
             r2 = r2_score(y_test, y_pred)
@@ -83,26 +128,92 @@ class ModelTrainer:
         except Exception as e:
             raise MyException(e, sys)
 
-    def save_model(self, model):
+    def export_flat_model(self, model_predictor: ModelPredictor, X_check) -> None:
+        """
+        Flattens a tree ensemble into a FlatForest for fast small-batch serving.
+        It is only attached when it reproduces the estimator exactly on X_check.
+        """
+        model = model_predictor.trained_model_object
+        if not (self.model_schema.get("inference") or {}).get("flat_forest", False):
+            return
+        if not FlatForest.supports(model):
+            logger.info(f"No flat export for {type(model).__name__}, serving uses the estimator")
+            return
+
+        flat_model = FlatForest.from_estimator(model)
+        expected, actual = model.predict(X_check), flat_model.predict(X_check)
+        if not np.array_equal(expected, actual):
+            logger.warning(
+                f"Flat export differs from the estimator (max abs diff "
+                f"{np.max(np.abs(expected - actual))}), not using it"
+            )
+            return
+
+        model_predictor.flat_model = flat_model
+        logger.info(f"Exported {flat_model}, identical to the estimator on {len(X_check)} rows")
+
+    def write_model_file(self, model_predictor: ModelPredictor, file_path: str) -> None:
+        """
+        Writes a ModelBundle when model.yaml asks for one and the model can be
+        bundled (flat forest plus compilable preprocessing), a joblib pickle
+        otherwise. Logs the bundle's size and load time against the pickle's.
+        """
+        inference_config = self.model_schema.get("inference") or {}
+        artifact_format = inference_config.get("artifact_format", "pickle")
+        compression = inference_config.get("bundle_compression") or None
+        if compression == "none":
+            compression = None
+
+        if artifact_format != "bundle" or not ModelBundle.supports(model_predictor):
+            if artifact_format == "bundle":
+                logger.info(f"{model_predictor} cannot be bundled, saving it as a pickle")
+            joblib.dump(model_predictor, file_path)
+            return
+
+        buffer = io.BytesIO()
+        joblib.dump(model_predictor, buffer)
+        pickle_bytes = buffer.getvalue()
+        start = time.perf_counter()
+        joblib.load(io.BytesIO(pickle_bytes))
+        pickle_load_seconds = time.perf_counter() - start
+
+        bundle_bytes = ModelBundle.dumps(model_predictor, compression=compression)
+        start = time.perf_counter()
+        ModelBundle.loads(bundle_bytes)
+        bundle_load_seconds = time.perf_counter() - start
+
+        with open(file_path, "wb") as file:
+            file.write(bundle_bytes)
+        logger.info(
+            f"Saved model bundle (compression={compression}): {len(bundle_bytes) / 1e6:.2f} MB, "
+            f"loads in {bundle_load_seconds * 1000:.1f} ms; the pickle would be "
+            f"{len(pickle_bytes) / 1e6:.2f} MB, loading in {pickle_load_seconds * 1000:.1f} ms"
+        )
+
+    def save_model(self, model, X_check=None):
+        """
+        X_check: transformed rows used to verify the flat export (skipped when None)
+        """
         try:
             preprocessor = load_object(
                 self.data_transformation_artifact.transformed_object_file_path
             )
 
+            # the saved model predicts with the inference setting, not the training one
+            inference_n_jobs = (self.model_schema.get("parallelism") or {}).get("inference_n_jobs")
             model_predictor = ModelPredictor(
                 preprocessing_object=preprocessor,
-                trained_model_object=model
+                trained_model_object=ModelFactory.set_n_jobs(model, inference_n_jobs)
             )
+            if X_check is not None:
+                self.export_flat_model(model_predictor, X_check)
 
             os.makedirs(
                 os.path.dirname(self.model_trainer_config.trained_model_file_path),
                 exist_ok=True
             )
 
-            joblib.dump(
-                model_predictor,
-                self.model_trainer_config.trained_model_file_path
-            )
+            self.write_model_file(model_predictor, self.model_trainer_config.trained_model_file_path)
 
             logger.info("Regression model saved successfully")
 
@@ -113,7 +224,9 @@ class ModelTrainer:
         try:
             logger.info("Model Trainer started")
 
-            X_train, y_train, X_test, y_test = self.load_data()
+            X_train, y_train, X_test, y_test = self.load_data(
+                mmap_mode="r" if self.search_config.get("enabled") else None
+            )
 
             model, r2, mae, rmse = self.train_and_evaluate(
                 X_train, y_train, X_test, y_test
@@ -125,7 +238,19 @@ class ModelTrainer:
                     f"{self.model_trainer_config.expected_r2_score}"
                 )
 
-            self.save_model(model)
+            self.save_model(model, X_check=X_test)
+
+            search_log_file_path = None
+            if self.search_log is not None:
+                search_log_file_path = self.model_trainer_config.search_log_file_path
+                save_dataframe(search_log_file_path, self.search_log)
+                logger.info(f"Search log saved to {search_log_file_path}")
+
+            leaderboard_file_path = None
+            if self.leaderboard is not None:
+                leaderboard_file_path = self.model_trainer_config.leaderboard_file_path
+                save_dataframe(leaderboard_file_path, self.leaderboard)
+                logger.info(f"Leaderboard saved to {leaderboard_file_path}")
 
             metric_artifact = RegressionMetricArtifact(
                 r2_score=r2,
@@ -135,7 +260,9 @@ class ModelTrainer:
 
             return ModelTrainerArtifact(
                 trained_model_file_path=self.model_trainer_config.trained_model_file_path,
-                metric_artifact=metric_artifact
+                metric_artifact=metric_artifact,
+                search_log_file_path=search_log_file_path,
+                leaderboard_file_path=leaderboard_file_path
             )
 
         except Exception as e:
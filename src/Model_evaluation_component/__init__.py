@@ -1,6 +1,5 @@
 
 import sys
-import pandas as pd
 from typing import Optional
 from dataclasses import dataclass
 from sklearn.metrics import r2_score
@@ -11,6 +10,7 @@ from src.exception_component import MyException
 from src.constants_component import *
 from src.entity_component.s3_estimator import LaptopTrainedModelEstimator
 from src.entity_component.estimator import ModelPredictor
+from src.utils_component.main_utils import load_dataframe
 
 from src.logging_component import logger
 
@@ -24,26 +24,59 @@ class EvaluateModelResponse:
     difference: float
 
 
+# marks that the production model was not fetched ahead of time
+NOT_FETCHED = object()
+
+
 class ModelEvaluation:
 
     def __init__(self, model_eval_config: ModelEvaluationConfig,
                  data_ingestion_artifact: DataIngestionArtifact,
-                 model_trainer_artifact: ModelTrainerArtifact):
+                 model_trainer_artifact: ModelTrainerArtifact,
+                 best_model=NOT_FETCHED):
+        """
+        :param best_model: production model already fetched with fetch_best_model
+                           (None when there is none); fetched on demand when not given
+        """
         try:
             logger.info("Initializing ModelEvaluation class")
             self.model_eval_config = model_eval_config
             self.data_ingestion_artifact = data_ingestion_artifact
             self.model_trainer_artifact = model_trainer_artifact
+            self.best_model = best_model
         except Exception as e:
             logger.exception("Error during initialization of ModelEvaluation")
             raise MyException(e, sys) from e
 
+    @staticmethod
+    def fetch_best_model(model_eval_config: ModelEvaluationConfig) -> Optional[LaptopTrainedModelEstimator]:
+        """
+        Downloads the production model from S3, None if there is none.
+        Needs nothing from the current run, so it can start before training ends.
+        """
+        try:
+            estimator = LaptopTrainedModelEstimator(
+                bucket_name=model_eval_config.bucket_name,
+                model_path=model_eval_config.s3_model_key_path
+            )
+            if not estimator.is_model_present():
+                logger.info("No production model found")
+                return None
+            estimator.loaded_model = estimator.load_model()
+            logger.info(f"Production model fetched from {model_eval_config.s3_model_key_path}")
+            return estimator
+        except Exception as e:
+            raise MyException(e, sys) from e
+
     def get_best_model(self) -> Optional[LaptopTrainedModelEstimator]:
         """
         Fetches the production model from S3 if available
         """
         try:
             logger.info("Entering get_best_model()")
+            if self.best_model is not NOT_FETCHED:
+                return self.best_model
+
             bucket_name = self.model_eval_config.bucket_name
             model_path = self.model_eval_config.s3_model_key_path
             estimator = LaptopTrainedModelEstimator(bucket_name=bucket_name, model_path=model_path)
@@ -63,7 +96,7 @@ class ModelEvaluation:
         """
         try:
             logger.info("Entering evaluate_model()")
-            test_df = pd.read_csv(self.data_ingestion_artifact.test_file_path)
+            test_df = load_dataframe(self.data_ingestion_artifact.test_file_path)
             X, y = test_df.drop(TARGET_COLUMN, axis=1), test_df[TARGET_COLUMN]
             logger.info(f"Test data loaded: {X.shape[0]} samples, {X.shape[1]} features")
 
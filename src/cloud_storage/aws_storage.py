@@ -11,6 +11,7 @@ from mypy_boto3_s3.service_resource import Bucket
 
 
 from botocore.exceptions import ClientError
+from src.cloud_storage.model_disk_cache import ModelDiskCache, SHA256_METADATA_KEY, file_sha256
 from pandas import DataFrame,read_csv
 import pickle
 
@@ -33,6 +34,35 @@ class SimpleStorageService:
                 return False
         except Exception as e:
             raise MyException(e,sys)
+
+
+
+    def get_object_version(self, bucket_name: str, s3_key: str) -> Union[dict, None]:
+        """
+        Method Name :   get_object_version
+        Description :   This method fetches the ETag, LastModified and VersionId of s3_key with a single HEAD request
+
+        Output      :   dict with the object version details, None if the object does not exist
+        On Failure  :   Write an exception log and then raise an exception
+        """
+        logger.info("Entered the get_object_version method of S3Operations class")
+
+        try:
+            response = self.s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+            logger.info("Exited the get_object_version method of S3Operations class")
+            return {
+                "etag": response.get("ETag", "").strip('"'),
+                "last_modified": str(response.get("LastModified")),
+                "version_id": response.get("VersionId"),
+            }
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise MyException(e, sys) from e
+        except Exception as e:
+            raise MyException(e, sys) from e
+
         
 
         
@@ -119,14 +149,31 @@ class SimpleStorageService:
 
 
 
-    def load_model(self, model_name: str, bucket_name: str, model_dir: str = None) -> object:
+    def load_model(self, model_name: str, bucket_name: str, model_dir: str = None,
+                   disk_cache: ModelDiskCache = None) -> object:
+        """
+        disk_cache: load from a verified local copy, memory-mapped, downloading
+                    it first (streamed to disk) when this version is not cached
+        """
         try:
             import joblib
             from io import BytesIO
+            from src.entity_component.model_bundle import ModelBundle, MAGIC
 
             model_file = model_name if model_dir is None else f"{model_dir}/{model_name}"
+            if disk_cache is not None:
+                with disk_cache.entry(self.s3_client, bucket_name, model_file) as model_path:
+                    with open(model_path, "rb") as file:
+                        is_bundle = ModelBundle.is_bundle(file.read(len(MAGIC)))
+                    if is_bundle:
+                        return ModelBundle.load(model_path, mmap_mode="r")
+                    return joblib.load(model_path, mmap_mode="r")
+
             file_object = self.get_file_object(model_file, bucket_name)
             model_bytes = self.read_object(file_object, decode=False)  # raw bytes
+            if ModelBundle.is_bundle(model_bytes):
+                # arrays are views of model_bytes, nothing is unpickled
+                return ModelBundle.loads(model_bytes)
             model = joblib.load(BytesIO(model_bytes))  # load from bytes
 
             return model
@@ -162,12 +209,14 @@ class SimpleStorageService:
 
 
 
-    def upload_file(self, from_filename: str, to_filename: str,  bucket_name: str,  remove: bool = True):
+    def upload_file(self, from_filename: str, to_filename: str,  bucket_name: str,  remove: bool = True,
+                    checksum: bool = False):
         """
         Method Name :   upload_file
         Description :   This method uploads the from_filename file to bucket_name bucket with to_filename as bucket filename
+                        checksum: store the SHA-256 of the file in the object metadata, checked by ModelDiskCache
 
-        Output      :   Folder is created in s3 bucket
+        Output      :   Folder is created in s3 bucket; returns the SHA-256 with checksum, else None
         On Failure  :   Write an exception log and then raise an exception
 
         Version     :   1.2
@@ -180,8 +229,12 @@ class SimpleStorageService:
                 f"Uploading {from_filename} file to {to_filename} file in {bucket_name} bucket"
             )
 
+            extra_args, sha256 = None, None
+            if checksum:
+                sha256 = file_sha256(from_filename)
+                extra_args = {"Metadata": {SHA256_METADATA_KEY: sha256}}
             self.s3_resource.meta.client.upload_file(
-                from_filename, bucket_name, to_filename
+                from_filename, bucket_name, to_filename, ExtraArgs=extra_args
             )
 
             logger.info(
@@ -197,6 +250,7 @@ class SimpleStorageService:
                 logger.info(f"Remove is set to {remove}, not deleted the file")
 
             logger.info("Exited the upload_file method of S3Operations class")
+            return sha256
 
         except Exception as e:
             raise MyException(e, sys) from e
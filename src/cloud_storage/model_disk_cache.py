@@ -0,0 +1,296 @@
+import fcntl
+import hashlib
+import os
+import re
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from botocore.exceptions import ClientError
+
+from src.logging_component import logger
+
+
+ENTRY_SUFFIX = ".model"
+LOCK_FILE_NAME = ".lock"
+# user metadata key holding the SHA-256 of an object uploaded by upload_file(checksum=True)
+SHA256_METADATA_KEY = "sha256"
+# multipart part sizes tried when an ETag is "<md5 of part md5s>-<n parts>":
+# boto3 / aws cli default first, then the S3 minimum and other common choices
+MULTIPART_PART_SIZES_MB = (8, 5, 16, 64, 100)
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _multipart_etag(file_path: str, part_size: int) -> str:
+    part_digests = []
+    with open(file_path, "rb") as file:
+        for part in iter(lambda: file.read(part_size), b""):
+            part_digests.append(hashlib.md5(part, usedforsecurity=False).digest())
+    combined = hashlib.md5(b"".join(part_digests), usedforsecurity=False).hexdigest()
+    return f"{combined}-{len(part_digests)}"
+
+
+class ModelDiskCache:
+    """
+    Local copy of S3 model objects, keyed by bucket, key and ETag, shared by
+    every process on the host (evaluation, serving workers, the pusher).
+
+    A miss streams the object in chunks into a temporary file next to the
+    cache, verifies it and renames it into place, so the model is never held
+    in memory as bytes and readers never see a partial file. The object is
+    verified against, in order:
+      - the sha256 user metadata written by upload_file(checksum=True)
+      - the ETag, which is the MD5 of single-part uploads
+      - the ETag of multipart uploads, for the common part sizes
+    Objects none of these apply to (e.g. SSE-KMS encrypted) are only checked
+    for their length and counted as unverified.
+
+    A new ETag is a new entry, so an updated model is downloaded once and the
+    old entry ages out. Entries are evicted least recently used first once
+    they add up to more than max_bytes.
+    """
+
+    _instances: Dict[str, "ModelDiskCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, root_dir: str, max_bytes: int, chunk_size: int = 1024 * 1024):
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        os.makedirs(self.root_dir, exist_ok=True)
+
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.downloaded_bytes = 0
+        self.unverified = 0
+        self.evictions = 0
+        self.last_download_seconds: Optional[float] = None
+
+    @classmethod
+    def get_instance(cls, root_dir: str, max_bytes: int, chunk_size: int = 1024 * 1024) -> "ModelDiskCache":
+        """
+        Returns the cache of root_dir, creating it on first use.
+        """
+        with cls._instances_lock:
+            if root_dir not in cls._instances:
+                cls._instances[root_dir] = cls(root_dir=root_dir, max_bytes=max_bytes, chunk_size=chunk_size)
+            return cls._instances[root_dir]
+
+    def entry_path(self, bucket_name: str, s3_key: str, etag: str) -> str:
+        name = re.sub(r"[^A-Za-z0-9._-]", "_", f"{bucket_name}__{s3_key}__{etag}")
+        return os.path.join(self.root_dir, name + ENTRY_SUFFIX)
+
+    def _count(self, **increments) -> None:
+        with self._stats_lock:
+            for name, value in increments.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def _hit(self, path: str) -> str:
+        # the mtime is the LRU clock; raises FileNotFoundError when path is not cached
+        os.utime(path)
+        self._count(hits=1)
+        return path
+
+    def get(self, s3_client, bucket_name: str, s3_key: str) -> str:
+        """
+        Local path of the current version of s3://bucket_name/s3_key,
+        downloaded first if it is not cached yet.
+        """
+        head = s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+        etag = head["ETag"].strip('"')
+        path = self.entry_path(bucket_name, s3_key, etag)
+        try:
+            return self._hit(path)
+        except FileNotFoundError:
+            pass  # not cached, or evicted by another process just now
+
+        with open(os.path.join(self.root_dir, LOCK_FILE_NAME), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                # another process may have downloaded it while we waited for the lock
+                try:
+                    return self._hit(path)
+                except FileNotFoundError:
+                    pass
+                self._download(s3_client, bucket_name, s3_key, head, path)
+                self._evict(keep=path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        self._count(misses=1)
+        return path
+
+    @contextmanager
+    def entry(self, s3_client, bucket_name: str, s3_key: str) -> Iterator[str]:
+        """
+        get(), with the entry kept on disk until the block exits: eviction takes
+        the cache lock exclusively, the block holds it shared. Open or mmap the
+        file inside the block; a mapping stays valid after it is evicted.
+        """
+        while True:
+            path = self.get(s3_client, bucket_name, s3_key)
+            with open(os.path.join(self.root_dir, LOCK_FILE_NAME), "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_SH)
+                try:
+                    # evicted between get() and the lock: fetch it again
+                    if os.path.exists(path):
+                        yield path
+                        return
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _download(self, s3_client, bucket_name: str, s3_key: str, head: dict, path: str) -> None:
+        etag = head["ETag"].strip('"')
+        temp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        start = time.perf_counter()
+        md5, sha256, size = hashlib.md5(usedforsecurity=False), hashlib.sha256(), 0
+        try:
+            # IfMatch: fails instead of mixing versions if the object is replaced meanwhile
+            body = s3_client.get_object(Bucket=bucket_name, Key=s3_key, IfMatch=head["ETag"])["Body"]
+            with open(temp_path, "wb") as file:
+                for chunk in body.iter_chunks(self.chunk_size):
+                    file.write(chunk)
+                    md5.update(chunk)
+                    sha256.update(chunk)
+                    size += len(chunk)
+
+            if size != head["ContentLength"]:
+                raise ValueError(f"s3://{bucket_name}/{s3_key}: got {size} bytes, expected {head['ContentLength']}")
+            verified_by = self._verify(temp_path, head, etag, md5.hexdigest(), sha256.hexdigest())
+            if verified_by is None:
+                self._count(unverified=1)
+                logger.warning(f"s3://{bucket_name}/{s3_key} ({etag}) has no checksum to verify, only its length")
+
+            os.rename(temp_path, path)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("412", "PreconditionFailed"):
+                raise ValueError(f"s3://{bucket_name}/{s3_key} changed during the download") from e
+            raise
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        elapsed = time.perf_counter() - start
+        with self._stats_lock:
+            self.downloaded_bytes += size
+            self.last_download_seconds = elapsed
+        logger.info(
+            f"Downloaded s3://{bucket_name}/{s3_key} ({etag}, {size / 1e6:.2f} MB) to the model disk cache "
+            f"in {elapsed:.3f}s, verified by {verified_by}"
+        )
+
+    @staticmethod
+    def _verify(file_path: str, head: dict, etag: str, md5: str, sha256: str) -> Optional[str]:
+        """
+        Name of the checksum the download matched, None when there was none to check.
+        Raises ValueError when a checksum does not match.
+        """
+        expected_sha256 = (head.get("Metadata") or {}).get(SHA256_METADATA_KEY)
+        if expected_sha256:
+            if sha256 != expected_sha256:
+                raise ValueError(f"SHA-256 {sha256} does not match the uploaded {expected_sha256}")
+            return "sha256"
+
+        if re.fullmatch(r"[0-9a-f]{32}", etag):
+            if md5 == etag:
+                return "etag-md5"
+            if head.get("ServerSideEncryption") == "aws:kms":
+                return None  # the ETag of SSE-KMS objects is not their MD5
+            raise ValueError(f"MD5 {md5} does not match the ETag {etag}")
+
+        if re.fullmatch(r"[0-9a-f]{32}-\d+", etag):
+            n_parts = int(etag.split("-")[1])
+            for part_size_mb in MULTIPART_PART_SIZES_MB:
+                part_size = part_size_mb * 1024 * 1024
+                if -(-head["ContentLength"] // part_size) == n_parts and _multipart_etag(file_path, part_size) == etag:
+                    return f"etag-multipart-{part_size_mb}mb"
+        return None
+
+    def put(self, s3_client, bucket_name: str, s3_key: str, file_path: str, sha256: str) -> Optional[str]:
+        """
+        Adds a model just uploaded as s3_key with upload_file(checksum=True), so the
+        next load on this host skips the download. It is stored under the ETag the
+        object has now only if the object's SHA-256 metadata is still sha256; when
+        another push landed after ours, nothing is stored and None is returned.
+        """
+        try:
+            head = s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None  # deleted since the upload
+            raise
+        if (head.get("Metadata") or {}).get(SHA256_METADATA_KEY) != sha256:
+            logger.info(f"s3://{bucket_name}/{s3_key} was replaced since the upload, not caching the local file")
+            return None
+
+        path = self.entry_path(bucket_name, s3_key, head["ETag"].strip('"'))
+        with open(os.path.join(self.root_dir, LOCK_FILE_NAME), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if not os.path.exists(path):
+                    temp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+                    shutil.copyfile(file_path, temp_path)
+                    os.rename(temp_path, path)
+                    self._evict(keep=path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return path
+
+    def _entries(self) -> list:
+        """
+        (path, size) of every entry, least recently used first.
+        """
+        entries = []
+        for entry in os.scandir(self.root_dir):
+            if not entry.name.endswith(ENTRY_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # evicted by another process meanwhile
+            entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return [(path, size) for _, path, size in sorted(entries)]
+
+    def _evict(self, keep: str) -> None:
+        """
+        Removes least recently used entries until the cache fits in max_bytes.
+        Called with the lock held. Processes that have an evicted file
+        memory-mapped keep reading it; only the directory entry goes away.
+        """
+        entries = self._entries()
+        total = sum(size for _, size in entries)
+        for path, size in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            os.remove(path)
+            total -= size
+            self._count(evictions=1)
+            logger.info(f"Evicted {os.path.basename(path)} from the model disk cache")
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        with self._stats_lock:
+            return {
+                "root_dir": self.root_dir,
+                "entries": len(entries),
+                "size_bytes": sum(size for _, size in entries),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "downloaded_bytes": self.downloaded_bytes,
+                "unverified": self.unverified,
+                "evictions": self.evictions,
+                "last_download_seconds": self.last_download_seconds,
+            }
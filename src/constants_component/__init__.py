@@ -1,5 +1,6 @@
 from datetime import datetime
-import os 
+import os
+import tempfile
 
 
 # for aws connection
@@ -14,6 +15,10 @@ SCHEMA_FILE_PATH = os.path.join('config','schema.yaml')
 MODEL_SCHEMA_FILE_PATH = os.path.join('config' ,'model.yaml')
 
 
+# typed columnar format for the feature store and the train / test splits: parquet, arrow or csv
+FEATURE_STORE_FORMAT = os.getenv("FEATURE_STORE_FORMAT", "parquet")
+FEATURE_STORE_EXPORT_CSV: bool = os.getenv("FEATURE_STORE_EXPORT_CSV", "false").lower() == "true"
+
 TRAIN_FILE_NAME= 'train.csv'
 TEST_FILE_NAME= 'test.csv'
 PREPROCSSING_OBJECT_FILE_NAME = "preprocessing.pkl"
@@ -26,15 +31,19 @@ MODEL_FILE_NAME = "model.pkl"
 # for mongo db related
 DATABASE_NAME = 'laptop_price_dataset_DB'
 COLLECTION_NAME= 'laptop_price_dataset'
+MONGO_FETCH_BATCH_SIZE: int = int(os.getenv("MONGO_FETCH_BATCH_SIZE", 5000))  # documents per cursor batch / DataFrame chunk
 
 
 # data ingestion related constants
 
 DATA_INGESTION_DIR_NAME = 'data_ingestion'
 DATA_INGESTION_FEATURE_STORE = 'feature_store' # here raw data will be save that will come from the Databse
+DATA_INGESTION_FEATURE_STORE_FILE_NAME = f'laptop.{FEATURE_STORE_FORMAT}' # with parquet, a directory of part files
+DATA_INGESTION_WATERMARK_FILE_NAME = 'watermark.yaml' # last ingested Mongo _id, so retrains only fetch newer documents
+DATA_INGESTION_INCREMENTAL: bool = os.getenv("DATA_INGESTION_INCREMENTAL", "true").lower() == "true"
 DATA_INGESTION_INGESTED_DIR_NAME = 'ingestion'
-TRAINING_FILE_PATH_NAME = 'train.csv'
-TEST_FILE_PATH_NAME  = 'test.csv'
+TRAINING_FILE_PATH_NAME = f'train.{FEATURE_STORE_FORMAT}'
+TEST_FILE_PATH_NAME  = f'test.{FEATURE_STORE_FORMAT}'
 TRAIN_TEST_SPLIT_RATIO = 0.2
 
 
@@ -62,6 +71,21 @@ MODEL_TRAINER_TRAINED_MODEL_DIR: str = "trained_model"
 MODEL_TRAINER_TRAINED_MODEL_NAME: str = "model.pkl"
 EXPECTED_SCORE: float = 0.6
 MODEL_TRAINER_MODEL_CONFIG_FILE_PATH: str = os.path.join("config", "model.yaml")
+MODEL_TRAINER_SEARCH_LOG_FILE_NAME: str = "search_log.csv"
+MODEL_TRAINER_LEADERBOARD_FILE_NAME: str = "leaderboard.csv"
+
+
+# training pipeline stage cache: stages whose inputs, configs and code are unchanged are reused
+STAGE_CACHE_DIR_NAME: str = "stage_cache"
+STAGE_CACHE_ENABLED: bool = os.getenv("STAGE_CACHE_ENABLED", "true").lower() == "true"
+# entries kept per stage, least recently used ones are deleted beyond that
+STAGE_CACHE_MAX_ENTRIES_PER_STAGE: int = int(os.getenv("STAGE_CACHE_MAX_ENTRIES_PER_STAGE", 5))
+
+# per run record of completed stage artifacts, used to resume a failed run
+RUN_MANIFEST_FILE_NAME: str = "run_manifest.yaml"
+
+# training pipeline stages that may run at the same time (1 runs them sequentially)
+PIPELINE_MAX_WORKERS: int = int(os.getenv("PIPELINE_MAX_WORKERS", 4))
 
 
 
@@ -76,7 +100,46 @@ MODEL EVALUATION related constant
 MODEL_EVALUATION_CHANGED_THRESHOLD_SCORE: float = 0.2
 MODEL_BUCKET_NAME = "laptop-model2026"
 MODEL_PUSHER_S3_KEY = "model-registry"
+# verified local copies of downloaded models, keyed by bucket / key / ETag and shared
+# by evaluation, serving and the pusher on one host; least recently used evicted first
+MODEL_DISK_CACHE_ENABLED: bool = os.getenv("MODEL_DISK_CACHE_ENABLED", "true").lower() == "true"
+MODEL_DISK_CACHE_DIR: str = os.getenv(
+    "MODEL_DISK_CACHE_DIR", os.path.join(tempfile.gettempdir(), "laptop-price-model-cache")
+)
+MODEL_DISK_CACHE_MAX_MB: float = float(os.getenv("MODEL_DISK_CACHE_MAX_MB", 1024))
+MODEL_DOWNLOAD_CHUNK_BYTES: int = int(os.getenv("MODEL_DOWNLOAD_CHUNK_BYTES", 1024 * 1024))
+
+
+"""
+Serving related constants
+"""
+MODEL_RELOAD_INTERVAL_SECONDS: float = float(os.getenv("MODEL_RELOAD_INTERVAL_SECONDS", 60))
+PREDICTION_MAX_BATCH_SIZE: int = int(os.getenv("PREDICTION_MAX_BATCH_SIZE", 10000))
+FEATURE_CACHE_SIZE: int = int(os.getenv("FEATURE_CACHE_SIZE", 4096))
+PREDICTION_CACHE_SIZE: int = int(os.getenv("PREDICTION_CACHE_SIZE", 10000))  # 0 disables the cache
+PREDICTION_CACHE_TTL_SECONDS: float = float(os.getenv("PREDICTION_CACHE_TTL_SECONDS", 3600))
+# n_jobs of the served model; one core per request, concurrency comes from serving requests in parallel
+SERVING_N_JOBS: int = int(os.getenv("SERVING_N_JOBS", 1))
+# requests up to this many rows use the flat tree engine when the model has one (0 disables it)
+FLAT_FOREST_MAX_ROWS: int = int(os.getenv("FLAT_FOREST_MAX_ROWS", 256))
+# bounded pool the request handlers run predictions on; requests beyond
+# workers + queue size get a 503 with Retry-After
+PREDICTION_WORKERS: int = int(os.getenv("PREDICTION_WORKERS", os.cpu_count() or 1))
+PREDICTION_QUEUE_SIZE: int = int(os.getenv("PREDICTION_QUEUE_SIZE", 64))
+PREDICTION_RETRY_AFTER_SECONDS: int = int(os.getenv("PREDICTION_RETRY_AFTER_SECONDS", 1))  # minimum
+# opt-in coalescing of concurrent single-row /predict requests into one model call,
+# flushed at BATCH_MAX_ROWS rows or after BATCH_MAX_DELAY_MS, whichever comes first
+PREDICTION_BATCHING_ENABLED: bool = os.getenv("PREDICTION_BATCHING_ENABLED", "false").lower() == "true"
+PREDICTION_BATCH_MAX_ROWS: int = int(os.getenv("PREDICTION_BATCH_MAX_ROWS", 32))
+PREDICTION_BATCH_MAX_DELAY_MS: float = float(os.getenv("PREDICTION_BATCH_MAX_DELAY_MS", 5))
 
 
 APP_HOST = "0.0.0.0"
-APP_PORT = 8080
\ No newline at end of file
+APP_PORT = 8080
+# uvicorn worker processes; with more than one, the workers share the model
+# through memory-mapped files in MODEL_SHARED_DIR instead of each loading a copy
+APP_WORKERS: int = int(os.getenv("APP_WORKERS", 1))
+MODEL_SHARED_STORE_ENABLED: bool = os.getenv(
+    "MODEL_SHARED_STORE_ENABLED", "true" if APP_WORKERS > 1 else "false"
+).lower() == "true"
+MODEL_SHARED_DIR: str = os.getenv("MODEL_SHARED_DIR", os.path.join(tempfile.gettempdir(), "laptop-price-model"))
\ No newline at end of file
@@ -2,6 +2,8 @@ from src.configuration_component.mongodb_connection import MongoDB_Client
 from src.logging_component import logger
 from src.exception_component import MyException
 from src.constants_component import *
+from typing import Iterator, Optional
+from bson import ObjectId
 import pandas as pd
 
 class GetData:
@@ -9,11 +11,19 @@ class GetData:
     Class to fetch data from MongoDB and return it as a pandas DataFrame.
     """
 
+    # fields stored in the collection that the pipeline never uses;
+    # excluded server side so they are not sent over the wire
+    EXCLUDED_FIELDS = ['_id', 'Unnamed: 0']
 
-    def __init__(self):
+
+    def __init__(self, mongo_client=None):
+        """
+        :param mongo_client: optional pymongo-compatible client (e.g. mongomock), defaults to the shared MongoDB_Client
+        """
         try:
-            mongo_db_instance = MongoDB_Client()
-            self.mongo_db_client = mongo_db_instance.client
+            if mongo_client is None:
+                mongo_client = MongoDB_Client().client
+            self.mongo_db_client = mongo_client
             logger.info("MongoDB client initialized successfully.")
         except Exception as e:
             logger.error("MongoDB connection could not be established.")
@@ -23,29 +33,79 @@ class GetData:
 
 
 
-    def get_data_in_correct_form(self, database_name=DATABASE_NAME, collection_name=COLLECTION_NAME):
+    def iter_data_chunks(self, database_name=DATABASE_NAME, collection_name=COLLECTION_NAME,
+                         chunk_size: int = MONGO_FETCH_BATCH_SIZE, query: Optional[dict] = None,
+                         after_id: Optional[str] = None, include_id: bool = False) -> Iterator[pd.DataFrame]:
         """
-        Fetches data from the given MongoDB collection and returns it as a DataFrame.
-        Drops the 'Unnamed: 0' column if it exists.
+        Streams the collection as DataFrames of at most chunk_size rows.
+        Documents are read through a server-side cursor and appended column by column,
+        so peak memory grows with chunk_size, not with the size of the collection.
+
+        after_id: only fetch documents whose _id is greater than this ObjectId (incremental reads);
+                  documents are then returned in _id order
+        include_id: keep the _id column (as a string) so callers can track a watermark
         """
         try:
-            logger.info(f"Fetching data from database '{database_name}', collection '{collection_name}'...")
+            logger.info(f"Streaming data from database '{database_name}', collection '{collection_name}' "
+                        f"in chunks of {chunk_size}...")
             collection = self.mongo_db_client[database_name][collection_name]
-            df = pd.DataFrame(list(collection.find()))
+            excluded = [field for field in self.EXCLUDED_FIELDS if not (include_id and field == '_id')]
+            projection = {field: 0 for field in excluded}
+
+            query = dict(query or {})
+            if after_id is not None:
+                query['_id'] = {'$gt': ObjectId(after_id)}
+
+            cursor = collection.find(query, projection=projection, batch_size=chunk_size)
+            if after_id is not None or include_id:
+                cursor = cursor.sort('_id', 1)
+
+            columns = {}
+            rows = 0
+            for document in cursor:
+                for key, value in document.items():
+                    if key == '_id':
+                        value = str(value)
+                    if key not in columns:
+                        # column first seen mid-chunk, earlier rows did not have it
+                        columns[key] = [None] * rows
+                    columns[key].append(value)
+                rows += 1
+                for values in columns.values():
+                    if len(values) < rows:
+                        values.append(None)
+
+                if rows == chunk_size:
+                    yield pd.DataFrame(columns)
+                    columns, rows = {}, 0
+
+            if rows:
+                yield pd.DataFrame(columns)
+
+        except Exception as e:
+            logger.error(f"Error occurred while streaming data from database '{database_name}', collection '{collection_name}'.")
+            raise MyException("Data streaming failed", e)
 
-            # Drop 'Unnamed: 0' column if it exists
-            logger.debug(f'these are the columns : {df.columns}')
-            if 'Unnamed: 0' in df.columns:
-                df.drop(columns='Unnamed: 0', inplace=True)
 
-            if '_id' in df.columns:
-                df.drop(columns='_id' , inplace=True)  
 
 
-            logger.debug(f'these are the columns after dropping : {df.columns}')    
+
+    def get_data_in_correct_form(self, database_name=DATABASE_NAME, collection_name=COLLECTION_NAME,
+                                 chunk_size: int = MONGO_FETCH_BATCH_SIZE):
+        """
+        Fetches data from the given MongoDB collection and returns it as a DataFrame.
+        '_id' and 'Unnamed: 0' are excluded by the query projection.
+        """
+        try:
+            logger.info(f"Fetching data from database '{database_name}', collection '{collection_name}'...")
+            chunks = list(self.iter_data_chunks(database_name, collection_name, chunk_size=chunk_size))
+            df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+            # in case the server returned them despite the projection
+            logger.debug(f'these are the columns : {df.columns}')
+            df = df.drop(columns=[col for col in self.EXCLUDED_FIELDS if col in df.columns])
 
 
- 
             logger.info(f"Data fetched successfully. Number of records: {len(df)}")
             return df
 
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -39,6 +40,8 @@ class RegressionMetricArtifact:
 class ModelTrainerArtifact:
     trained_model_file_path:str 
     metric_artifact:RegressionMetricArtifact
+    search_log_file_path:Optional[str] = None
+    leaderboard_file_path:Optional[str] = None
 
 
 
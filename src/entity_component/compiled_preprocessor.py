@@ -0,0 +1,200 @@
+from typing import List, Optional
+
+import numpy as np
+from pandas import DataFrame
+from scipy import sparse
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler, OneHotEncoder
+
+from src.Data_transformation_component import DataTransformation
+from src.Data_transformation_component.FeatureEngineeringModule import FeatureEngineering
+
+
+def _single_step(transformer):
+    """
+    The estimator behind a one-step Pipeline, or the transformer itself.
+    """
+    if isinstance(transformer, Pipeline):
+        if len(transformer.steps) != 1:
+            raise ValueError(f"Cannot compile a {len(transformer.steps)}-step pipeline")
+        return transformer.steps[0][1]
+    return transformer
+
+
+class CompiledPreprocessor:
+    """
+    The fitted preprocessing ColumnTransformer (StandardScaler on the numerical
+    features, OneHotEncoder on the categorical ones) reduced to plain arrays:
+    the scaler means / scales and one {category: output position} dict per
+    categorical feature.
+
+    transform_record() maps one raw record straight into the model input row,
+    with no DataFrame, column reordering or ColumnTransformer dispatch in between;
+    transform() does the same for a whole engineered frame.
+    The arithmetic is the one sklearn does, so the output is identical.
+
+    state() / from_state() turn it into plain JSON values plus the mean / scale
+    arrays, which is how a ModelBundle stores it.
+    """
+
+    def __init__(self, preprocessing_object: ColumnTransformer):
+        if not isinstance(preprocessing_object, ColumnTransformer):
+            raise ValueError(f"Cannot compile {type(preprocessing_object).__name__}, expected a ColumnTransformer")
+
+        self.numerical_features: List[str] = []
+        self.numerical_offset = 0
+        self.categorical_features: List[str] = []
+        self.mean: Optional[np.ndarray] = None
+        self.scale: Optional[np.ndarray] = None
+        self.categories: List[list] = []
+        self.category_offsets: List[int] = []
+        self.handle_unknown_error: List[bool] = []
+
+        n_outputs = 0
+        for name, transformer, columns in preprocessing_object.transformers_:
+            if transformer == "drop" or len(columns) == 0:
+                continue
+            step = _single_step(transformer)
+
+            if isinstance(step, StandardScaler):
+                if self.numerical_features:
+                    raise ValueError("Cannot compile more than one scaler")
+                self.numerical_offset = n_outputs
+                self.numerical_features = list(columns)
+                self.mean = step.mean_ if step.with_mean else None
+                self.scale = step.scale_ if step.with_std else None
+                n_outputs += len(columns)
+
+            elif isinstance(step, OneHotEncoder):
+                if step.drop_idx_ is not None or getattr(step, "infrequent_categories_", None) is not None:
+                    raise ValueError("Cannot compile a OneHotEncoder with dropped or infrequent categories")
+                for column, categories in zip(columns, step.categories_):
+                    self.categorical_features.append(column)
+                    self.categories.append(categories.tolist())
+                    self.category_offsets.append(n_outputs)
+                    self.handle_unknown_error.append(step.handle_unknown == "error")
+                    n_outputs += len(categories)
+
+            else:
+                raise ValueError(f"Cannot compile transformer {name} ({type(step).__name__})")
+
+        self.n_outputs = n_outputs
+        self.sparse_output = bool(getattr(preprocessing_object, "sparse_output_", False))
+
+        # columns the prediction feature engineering does not produce are filled
+        # exactly like ModelPredictor.prepare_features does
+        engineered = set(DataTransformation.schema["columns_after_transformation_for_prediction"])
+        self.fill_values = {
+            column: ("unknown" if column in self.categorical_features else 0)
+            for column in self.numerical_features + self.categorical_features
+            if column not in engineered
+        }
+        self._build_lookups()
+
+    def _build_lookups(self) -> None:
+        # {category: output position} per categorical feature
+        self.category_positions = [
+            {category: offset + i for i, category in enumerate(categories)}
+            for categories, offset in zip(self.categories, self.category_offsets)
+        ]
+        # zero row every request starts from (copied, never written)
+        self._empty_row = np.zeros((1, self.n_outputs))
+
+    def state(self) -> dict:
+        """
+        Everything but the mean / scale arrays, as JSON-serializable values.
+        """
+        return {
+            "numerical_features": self.numerical_features,
+            "numerical_offset": self.numerical_offset,
+            "categorical_features": self.categorical_features,
+            "categories": self.categories,
+            "category_offsets": self.category_offsets,
+            "handle_unknown_error": self.handle_unknown_error,
+            "n_outputs": self.n_outputs,
+            "sparse_output": self.sparse_output,
+            "fill_values": self.fill_values,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict, mean: Optional[np.ndarray], scale: Optional[np.ndarray]) -> "CompiledPreprocessor":
+        compiled = cls.__new__(cls)
+        for key in ("numerical_features", "numerical_offset", "categorical_features", "categories",
+                    "category_offsets", "handle_unknown_error", "n_outputs", "sparse_output", "fill_values"):
+            setattr(compiled, key, state[key])
+        compiled.mean = mean
+        compiled.scale = scale
+        compiled._build_lookups()
+        return compiled
+
+    def features_of(self, record) -> tuple:
+        """
+        Engineered feature values of one raw record, numerical then categorical.
+        """
+        engineered = FeatureEngineering.transform_record(record)
+        engineered.update(self.fill_values)
+        return tuple(engineered[column] for column in self.numerical_features + self.categorical_features)
+
+    def transform_features(self, features: tuple) -> np.ndarray:
+        """
+        (1, n_outputs) float64 row for the values returned by features_of.
+        """
+        row = self._empty_row.copy()
+        n_numerical = len(self.numerical_features)
+
+        numerical = np.array(features[:n_numerical], dtype=np.float64)
+        if self.mean is not None:
+            numerical -= self.mean
+        if self.scale is not None:
+            numerical /= self.scale
+        row[0, self.numerical_offset:self.numerical_offset + n_numerical] = numerical
+
+        for value, positions, error, column in zip(features[n_numerical:], self.category_positions,
+                                                   self.handle_unknown_error, self.categorical_features):
+            position = positions.get(value)
+            if position is not None:
+                row[0, position] = 1.0
+            elif error:
+                raise ValueError(f"Found unknown category {value!r} in column {column} during transform")
+        return row
+
+    def transform(self, features: DataFrame):
+        """
+        Model input for an engineered frame (ModelPredictor.prepare_features),
+        the same as ColumnTransformer.transform gives.
+        """
+        rows = np.zeros((len(features), self.n_outputs))
+
+        numerical = features[self.numerical_features].to_numpy(dtype=np.float64)
+        if self.mean is not None:
+            numerical -= self.mean
+        if self.scale is not None:
+            numerical /= self.scale
+        rows[:, self.numerical_offset:self.numerical_offset + numerical.shape[1]] = numerical
+
+        for column, positions, error in zip(self.categorical_features, self.category_positions,
+                                            self.handle_unknown_error):
+            mapped = features[column].map(positions)
+            known = mapped.notna().to_numpy()
+            if error and not known.all():
+                unknown = features[column][~known].unique().tolist()
+                raise ValueError(f"Found unknown categories {unknown} in column {column} during transform")
+            rows[np.flatnonzero(known), mapped[known].to_numpy(dtype=np.int64)] = 1.0
+
+        return self.to_model_input(rows)
+
+    def transform_record(self, record) -> np.ndarray:
+        return self.transform_features(self.features_of(record))
+
+    def to_model_input(self, row: np.ndarray):
+        """
+        The row in the format ColumnTransformer.transform would have returned it.
+        """
+        return sparse.csr_matrix(row) if self.sparse_output else row
+
+    def __repr__(self):
+        return (
+            f"CompiledPreprocessor(numerical={len(self.numerical_features)}, "
+            f"categorical={len(self.categorical_features)}, n_outputs={self.n_outputs})"
+        )
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
+from typing import Optional
 from src.constants_component import *
 import os
 
@@ -12,6 +13,29 @@ class Pipeline:
 pipeline = Pipeline()
 
 
+def for_run(config, run_id: str):
+    """
+    Copy of a stage config whose paths point into artifact/<run_id> instead of
+    the directory of the run started at import time (used to resume a run).
+    """
+    current_run_dir = os.path.join(pipeline.artifact_dir, pipeline.current_date_time)
+    run_dir = os.path.join(pipeline.artifact_dir, run_id)
+
+    changes = {}
+    for field in fields(config):
+        value = getattr(config, field.name)
+        if isinstance(value, str) and (value == current_run_dir or value.startswith(current_run_dir + os.sep)):
+            changes[field.name] = run_dir + value[len(current_run_dir):]
+    return replace(config, **changes)
+
+
+@dataclass
+class StageCacheConfig:
+    cache_dir: str = os.path.join(pipeline.artifact_dir, STAGE_CACHE_DIR_NAME)
+    enabled: bool = STAGE_CACHE_ENABLED
+    max_entries_per_stage: int = STAGE_CACHE_MAX_ENTRIES_PER_STAGE
+
+
 # --------------------- DATA INGESTION --------------------- #
 @dataclass
 class DataIngestionConfig:
@@ -22,16 +46,25 @@ class DataIngestionConfig:
         DATA_INGESTION_DIR_NAME
     )
 
+    # the feature store lives outside the timestamped run directory:
+    # each run appends the documents added since the last one and reuses the rest
     data_ingestion_feature_store_dir: str = os.path.join(
-        data_ingestion_dir_name,
+        pipeline.artifact_dir,
         DATA_INGESTION_FEATURE_STORE
     )
 
     data_ingestion_feature_store_file: str = os.path.join(
         data_ingestion_feature_store_dir,
-        "laptop.csv"
+        DATA_INGESTION_FEATURE_STORE_FILE_NAME
+    )
+
+    data_ingestion_watermark_file: str = os.path.join(
+        data_ingestion_feature_store_dir,
+        DATA_INGESTION_WATERMARK_FILE_NAME
     )
 
+    incremental_ingestion: bool = DATA_INGESTION_INCREMENTAL
+
     training_file_path: str = os.path.join(
         data_ingestion_dir_name,
         DATA_INGESTION_INGESTED_DIR_NAME,
@@ -45,6 +78,7 @@ class DataIngestionConfig:
     )
 
     train_test_split_ratio: float = TRAIN_TEST_SPLIT_RATIO
+    export_csv: bool = FEATURE_STORE_EXPORT_CSV
 
 
 # --------------------- DATA VALIDATION --------------------- #
@@ -100,6 +134,8 @@ class ModelTrainerConfig:
         MODEL_TRAINER_DIR_NAME
     )
     trained_model_file_path: str = os.path.join(model_trainer_dir, MODEL_TRAINER_TRAINED_MODEL_DIR, MODEL_FILE_NAME)
+    search_log_file_path: str = os.path.join(model_trainer_dir, MODEL_TRAINER_SEARCH_LOG_FILE_NAME)
+    leaderboard_file_path: str = os.path.join(model_trainer_dir, MODEL_TRAINER_LEADERBOARD_FILE_NAME)
     expected_r2_score: float = EXPECTED_SCORE
     model_config_file_path: str = MODEL_TRAINER_MODEL_CONFIG_FILE_PATH
 
@@ -129,3 +165,16 @@ class ModelPusherConfig:
 class LaptopPricePredictorConfig:
     model_file_path: str = MODEL_FILE_NAME
     model_bucket_name: str = MODEL_BUCKET_NAME
+    model_reload_interval_seconds: float = MODEL_RELOAD_INTERVAL_SECONDS
+    max_batch_size: int = PREDICTION_MAX_BATCH_SIZE
+    prediction_cache_size: int = PREDICTION_CACHE_SIZE
+    prediction_cache_ttl_seconds: float = PREDICTION_CACHE_TTL_SECONDS
+    n_jobs: int = SERVING_N_JOBS
+    prediction_workers: int = PREDICTION_WORKERS
+    prediction_queue_size: int = PREDICTION_QUEUE_SIZE
+    retry_after_seconds: int = PREDICTION_RETRY_AFTER_SECONDS
+    batching_enabled: bool = PREDICTION_BATCHING_ENABLED
+    batch_max_rows: int = PREDICTION_BATCH_MAX_ROWS
+    batch_max_delay_ms: float = PREDICTION_BATCH_MAX_DELAY_MS
+    # None: every process loads its own copy of the model
+    shared_model_dir: Optional[str] = MODEL_SHARED_DIR if MODEL_SHARED_STORE_ENABLED else None
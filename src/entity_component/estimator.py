@@ -4,6 +4,8 @@ from sklearn.pipeline import Pipeline
 from src.exception_component import MyException
 import sys
 from src.Data_transformation_component import DataTransformation
+from src.entity_component.compiled_preprocessor import CompiledPreprocessor
+from src.constants_component import FLAT_FOREST_MAX_ROWS
 import numpy as np
 
 class ModelPredictor:
@@ -15,17 +17,53 @@ class ModelPredictor:
         """
         :param preprocessing_object: Preprocessing pipeline (sklearn Pipeline / ColumnTransformer)
         :param trained_model_object: Trained ML model (XGBoost, RandomForest, etc.)
+
+        A model loaded from a ModelBundle has neither: it predicts with its
+        compiled_preprocessor and flat_model only.
         """
         self.preprocessing_object = preprocessing_object
         self.trained_model_object = trained_model_object
+        # optional FlatForest export of trained_model_object, set by ModelTrainer
+        self.flat_model = None
+        # request-time preprocessing, built by compile() when the model is loaded for serving
+        self.compiled_preprocessor = None
 
-    def predict(self, dataframe: DataFrame) -> np.ndarray:
+    def set_n_jobs(self, n_jobs) -> "ModelPredictor":
         """
-        Predict using the trained model and preprocessing pipeline.
-        Handles missing columns in prediction data.
+        Sets the number of cores the trained model predicts with, if it supports
+        n_jobs (thread_count for CatBoost).
         """
-        logger.info(f"Entered predict method of {self.__class__.__name__}")
+        if n_jobs is None or not hasattr(self.trained_model_object, "get_params"):
+            return self
+
+        params = self.trained_model_object.get_params()
+        if "n_jobs" in params:
+            self.trained_model_object.set_params(n_jobs=n_jobs)
+        elif "thread_count" in params:
+            self.trained_model_object.set_params(thread_count=n_jobs)
+        return self
 
+    def compile(self) -> "ModelPredictor":
+        """
+        Builds the CompiledPreprocessor used by predict_record.
+        Preprocessing objects it cannot reproduce keep the DataFrame path.
+        """
+        if self.preprocessing_object is None:
+            return self  # loaded from a bundle, compiled already
+        try:
+            self.compiled_preprocessor = CompiledPreprocessor(self.preprocessing_object)
+            logger.info(f"Compiled preprocessing: {self.compiled_preprocessor}")
+        except ValueError as e:
+            self.compiled_preprocessor = None
+            logger.warning(f"Preprocessing not compiled, using the DataFrame path: {e}")
+        return self
+
+    def prepare_features(self, dataframe: DataFrame) -> DataFrame:
+        """
+        Feature engineering plus column alignment.
+        Returns the engineered frame, in training column order, that the
+        preprocessing object expects.
+        """
         try:
             # -----------------------------
             # Feature engineering
@@ -51,24 +89,108 @@ class ModelPredictor:
                         dataframe[col] = 0
 
             # Reorder columns exactly as in training
-            dataframe = dataframe[required_columns]
+            return dataframe[required_columns]
+
+        except Exception as e:
+            logger.error(f"Feature preparation failed: {e}")
+            raise MyException(e, sys) from e
 
+    def predict_features(self, features: DataFrame) -> np.ndarray:
+        """
+        Preprocess already engineered features and predict prices.
+        """
+        try:
             # -----------------------------
             # Preprocessing
             # -----------------------------
             logger.info("Applying preprocessing transformations")
-            transformed_features = self.preprocessing_object.transform(dataframe)
+            if self.preprocessing_object is None:
+                transformed_features = self.compiled_preprocessor.transform(features)
+            else:
+                transformed_features = self.preprocessing_object.transform(features)
+
+            return self.predict_transformed(transformed_features)
+
+        except Exception as e:
+            logger.error(f"Prediction failed: {e}")
+            raise MyException(e, sys) from e
 
+    def predict_transformed(self, transformed_features) -> np.ndarray:
+        """
+        Predict prices from preprocessed model input.
+        """
+        try:
             # -----------------------------
             # Prediction
             # -----------------------------
             logger.info("Generating predictions from the trained model")
-            predictions = self.trained_model_object.predict(transformed_features)
+            # small batches go through the flat engine; the sklearn estimator wins on large ones.
+            # Bundle models have no estimator, so they take the (slower) flat engine for large ones too
+            flat_model = getattr(self, "flat_model", None)  # models pickled before it existed
+            if flat_model is not None and (
+                transformed_features.shape[0] <= FLAT_FOREST_MAX_ROWS or self.trained_model_object is None
+            ):
+                predictions = flat_model.predict(transformed_features)
+            else:
+                predictions = self.trained_model_object.predict(transformed_features)
 
             # -----------------------------
             # Reverse log transform
             # -----------------------------
-            predictions = np.exp(predictions)
+            return np.exp(predictions)
+
+        except Exception as e:
+            logger.error(f"Prediction failed: {e}")
+            raise MyException(e, sys) from e
+
+    def predict_record(self, record) -> float:
+        """
+        Price of a single raw record (e.g. LaptopData) through the compiled
+        preprocessing; falls back to predict() when it was not compiled.
+        """
+        try:
+            compiled = getattr(self, "compiled_preprocessor", None)  # models pickled before it existed
+            if compiled is None:
+                return float(self.predict(record.get_input_data_frame())[0])
+            return self.predict_compiled_features(compiled.features_of(record))
+
+        except Exception as e:
+            logger.error(f"Prediction failed: {e}")
+            raise MyException(e, sys) from e
+
+    def predict_compiled_features(self, features: tuple) -> float:
+        """
+        Price for the engineered values returned by CompiledPreprocessor.features_of.
+        """
+        return float(self.predict_compiled_batch([features])[0])
+
+    def predict_compiled_batch(self, features_list: list) -> np.ndarray:
+        """
+        Prices for many CompiledPreprocessor.features_of tuples, stacked into
+        one model input matrix and scored with a single model call.
+        """
+        try:
+            compiled = self.compiled_preprocessor
+            rows = np.vstack([compiled.transform_features(features) for features in features_list])
+            # the flat engine takes the dense rows as they are
+            flat_model = getattr(self, "flat_model", None)
+            if flat_model is not None and len(rows) <= FLAT_FOREST_MAX_ROWS:
+                return self.predict_transformed(rows)
+            return self.predict_transformed(compiled.to_model_input(rows))
+
+        except Exception as e:
+            logger.error(f"Prediction failed: {e}")
+            raise MyException(e, sys) from e
+
+    def predict(self, dataframe: DataFrame) -> np.ndarray:
+        """
+        Predict using the trained model and preprocessing pipeline.
+        Handles missing columns in prediction data.
+        """
+        logger.info(f"Entered predict method of {self.__class__.__name__}")
+
+        try:
+            predictions = self.predict_features(self.prepare_features(dataframe))
 
             logger.info("Successfully completed prediction")
             return predictions
@@ -77,8 +199,15 @@ class ModelPredictor:
             logger.error(f"Prediction failed: {e}")
             raise MyException(e, sys) from e
 
+    @property
+    def model_name(self) -> str:
+        flat_model = getattr(self, "flat_model", None)
+        if self.trained_model_object is None and flat_model is not None:
+            return repr(flat_model)
+        return type(self.trained_model_object).__name__
+
     def __repr__(self):
-        return f"ModelPredictor(model={type(self.trained_model_object).__name__})"
+        return f"ModelPredictor(model={self.model_name})"
 
     def __str__(self):
-        return f"Generic Predictor for {type(self.trained_model_object).__name__}"
+        return f"Generic Predictor for {self.model_name}"
@@ -0,0 +1,109 @@
+import numpy as np
+from sklearn.tree import DecisionTreeRegressor
+from sklearn.ensemble import RandomForestRegressor, ExtraTreesRegressor
+
+
+class FlatForest:
+    """
+    Tree ensemble flattened into contiguous NumPy node arrays
+    (feature, threshold, left / right child, leaf value) for every tree at once.
+
+    predict() walks all trees of all rows together, one tree level per step,
+    with plain array indexing. There is no input validation, joblib dispatch
+    or per-tree Python call, which is what dominates sklearn's predict for a
+    single row. Results are the same as the sklearn estimator: features are
+    compared in float32 like sklearn does, and trees are summed in the same order.
+    """
+
+    SUPPORTED_MODELS = (RandomForestRegressor, ExtraTreesRegressor, DecisionTreeRegressor)
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, left: np.ndarray, right: np.ndarray,
+                 value: np.ndarray, roots: np.ndarray, max_depth: int, n_features: int):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.n_features = n_features
+
+    @classmethod
+    def supports(cls, model) -> bool:
+        return isinstance(model, cls.SUPPORTED_MODELS) and getattr(model, "n_outputs_", 1) == 1
+
+    @classmethod
+    def from_estimator(cls, model) -> "FlatForest":
+        if not cls.supports(model):
+            raise ValueError(f"Cannot flatten {type(model).__name__}")
+
+        trees = model.estimators_ if hasattr(model, "estimators_") else [model]
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset, max_depth = 0, 0
+
+        for estimator in trees:
+            tree = estimator.tree_
+            node_ids = np.arange(tree.node_count, dtype=np.int64)
+            is_leaf = tree.children_left == -1
+
+            # leaves point at themselves, so extra steps past a leaf are no-ops
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.int64))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left) + offset)
+            rights.append(np.where(is_leaf, node_ids, tree.children_right) + offset)
+            values.append(tree.value[:, 0, 0].astype(np.float64))
+            roots.append(offset)
+
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+
+        return cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts),
+            right=np.concatenate(rights),
+            value=np.concatenate(values),
+            roots=np.asarray(roots, dtype=np.int64),
+            max_depth=max_depth,
+            n_features=model.n_features_in_,
+        )
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    def leaf_values(self, X) -> np.ndarray:
+        """
+        (n_rows, n_trees) matrix of the leaf value each tree gives each row.
+        """
+        if hasattr(X, "toarray"):
+            X = X.toarray()
+        # sklearn trees compare float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Expected input with {self.n_features} features, got shape {X.shape}")
+
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], self.n_trees))
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.value[nodes]
+
+    def predict(self, X) -> np.ndarray:
+        leaf_values = self.leaf_values(X)
+        if self.n_trees == 1:
+            return leaf_values[:, 0]
+
+        # accumulate tree by tree, in order, like RandomForestRegressor.predict
+        total = np.zeros(leaf_values.shape[0])
+        for tree in range(self.n_trees):
+            total += leaf_values[:, tree]
+        return total / self.n_trees
+
+    def __repr__(self):
+        return f"FlatForest(n_trees={self.n_trees}, n_nodes={self.n_nodes}, max_depth={self.max_depth})"
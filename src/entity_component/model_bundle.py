@@ -0,0 +1,275 @@
+import json
+import mmap
+import struct
+import zlib
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src.entity_component.compiled_preprocessor import CompiledPreprocessor
+from src.entity_component.estimator import ModelPredictor
+from src.entity_component.flat_forest import FlatForest
+
+
+MAGIC = b"LPBUNDLE"
+FORMAT_VERSION = 1
+# magic, format version, manifest length
+HEADER = struct.Struct("<8sIQ")
+# every array starts on a 64 byte boundary, so frombuffer views are aligned
+ALIGNMENT = 64
+COMPRESSIONS = (None, "zlib")
+# the only dtypes a bundle may contain: plain little-endian numbers, never objects
+ALLOWED_DTYPES = ("<i4", "<i8", "<f8")
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _forest_depth(left: np.ndarray, right: np.ndarray, roots: np.ndarray) -> int:
+    """
+    Depth of the deepest leaf below roots; leaves are the nodes whose children point at themselves.
+    Raises ValueError when the child links contain a cycle.
+    """
+    node_ids = np.arange(len(left))
+    is_leaf = (left == node_ids) & (right == node_ids)
+    nodes, depth = np.unique(roots), 0
+    while True:
+        nodes = nodes[~is_leaf[nodes]]
+        if nodes.size == 0:
+            return depth
+        if depth >= len(left):
+            raise ValueError("Model bundle trees contain a cycle")
+        nodes = np.unique(np.concatenate([left[nodes], right[nodes]]))
+        depth += 1
+
+
+class ModelBundle:
+    """
+    Self-contained serving format for a ModelPredictor whose model has a
+    FlatForest export: a JSON manifest followed by raw NumPy arrays.
+
+        header    b"LPBUNDLE", format version (uint32), manifest length (uint64)
+        manifest  JSON: model and preprocessing metadata (feature names, one-hot
+                  vocabularies, ...) and, per array, dtype / shape / offset / size
+        arrays    tree node arrays (feature, threshold, left, right, value, roots)
+                  and scaler mean / scale, each 64-byte aligned
+
+    Loading never unpickles anything: the manifest is JSON and arrays are
+    np.frombuffer views with a whitelisted numeric dtype, so a bundle cannot
+    run code and does not depend on sklearn class paths. Uncompressed arrays
+    are zero-copy views of the downloaded bytes, or of a read-only mmap of the
+    file, shared by every process that maps it. With zlib compression each
+    array is decompressed once on load.
+    """
+
+    @staticmethod
+    def supports(model: ModelPredictor) -> bool:
+        if getattr(model, "flat_model", None) is None:
+            return False
+        if getattr(model, "compiled_preprocessor", None) is None:
+            model.compile()
+        return model.compiled_preprocessor is not None
+
+    @staticmethod
+    def _arrays(model: ModelPredictor) -> Dict[str, np.ndarray]:
+        flat, compiled = model.flat_model, model.compiled_preprocessor
+        # node indices fit in int32, which halves the index arrays
+        if flat.n_nodes >= np.iinfo(np.int32).max:
+            raise ValueError(f"{flat} has too many nodes for a bundle")
+        arrays = {
+            "flat_forest.feature": flat.feature.astype("<i4"),
+            "flat_forest.threshold": flat.threshold.astype("<f8"),
+            "flat_forest.left": flat.left.astype("<i4"),
+            "flat_forest.right": flat.right.astype("<i4"),
+            "flat_forest.value": flat.value.astype("<f8"),
+            "flat_forest.roots": flat.roots.astype("<i4"),
+        }
+        if compiled.mean is not None:
+            arrays["preprocessor.mean"] = np.asarray(compiled.mean, dtype="<f8")
+        if compiled.scale is not None:
+            arrays["preprocessor.scale"] = np.asarray(compiled.scale, dtype="<f8")
+        return arrays
+
+    @classmethod
+    def dumps(cls, model: ModelPredictor, compression: Optional[str] = None) -> bytes:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported bundle compression: {compression}, expected one of {COMPRESSIONS}")
+        if not cls.supports(model):
+            raise ValueError(f"{model} cannot be bundled, it needs a flat forest and compiled preprocessing")
+
+        blobs, entries, offset = [], {}, 0
+        for name, array in cls._arrays(model).items():
+            data = np.ascontiguousarray(array).tobytes()
+            stored = zlib.compress(data) if compression == "zlib" else data
+            offset = _aligned(offset)
+            entries[name] = {
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "offset": offset,
+                "nbytes": len(data),
+                "stored_nbytes": len(stored),
+            }
+            blobs.append((offset, stored))
+            offset += len(stored)
+
+        flat = model.flat_model
+        trained_model = getattr(model, "trained_model_object", None)
+        manifest = {
+            "format_version": FORMAT_VERSION,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "compression": compression,
+            "model": {
+                "type": "FlatForest",
+                "estimator": type(trained_model).__name__ if trained_model is not None else None,
+                "n_trees": flat.n_trees,
+                "n_nodes": flat.n_nodes,
+                "max_depth": flat.max_depth,
+                "n_features": flat.n_features,
+            },
+            "preprocessor": model.compiled_preprocessor.state(),
+            "arrays": entries,
+        }
+        manifest_bytes = json.dumps(manifest).encode("utf-8")
+
+        data_start = _aligned(HEADER.size + len(manifest_bytes))
+        buffer = bytearray(data_start + offset)
+        HEADER.pack_into(buffer, 0, MAGIC, FORMAT_VERSION, len(manifest_bytes))
+        buffer[HEADER.size:HEADER.size + len(manifest_bytes)] = manifest_bytes
+        for blob_offset, stored in blobs:
+            start = data_start + blob_offset
+            buffer[start:start + len(stored)] = stored
+        return bytes(buffer)
+
+    @classmethod
+    def dump(cls, model: ModelPredictor, file_path: str, compression: Optional[str] = None) -> int:
+        """
+        Writes the bundle and returns its size in bytes.
+        """
+        data = cls.dumps(model, compression=compression)
+        with open(file_path, "wb") as file:
+            file.write(data)
+        return len(data)
+
+    @staticmethod
+    def is_bundle(data) -> bool:
+        return bytes(data[:len(MAGIC)]) == MAGIC
+
+    @staticmethod
+    def read_manifest(data) -> Tuple[dict, int]:
+        """
+        (manifest, offset of the array section) of a bundle, after checking its header.
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Not a model bundle: too short")
+        magic, version, manifest_length = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a model bundle: bad magic bytes")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Model bundle format {version} is newer than the supported {FORMAT_VERSION}")
+        if HEADER.size + manifest_length > len(data):
+            raise ValueError("Model bundle is truncated")
+        manifest = json.loads(bytes(data[HEADER.size:HEADER.size + manifest_length]).decode("utf-8"))
+        return manifest, _aligned(HEADER.size + manifest_length)
+
+    @staticmethod
+    def _array(data, data_start: int, name: str, entry: dict, compression: Optional[str]) -> np.ndarray:
+        dtype = np.dtype(entry["dtype"])
+        if entry["dtype"] not in ALLOWED_DTYPES:
+            raise ValueError(f"Array {name} has a disallowed dtype {entry['dtype']}")
+        shape = tuple(int(dim) for dim in entry["shape"])
+        count = int(np.prod(shape, dtype=np.int64))
+        if count * dtype.itemsize != entry["nbytes"]:
+            raise ValueError(f"Array {name}: shape {shape} does not match {entry['nbytes']} bytes")
+
+        start = data_start + int(entry["offset"])
+        end = start + int(entry["stored_nbytes"])
+        if start < data_start or end > len(data):
+            raise ValueError(f"Array {name} lies outside the bundle")
+
+        if compression == "zlib":
+            raw = zlib.decompress(data[start:end])
+            if len(raw) != entry["nbytes"]:
+                raise ValueError(f"Array {name} decompressed to {len(raw)} bytes, expected {entry['nbytes']}")
+            return np.frombuffer(raw, dtype=dtype, count=count).reshape(shape)
+        # zero-copy view of the bundle bytes
+        return np.frombuffer(data, dtype=dtype, count=count, offset=start).reshape(shape)
+
+    @staticmethod
+    def _validate(flat_model: FlatForest, n_nodes: int) -> None:
+        """
+        Checks every index the traversal follows, so a corrupted bundle raises
+        instead of wrapping around in NumPy indexing or stopping at internal nodes.
+        """
+        if flat_model.n_trees == 0 or flat_model.n_nodes != n_nodes:
+            raise ValueError("Model bundle node arrays do not match the manifest")
+        for name in ("threshold", "left", "right", "value"):
+            if getattr(flat_model, name).shape != (n_nodes,):
+                raise ValueError(f"Model bundle flat_forest.{name} does not have one entry per node")
+        for name in ("left", "right", "roots"):
+            indices = getattr(flat_model, name)
+            if indices.min() < 0 or indices.max() >= n_nodes:
+                raise ValueError(f"Model bundle flat_forest.{name} points outside the node arrays")
+        feature = flat_model.feature
+        if flat_model.n_features <= 0 or feature.min() < 0 or feature.max() >= flat_model.n_features:
+            raise ValueError(f"Model bundle flat_forest.feature lies outside [0, {flat_model.n_features})")
+
+        depth = _forest_depth(flat_model.left, flat_model.right, flat_model.roots)
+        if depth != flat_model.max_depth:
+            raise ValueError(f"Model bundle max_depth {flat_model.max_depth} does not match the tree depth {depth}")
+
+    @classmethod
+    def loads(cls, data) -> ModelPredictor:
+        """
+        ModelPredictor from bundle bytes (bytes, memoryview or mmap); the arrays are read-only views.
+        """
+        manifest, data_start = cls.read_manifest(data)
+        compression = manifest.get("compression")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported bundle compression: {compression}")
+        model_info = manifest["model"]
+        if model_info.get("type") != "FlatForest":
+            raise ValueError(f"Unsupported bundle model type: {model_info.get('type')}")
+
+        arrays = {
+            name: cls._array(data, data_start, name, entry, compression)
+            for name, entry in manifest["arrays"].items()
+        }
+
+        flat_model = FlatForest(
+            feature=arrays["flat_forest.feature"],
+            threshold=arrays["flat_forest.threshold"],
+            left=arrays["flat_forest.left"],
+            right=arrays["flat_forest.right"],
+            value=arrays["flat_forest.value"],
+            roots=arrays["flat_forest.roots"],
+            max_depth=int(model_info["max_depth"]),
+            n_features=int(model_info["n_features"]),
+        )
+        cls._validate(flat_model, int(model_info["n_nodes"]))
+
+        model = ModelPredictor(preprocessing_object=None, trained_model_object=None)
+        model.flat_model = flat_model
+        model.compiled_preprocessor = CompiledPreprocessor.from_state(
+            manifest["preprocessor"],
+            mean=arrays.get("preprocessor.mean"),
+            scale=arrays.get("preprocessor.scale"),
+        )
+        if model.compiled_preprocessor.n_outputs != flat_model.n_features:
+            raise ValueError("Model bundle preprocessor output does not match the model's n_features")
+        return model
+
+    @classmethod
+    def load(cls, file_path: str, mmap_mode: Optional[str] = "r") -> ModelPredictor:
+        """
+        mmap_mode="r" maps the file read-only and the arrays are views of the
+        mapping; None reads the file into memory.
+        """
+        with open(file_path, "rb") as file:
+            if mmap_mode is None:
+                return cls.loads(file.read())
+            if mmap_mode != "r":
+                raise ValueError(f"Unsupported mmap_mode: {mmap_mode}, bundles are mapped read-only")
+            # the mapping outlives the file object
+            return cls.loads(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
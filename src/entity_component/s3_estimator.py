@@ -1,28 +1,49 @@
 
 
 from src.cloud_storage.aws_storage import SimpleStorageService
+from src.cloud_storage.model_disk_cache import ModelDiskCache
+from src.constants_component import (
+    MODEL_DISK_CACHE_ENABLED, MODEL_DISK_CACHE_DIR, MODEL_DISK_CACHE_MAX_MB, MODEL_DOWNLOAD_CHUNK_BYTES
+)
 from src.exception_component import MyException
 from src.entity_component.estimator import ModelPredictor
 import sys
+from typing import Optional
 from pandas import DataFrame
 
 
 
+def default_disk_cache() -> Optional[ModelDiskCache]:
+    """
+    The host-wide ModelDiskCache, None when MODEL_DISK_CACHE_ENABLED is off.
+    Needs no S3 client.
+    """
+    if not MODEL_DISK_CACHE_ENABLED:
+        return None
+    return ModelDiskCache.get_instance(
+        root_dir=MODEL_DISK_CACHE_DIR,
+        max_bytes=int(MODEL_DISK_CACHE_MAX_MB * 1024 * 1024),
+        chunk_size=MODEL_DOWNLOAD_CHUNK_BYTES,
+    )
+
 
 class LaptopTrainedModelEstimator:
     """
     This class is used to save and retrieve laptop trained   model in s3 bucket and to do prediction
     """
 
-    def __init__(self,bucket_name,model_path,):
+    def __init__(self,bucket_name,model_path,disk_cache:Optional[ModelDiskCache]=None):
         """
         :param bucket_name: Name of your model bucket
         :param model_path: Location of your model in bucket
+        :param disk_cache: local cache models are loaded through; defaults to the
+                           host-wide one when MODEL_DISK_CACHE_ENABLED
         """
         self.bucket_name = bucket_name
         self.s3 = SimpleStorageService()
         self.model_path = model_path
         self.loaded_model:ModelPredictor=None
+        self.disk_cache = disk_cache if disk_cache is not None else default_disk_cache()
         
 
 
@@ -37,6 +58,24 @@ class LaptopTrainedModelEstimator:
         except MyException as e:
             print(e)
         return False
+
+
+
+    def get_model_version(self) -> Optional[str]:
+        """
+        Returns the ETag (or LastModified) of the model object, None if it is not in the bucket.
+        This is a single HEAD request, cheap enough to poll.
+        """
+        try:
+            version = self.s3.get_object_version(
+                bucket_name=self.bucket_name,
+                s3_key=self.model_path
+            )
+            if version is None:
+                return None
+            return version["etag"] or version["last_modified"]
+        except Exception as e:
+            raise MyException(e, sys)
         
 
 
@@ -47,7 +86,7 @@ class LaptopTrainedModelEstimator:
         :return:
         """
 
-        return self.s3.load_model(self.model_path,bucket_name=self.bucket_name)
+        return self.s3.load_model(self.model_path,bucket_name=self.bucket_name,disk_cache=self.disk_cache)
 
 
 
@@ -61,11 +100,16 @@ class LaptopTrainedModelEstimator:
         :return:
         """
         try:
-            self.s3.upload_file(from_file,
-                                to_filename=self.model_path,
-                                bucket_name=self.bucket_name,
-                                remove=remove
-                                )
+            sha256 = self.s3.upload_file(from_file,
+                                         to_filename=self.model_path,
+                                         bucket_name=self.bucket_name,
+                                         remove=remove,
+                                         checksum=True
+                                         )
+            # the next load on this host need not download the file just uploaded;
+            # the cache matches it to the object's ETag through its SHA-256, not a bare HEAD
+            if self.disk_cache is not None and not remove:
+                self.disk_cache.put(self.s3.s3_client, self.bucket_name, self.model_path, from_file, sha256)
         except Exception as e:
             raise MyException(e, sys)
 
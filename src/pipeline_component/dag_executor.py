@@ -0,0 +1,143 @@
+# pipeline_component/dag_executor.py
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+from src.logging_component import logger
+
+
+@dataclass
+class DagNode:
+    """
+    One unit of work. function receives the dict of results of the nodes
+    finished so far (at least everything in depends_on) and returns its own result.
+    """
+    name: str
+    function: Callable[[Dict[str, Any]], Any]
+    depends_on: List[str] = field(default_factory=list)
+
+
+class DagExecutor:
+    """
+    Runs DagNodes on a thread pool, each one as soon as its dependencies are done.
+    Fail fast: after the first failure no new node is started, the nodes already
+    running are waited for and the error is raised.
+    Records each node's start / end time and logs the critical path.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(1, max_workers)
+        self.timings: Dict[str, dict] = {}
+        self.critical_path: List[str] = []
+
+    @staticmethod
+    def topological_order(nodes: List[DagNode]) -> List[str]:
+        by_name = {node.name: node for node in nodes}
+        if len(by_name) != len(nodes):
+            raise ValueError("DAG node names must be unique")
+        for node in nodes:
+            unknown = [dep for dep in node.depends_on if dep not in by_name]
+            if unknown:
+                raise ValueError(f"Node {node.name} depends on unknown nodes {unknown}")
+
+        order, state = [], {}
+
+        def visit(name: str) -> None:
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"DAG has a cycle through {name}")
+            state[name] = "visiting"
+            for dep in by_name[name].depends_on:
+                visit(dep)
+            state[name] = "done"
+            order.append(name)
+
+        for node in nodes:
+            visit(node.name)
+        return order
+
+    def _timed(self, node: DagNode, results: Dict[str, Any], origin: float) -> Any:
+        started = time.perf_counter()
+        try:
+            return node.function(results)
+        finally:
+            finished = time.perf_counter()
+            self.timings[node.name] = {
+                "start": round(started - origin, 3),
+                "end": round(finished - origin, 3),
+                "seconds": round(finished - started, 3),
+            }
+
+    def run(self, nodes: List[DagNode]) -> Dict[str, Any]:
+        """
+        Runs all nodes and returns {node name: result}.
+        """
+        order = self.topological_order(nodes)
+        by_name = {node.name: node for node in nodes}
+        remaining = {node.name: set(node.depends_on) for node in nodes}
+
+        results: Dict[str, Any] = {}
+        self.timings = {}
+        self.critical_path = []
+        origin = time.perf_counter()
+        error = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pipeline-stage") as pool:
+            running = {}
+
+            def submit_ready() -> None:
+                for name in order:
+                    if name in remaining and not remaining[name]:
+                        del remaining[name]
+                        # each node gets a snapshot so concurrent nodes never see a dict being written
+                        running[pool.submit(self._timed, by_name[name], dict(results), origin)] = name
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.exception() is not None:
+                        if error is None:
+                            error = future.exception()
+                            logger.error(f"Pipeline node {name} failed, not starting {sorted(remaining)}")
+                        continue
+                    results[name] = future.result()
+                    for deps in remaining.values():
+                        deps.discard(name)
+                if error is None:
+                    submit_ready()
+
+        if error is not None:
+            raise error
+
+        self._log_critical_path(by_name, order, time.perf_counter() - origin)
+        return results
+
+    def _log_critical_path(self, by_name: Dict[str, DagNode], order: List[str], wall_seconds: float) -> None:
+        """
+        The chain of dependent nodes with the largest total run time; it bounds the wall time.
+        """
+        length, previous = {}, {}
+        for name in order:
+            best = max(by_name[name].depends_on, key=lambda dep: length[dep], default=None)
+            previous[name] = best
+            length[name] = self.timings[name]["seconds"] + (length[best] if best else 0.0)
+
+        name = max(length, key=length.get, default=None)
+        path = []
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+        self.critical_path = path[::-1]
+
+        total = sum(timing["seconds"] for timing in self.timings.values())
+        logger.info(
+            "Critical path: "
+            + " -> ".join(f"{name} ({self.timings[name]['seconds']}s)" for name in self.critical_path)
+            + f" = {round(sum(self.timings[name]['seconds'] for name in self.critical_path), 3)}s; "
+            f"wall time {round(wall_seconds, 3)}s, sum of node times {round(total, 3)}s"
+        )
@@ -0,0 +1,123 @@
+# pipeline_component/micro_batcher.py
+
+import asyncio
+import time
+from collections import Counter, deque
+from typing import Any, Awaitable, Callable, List, Optional
+
+import numpy as np
+
+from src.logging_component import logger
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-row requests into one model call.
+
+    submit() parks the caller's item; the pending items are scored together
+    as soon as max_rows of them are waiting or the oldest has waited
+    max_delay_ms, whichever comes first, and every caller gets its own result
+    back. score_batch receives the list of items and returns one result per
+    item, in order; a result that is an exception is raised to that caller only.
+
+    Runs on the event loop: submit, the timer and the fan-out never block, the
+    scoring itself is awaited (e.g. on the PredictionExecutor).
+    """
+
+    def __init__(self, score_batch: Callable[[List[Any]], Awaitable[list]], max_rows: int,
+                 max_delay_ms: float, timing_window: int = 1000):
+        self.score_batch = score_batch
+        self.max_rows = max(1, max_rows)
+        self.max_delay_seconds = max(0.0, max_delay_ms) / 1000
+
+        self._pending: List[tuple] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # batches being scored; the loop only keeps weak references to tasks
+        self._scoring: set = set()
+
+        self.batches = 0
+        self.rows = 0
+        self.full_flushes = 0
+        self.timer_flushes = 0
+        self.failed_batches = 0
+        self.batch_sizes: Counter = Counter()
+        # seconds each row waited for its batch to be dispatched, most recent rows only
+        self._batching_delays: deque = deque(maxlen=timing_window)
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Scores item as part of the next batch and returns its result.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future, time.perf_counter()))
+
+        if len(self._pending) >= self.max_rows:
+            self.full_flushes += 1
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay_seconds, self._on_timer)
+
+        return await future
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        if self._pending:
+            self.timer_flushes += 1
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        dispatched_at = time.perf_counter()
+        for _, _, submitted_at in batch:
+            self._batching_delays.append(dispatched_at - submitted_at)
+
+        self.batches += 1
+        self.rows += len(batch)
+        self.batch_sizes[len(batch)] += 1
+        task = asyncio.ensure_future(self._score(batch))
+        self._scoring.add(task)
+        task.add_done_callback(self._scoring.discard)
+
+    async def _score(self, batch: List[tuple]) -> None:
+        try:
+            results = await self.score_batch([item for item, _, _ in batch])
+        except Exception as e:
+            # the batch as a whole failed (e.g. rejected by the executor); every caller gets the error
+            self.failed_batches += 1
+            logger.error(f"Micro-batch of {len(batch)} rows failed: {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            if future.done():
+                continue  # caller went away
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        delays = np.asarray(self._batching_delays) * 1000
+        return {
+            "max_rows": self.max_rows,
+            "max_delay_ms": self.max_delay_seconds * 1000,
+            "pending": len(self._pending),
+            "batches": self.batches,
+            "rows": self.rows,
+            "mean_batch_size": round(self.rows / self.batches, 3) if self.batches else None,
+            "full_flushes": self.full_flushes,
+            "timer_flushes": self.timer_flushes,
+            "failed_batches": self.failed_batches,
+            # batch size -> number of batches of that size
+            "batch_size_histogram": {str(size): count for size, count in sorted(self.batch_sizes.items())},
+            "batching_delay_ms": {
+                "p50": round(float(np.percentile(delays, 50)), 3) if len(delays) else None,
+                "p99": round(float(np.percentile(delays, 99)), 3) if len(delays) else None,
+            },
+        }
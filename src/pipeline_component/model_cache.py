@@ -0,0 +1,216 @@
+# pipeline_component/model_cache.py
+
+import sys
+import time
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from src.exception_component import MyException
+from src.logging_component import logger
+from src.entity_component.estimator import ModelPredictor
+from src.entity_component.s3_estimator import LaptopTrainedModelEstimator, default_disk_cache
+from src.pipeline_component.shared_model_store import SharedModelStore
+
+
+class ModelCache:
+    """
+    Process-wide holder for the serving ModelPredictor.
+    The model is downloaded once and shared by every request.
+    refresh() loads a new copy and swaps it in atomically.
+    Every loaded model is warmed up before it is swapped in, so a model is
+    only ever served once it has made its first predictions.
+    """
+
+    _instances: Dict[Tuple[str, str], "ModelCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, bucket_name: str, model_path: str, n_jobs: Optional[int] = None,
+                 warm_up: Optional[Callable[[ModelPredictor], int]] = None,
+                 shared_model_dir: Optional[str] = None):
+        """
+        :param n_jobs: cores each prediction may use, applied to every loaded model;
+                       None keeps the setting the model was saved with
+        :param warm_up: called with every loaded model before it is swapped in,
+                        returns the number of warm-up predictions made
+        :param shared_model_dir: load models memory-mapped through a SharedModelStore
+                                 in this directory (multi-worker serving)
+        """
+        self.bucket_name = bucket_name
+        self.model_path = model_path
+        self.n_jobs = n_jobs
+        self.warm_up = warm_up
+        self.shared_store = SharedModelStore(shared_model_dir) if shared_model_dir else None
+        # built once; stats() must not need an S3 client (/ready on a cold instance)
+        self.disk_cache = default_disk_cache()
+
+        # (model, version) pair, replaced as a whole so readers never see a mix
+        self._current: Optional[Tuple[ModelPredictor, Optional[str]]] = None
+        self._load_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.load_count = 0
+        self.last_load_seconds: Optional[float] = None
+        self.last_warmup_seconds: Optional[float] = None
+        self.warmup_predictions = 0
+        self.loaded_at: Optional[str] = None
+        self.last_load_error: Optional[str] = None
+
+    @classmethod
+    def get_instance(cls, bucket_name: str, model_path: str, n_jobs: Optional[int] = None,
+                     warm_up: Optional[Callable[[ModelPredictor], int]] = None,
+                     shared_model_dir: Optional[str] = None) -> "ModelCache":
+        """
+        Returns the shared cache for the given bucket/key, creating it on first use.
+        """
+        key = (bucket_name, model_path)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(
+                    bucket_name=bucket_name, model_path=model_path, n_jobs=n_jobs,
+                    warm_up=warm_up, shared_model_dir=shared_model_dir
+                )
+            return cls._instances[key]
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._current is not None
+
+    @property
+    def model_version(self) -> Optional[str]:
+        current = self._current
+        return None if current is None else current[1]
+
+    def _estimator(self) -> LaptopTrainedModelEstimator:
+        return LaptopTrainedModelEstimator(
+            bucket_name=self.bucket_name,
+            model_path=self.model_path,
+            disk_cache=self.disk_cache,
+        )
+
+    def get_remote_version(self) -> Optional[str]:
+        """
+        Returns the version (ETag) of the model currently in the bucket.
+        """
+        return self._estimator().get_model_version()
+
+    def _load(self, version: Optional[str] = None) -> Tuple[ModelPredictor, Optional[str]]:
+        """
+        Downloads, deserializes and warms up the model, recording how long it took.
+        The version is read before the download, so a push racing with the
+        load is picked up again on the next check.
+        """
+        logger.info(f"Loading model s3://{self.bucket_name}/{self.model_path} into cache")
+        try:
+            start = time.perf_counter()
+            estimator = self._estimator()
+            if version is None:
+                version = estimator.get_model_version()
+            if self.shared_store is not None and version is not None:
+                # n_jobs is applied before the model is written, the estimator is loaded lazily
+                model = self.shared_store.load(
+                    version, download=lambda: estimator.load_model().set_n_jobs(self.n_jobs)
+                ).compile()
+            else:
+                model = estimator.load_model().set_n_jobs(self.n_jobs).compile()
+            elapsed = time.perf_counter() - start
+
+            warmup_seconds, warmup_predictions = None, 0
+            if self.warm_up is not None:
+                start = time.perf_counter()
+                warmup_predictions = self.warm_up(model)
+                warmup_seconds = time.perf_counter() - start
+
+        except Exception as e:
+            with self._stats_lock:
+                self.last_load_error = str(e)
+            raise
+
+        with self._stats_lock:
+            self.load_count += 1
+            self.last_load_seconds = elapsed
+            self.last_warmup_seconds = warmup_seconds
+            self.warmup_predictions = warmup_predictions
+            self.loaded_at = datetime.now().isoformat(timespec="seconds")
+            self.last_load_error = None
+
+        logger.info(
+            f"Model version {version} loaded into cache in {elapsed:.3f}s"
+            + (f", warmed up with {warmup_predictions} predictions in {warmup_seconds:.3f}s"
+               if warmup_seconds is not None else "")
+        )
+        return model, version
+
+    def _swap(self, model: ModelPredictor, version: Optional[str]) -> None:
+        # a single reference assignment; readers see either the old or the new model
+        self._current = (model, version)
+
+    def get_model(self) -> ModelPredictor:
+        """
+        Returns the cached model, loading it on the first call.
+        """
+        return self.get_model_with_version()[0]
+
+    def get_model_with_version(self) -> Tuple[ModelPredictor, Optional[str]]:
+        """
+        Returns the cached (model, version) pair, loading it on the first call.
+        Both come from the same swap, so the version always matches the model.
+        """
+        try:
+            current = self._current
+            if current is not None:
+                with self._stats_lock:
+                    self.hits += 1
+                return current
+
+            with self._load_lock:
+                # another thread may have finished loading while we waited
+                if self._current is None:
+                    with self._stats_lock:
+                        self.misses += 1
+                    self._swap(*self._load())
+                else:
+                    with self._stats_lock:
+                        self.hits += 1
+                return self._current
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    def refresh(self, version: Optional[str] = None) -> ModelPredictor:
+        """
+        Loads a fresh copy of the model and swaps it in.
+        Requests keep using the old model until the new one is fully loaded.
+        """
+        try:
+            with self._load_lock:
+                model, version = self._load(version=version)
+                self._swap(model, version)
+            logger.info(f"Model cache refreshed to version {version}")
+            return model
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    def stats(self) -> dict:
+        disk_cache_stats = self.disk_cache.stats() if self.disk_cache is not None else None
+        with self._stats_lock:
+            return {
+                "bucket_name": self.bucket_name,
+                "model_path": self.model_path,
+                "is_loaded": self.is_loaded,
+                "model_version": self.model_version,
+                "n_jobs": self.n_jobs,
+                "hits": self.hits,
+                "misses": self.misses,
+                "load_count": self.load_count,
+                "last_load_seconds": self.last_load_seconds,
+                "last_warmup_seconds": self.last_warmup_seconds,
+                "warmup_predictions": self.warmup_predictions,
+                "loaded_at": self.loaded_at,
+                "last_load_error": self.last_load_error,
+                "shared_store": self.shared_store.stats() if self.shared_store is not None else None,
+                "disk_cache": disk_cache_stats,
+            }
@@ -0,0 +1,89 @@
+# pipeline_component/model_watcher.py
+
+import threading
+from typing import Optional
+
+from src.logging_component import logger
+from src.pipeline_component.model_cache import ModelCache
+
+
+class ModelWatcher:
+    """
+    Background thread that polls the model object in S3 and hot-swaps the
+    ModelCache when the pushed model changes.
+    Each check is a single HEAD request; the download and unpickling happen
+    on this thread, never on the request path.
+    """
+
+    def __init__(self, model_cache: ModelCache, poll_interval_seconds: float):
+        self.model_cache = model_cache
+        self.poll_interval_seconds = poll_interval_seconds
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.checks = 0
+        self.reloads = 0
+        self.last_error: Optional[str] = None
+
+    def check_for_update(self) -> bool:
+        """
+        Reloads the model if its version in S3 differs from the cached one.
+        Returns True when a new model was swapped in.
+        """
+        self.checks += 1
+        remote_version = self.model_cache.get_remote_version()
+
+        if remote_version is None:
+            logger.info("Model watcher: no model found in bucket")
+            return False
+
+        if remote_version == self.model_cache.model_version:
+            return False
+
+        logger.info(
+            f"Model watcher: version changed "
+            f"{self.model_cache.model_version} -> {remote_version}, reloading"
+        )
+        self.model_cache.refresh(version=remote_version)
+        self.reloads += 1
+        return True
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.poll_interval_seconds):
+            try:
+                self.check_for_update()
+                self.last_error = None
+            except Exception as e:
+                # a failed check or load keeps the current model in place
+                self.last_error = str(e)
+                logger.error(f"Model watcher check failed: {e}")
+
+    def start(self) -> None:
+        if self.poll_interval_seconds <= 0:
+            logger.info("Model watcher disabled (poll interval <= 0)")
+            return
+
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="model-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Model watcher started, polling every {self.poll_interval_seconds}s")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval_seconds)
+            self._thread = None
+        logger.info("Model watcher stopped")
+
+    def stats(self) -> dict:
+        return {
+            "poll_interval_seconds": self.poll_interval_seconds,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "checks": self.checks,
+            "reloads": self.reloads,
+            "last_error": self.last_error,
+        }
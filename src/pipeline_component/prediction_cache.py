@@ -0,0 +1,118 @@
+# pipeline_component/prediction_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, List, Optional
+
+import numpy as np
+from pandas import DataFrame
+
+
+class PredictionCache:
+    """
+    LRU + TTL cache of predicted prices.
+    Keys are the engineered feature rows, so two requests that only differ in
+    formatting ("8GB" vs "8") share an entry, whichever path scored them. The cache is tied to a
+    model version and empties itself as soon as it sees a different one.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.model_version: Optional[str] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(features: tuple) -> Hashable:
+        """
+        Key of one engineered feature row, as a tuple of its values.
+        """
+        return features
+
+    @staticmethod
+    def make_keys(features: DataFrame) -> List[Hashable]:
+        """
+        make_key of every row of an engineered feature frame. The frame's columns
+        must be in the order the tuples passed to make_key use.
+        """
+        return [PredictionCache.make_key(row) for row in features.itertuples(index=False, name=None)]
+
+    def _check_version(self, model_version: Optional[str]) -> None:
+        # called with the lock held
+        if model_version != self.model_version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.model_version = model_version
+
+    def get_many(self, keys: List[Hashable], model_version: Optional[str]) -> List[Optional[float]]:
+        """
+        Cached prices for keys, None where the price is not cached.
+        """
+        now = time.monotonic()
+        results: List[Optional[float]] = []
+
+        with self._lock:
+            self._check_version(model_version)
+
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    self.misses += 1
+                    results.append(None)
+                    continue
+
+                value, expires_at = entry
+                if expires_at < now:
+                    del self._entries[key]
+                    self.expired += 1
+                    self.misses += 1
+                    results.append(None)
+                    continue
+
+                self._entries.move_to_end(key)
+                self.hits += 1
+                results.append(value)
+
+        return results
+
+    def put_many(self, keys: List[Hashable], values: np.ndarray, model_version: Optional[str]) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            # a prediction made with a model that has been swapped out since is dropped
+            if model_version != self.model_version:
+                return
+
+            for key, value in zip(keys, values):
+                self._entries[key] = (float(value), expires_at)
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "size": len(self._entries),
+                "model_version": self.model_version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,164 @@
+# pipeline_component/prediction_executor.py
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import numpy as np
+
+from src.logging_component import logger
+
+
+class PredictionRejected(Exception):
+    """
+    Raised when the executor is full; retry_after_seconds says when to come back.
+    """
+
+    def __init__(self, retry_after_seconds: int, in_flight: int):
+        super().__init__(f"Prediction queue is full ({in_flight} requests in flight), retry in {retry_after_seconds}s")
+        self.retry_after_seconds = retry_after_seconds
+        self.in_flight = in_flight
+
+
+class PredictionExecutor:
+    """
+    Bounded thread pool the async request handlers hand their prediction work to,
+    so feature engineering, S3 I/O and inference never run on the event loop.
+
+    At most max_workers calls run at once and at most max_queue_size more wait
+    for a worker. Anything beyond that is rejected right away (admission control)
+    instead of queueing without limit, which keeps the wait, and so the latency,
+    of the admitted requests bounded under a burst.
+    Threads share the process-wide model; numpy / sklearn release the GIL in
+    their heavy loops.
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int, min_retry_after_seconds: int = 1,
+                 timing_window: int = 1000):
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self.min_retry_after_seconds = max(1, min_retry_after_seconds)
+
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="prediction")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.max_queue_depth_seen = 0
+        # seconds, most recent calls only
+        self._wait_times: deque = deque(maxlen=timing_window)
+        self._execution_times: deque = deque(maxlen=timing_window)
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue_size
+
+    @property
+    def queue_depth(self) -> int:
+        return self._in_flight - self._running
+
+    def retry_after_seconds(self) -> int:
+        """
+        Time for the work already admitted to drain, from the recent execution times.
+        """
+        with self._lock:
+            recent = list(self._execution_times)
+            in_flight = self._in_flight
+        if not recent:
+            return self.min_retry_after_seconds
+        drain = float(np.mean(recent)) * in_flight / self.max_workers
+        return max(self.min_retry_after_seconds, math.ceil(drain))
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.rejected += 1
+                in_flight = self._in_flight
+            else:
+                self._in_flight += 1
+                self.max_queue_depth_seen = max(self.max_queue_depth_seen, self._in_flight - self._running)
+                return
+
+        retry_after = self.retry_after_seconds()
+        logger.warning(f"Prediction rejected: {in_flight} requests in flight, retry after {retry_after}s")
+        raise PredictionRejected(retry_after, in_flight)
+
+    def _execute(self, submitted_at: float, function: Callable, args: tuple, kwargs: dict) -> Any:
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+            self._wait_times.append(started - submitted_at)
+
+        succeeded = False
+        try:
+            result = function(*args, **kwargs)
+            succeeded = True
+            return result
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._running -= 1
+                self._in_flight -= 1
+                self._execution_times.append(finished - started)
+                if succeeded:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+    async def run(self, function: Callable, *args, **kwargs) -> Any:
+        """
+        Runs function(*args, **kwargs) on the pool and awaits its result.
+        Raises PredictionRejected without running it when the executor is full.
+        """
+        self._admit()
+        try:
+            future = self._pool.submit(self._execute, time.perf_counter(), function, args, kwargs)
+        except Exception:
+            self._release()
+            raise
+
+        # a request cancelled while still queued (client gone) never reaches _execute
+        future.add_done_callback(lambda done: self._release() if done.cancelled() else None)
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False)
+
+    @staticmethod
+    def _percentiles_ms(values) -> dict:
+        if not values:
+            return {"p50": None, "p99": None, "max": None}
+        values = np.asarray(values) * 1000
+        return {
+            "p50": round(float(np.percentile(values, 50)), 3),
+            "p99": round(float(np.percentile(values, 99)), 3),
+            "max": round(float(values.max()), 3),
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            wait_times = list(self._wait_times)
+            execution_times = list(self._execution_times)
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "running": self._running,
+                "queue_depth": self._in_flight - self._running,
+                "max_queue_depth_seen": self.max_queue_depth_seen,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "wait_ms": self._percentiles_ms(wait_times),
+                "execution_ms": self._percentiles_ms(execution_times),
+            }
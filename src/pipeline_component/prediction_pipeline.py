@@ -1,11 +1,26 @@
 # pipeline_component/prediction_pipeline.py
 
 import sys
+from typing import List
+import numpy as np
 from pandas import DataFrame
 from src.exception_component import MyException
 from src.logging_component import logger
 from src.entity_component.config_entity import LaptopPricePredictorConfig
-from src.entity_component.s3_estimator import LaptopTrainedModelEstimator
+from src.pipeline_component.model_cache import ModelCache
+from src.pipeline_component.prediction_cache import PredictionCache
+from src.Data_transformation_component import DataTransformation
+from src.Data_transformation_component.FeatureEngineeringModule import SCALAR_PATH_MAX_ROWS
+
+
+def error_message(error: Exception) -> str:
+    """
+    Message of the exception at the bottom of a MyException(e, sys) chain,
+    without the wrappers' "| Original: <module 'sys'>" suffixes.
+    """
+    while isinstance(error, MyException) and isinstance(error.message, Exception):
+        error = error.message
+    return str(error)
 
 
 class LaptopData:
@@ -13,6 +28,19 @@ class LaptopData:
     Class to handle the input data for laptop prediction.
     """
 
+    FIELDS = [
+        "Company",
+        "TypeName",
+        "Inches",
+        "ScreenResolution",
+        "Cpu",
+        "Ram",
+        "Memory",
+        "Gpu",
+        "OpSys",
+        "Weight",
+    ]
+
     def __init__(
         self,
         Company: str,
@@ -41,6 +69,64 @@ class LaptopData:
         except Exception as e:
             raise MyException(e, sys) from e
 
+    @staticmethod
+    def normalize_units(Ram, Weight):
+        """
+        Adds the "GB" / "kg" suffixes the feature engineering expects
+        when the client sends bare numbers.
+        """
+        if 'GB' not in str(Ram).upper():
+            Ram = f"{Ram}GB"
+        if 'kg' not in str(Weight).lower():
+            Weight = f"{Weight}kg"
+        return Ram, Weight
+
+    @classmethod
+    def from_record(cls, record: dict) -> "LaptopData":
+        """
+        Builds LaptopData from a JSON record.
+        Raises ValueError describing what is wrong with the record.
+        """
+        if not isinstance(record, dict):
+            raise ValueError("record must be a JSON object")
+
+        missing = [field for field in cls.FIELDS if record.get(field) in (None, "")]
+        if missing:
+            raise ValueError(f"missing fields: {missing}")
+
+        try:
+            inches = float(record["Inches"])
+        except (TypeError, ValueError):
+            raise ValueError(f"Inches must be a number, got {record['Inches']!r}")
+
+        ram, weight = cls.normalize_units(record["Ram"], record["Weight"])
+
+        return cls(
+            Company=str(record["Company"]),
+            TypeName=str(record["TypeName"]),
+            Inches=inches,
+            ScreenResolution=str(record["ScreenResolution"]),
+            Cpu=str(record["Cpu"]),
+            Ram=ram,
+            Memory=str(record["Memory"]),
+            Gpu=str(record["Gpu"]),
+            OpSys=str(record["OpSys"]),
+            Weight=weight,
+        )
+
+    @classmethod
+    def to_data_frame(cls, laptops: List["LaptopData"]) -> DataFrame:
+        """
+        Stacks many LaptopData objects into a single DataFrame
+        so the model scores them in one call.
+        """
+        try:
+            return DataFrame(
+                {field: [getattr(laptop, field) for laptop in laptops] for field in cls.FIELDS}
+            )
+        except Exception as e:
+            raise MyException(e, sys) from e
+
     def get_input_data_frame(self) -> DataFrame:
         """
         Converts input data into a pandas DataFrame with column names
@@ -78,10 +164,81 @@ class LaptopPredictor:
     ):
         try:
             self.prediction_pipeline_config = prediction_pipeline_config
+            self.warmup_laptops = [
+                LaptopData.from_record(record)
+                for record in DataTransformation.schema.get("warmup_samples") or []
+            ]
+            self.model_cache = ModelCache.get_instance(
+                bucket_name=self.prediction_pipeline_config.model_bucket_name,
+                model_path=self.prediction_pipeline_config.model_file_path,
+                n_jobs=self.prediction_pipeline_config.n_jobs,
+                warm_up=self.warm_up_model,
+                shared_model_dir=self.prediction_pipeline_config.shared_model_dir,
+            )
+
+            # optional result cache in front of the model; size 0 turns it off
+            self.prediction_cache = None
+            if self.prediction_pipeline_config.prediction_cache_size > 0:
+                self.prediction_cache = PredictionCache(
+                    max_size=self.prediction_pipeline_config.prediction_cache_size,
+                    ttl_seconds=self.prediction_pipeline_config.prediction_cache_ttl_seconds,
+                )
 
         except Exception as e:
             raise MyException(e, sys) from e
 
+    def warm_up_model(self, model) -> int:
+        """
+        Runs the schema's warmup_samples through both serving paths of a freshly
+        loaded model (compiled single record, and a batch large enough for the
+        vectorized feature engineering), bypassing the prediction cache.
+        Returns the number of predictions made.
+        """
+        if not self.warmup_laptops:
+            return 0
+
+        for laptop in self.warmup_laptops:
+            model.predict_record(laptop)
+
+        repeats = SCALAR_PATH_MAX_ROWS // len(self.warmup_laptops) + 1
+        batch = LaptopData.to_data_frame(self.warmup_laptops * repeats)
+        predictions = model.predict(batch)
+        if not np.all(np.isfinite(predictions)):
+            raise ValueError("Warm-up predictions are not finite")
+
+        return len(self.warmup_laptops) + len(batch)
+
+    def _predict_with_cache(self, dataframe: DataFrame) -> np.ndarray:
+        """
+        Scores the frame, serving repeated feature rows from the prediction cache.
+        """
+        # Shared model (preprocessing + trained model), loaded once per process
+        model, model_version = self.model_cache.get_model_with_version()
+
+        if self.prediction_cache is None:
+            return model.predict(dataframe)
+
+        features = model.prepare_features(dataframe)
+        compiled = getattr(model, "compiled_preprocessor", None)
+        # keyed in the column order of CompiledPreprocessor.features_of, so a laptop
+        # scored by /predict and by /predict/batch shares one cache entry
+        key_columns = features.columns
+        if compiled is not None:
+            key_columns = compiled.numerical_features + compiled.categorical_features
+        keys = PredictionCache.make_keys(features[key_columns])
+        cached = self.prediction_cache.get_many(keys, model_version)
+
+        missing = [i for i, value in enumerate(cached) if value is None]
+        if not missing:
+            return np.array(cached, dtype=float)
+
+        predictions = model.predict_features(features.iloc[missing])
+        self.prediction_cache.put_many([keys[i] for i in missing], predictions, model_version)
+
+        for i, value in zip(missing, predictions):
+            cached[i] = value
+        return np.array(cached, dtype=float)
+
     def predict(self, dataframe: DataFrame):
         """
         Returns the model prediction for the given input DataFrame.
@@ -89,17 +246,141 @@ class LaptopPredictor:
         try:
             logger.info("Entered predict method of LaptopPredictor")
 
-            # Load the LaptopEstimator model (preprocessing + trained model)
-            model: LaptopTrainedModelEstimator = LaptopTrainedModelEstimator(
-                bucket_name=self.prediction_pipeline_config.model_bucket_name,
-                model_path=self.prediction_pipeline_config.model_file_path,
-            ).load_model()
-
             # Perform prediction
-            prediction = model.predict(dataframe)
+            prediction = self._predict_with_cache(dataframe)
 
             logger.info("Laptop prediction completed successfully")
             return prediction
 
         except Exception as e:
             raise MyException(e, sys) from e
+
+    def predict_laptop(self, laptop: LaptopData) -> float:
+        """
+        Price of a single laptop through the model's compiled preprocessing:
+        no DataFrame is built on the way from LaptopData to the model input.
+        """
+        try:
+            model, model_version = self.model_cache.get_model_with_version()
+            compiled = getattr(model, "compiled_preprocessor", None)
+            if compiled is None:
+                return float(self.predict(laptop.get_input_data_frame())[0])
+
+            features = compiled.features_of(laptop)
+            if self.prediction_cache is None:
+                return model.predict_compiled_features(features)
+
+            key = PredictionCache.make_key(features)
+            cached = self.prediction_cache.get_many([key], model_version)[0]
+            if cached is not None:
+                return cached
+
+            price = model.predict_compiled_features(features)
+            self.prediction_cache.put_many([key], [price], model_version)
+            return price
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    def predict_laptops(self, laptops: List[LaptopData]) -> list:
+        """
+        Prices of laptops from separate requests (the micro-batcher), scored
+        with one model call. One result per laptop, in order: the price, or the
+        exception that laptop raised, so a bad record only fails its own request.
+        """
+        try:
+            model, model_version = self.model_cache.get_model_with_version()
+            compiled = getattr(model, "compiled_preprocessor", None)
+            if compiled is None:
+                return self._predict_frame_rows(laptops)
+
+            results: list = [None] * len(laptops)
+            features = {}
+            for index, laptop in enumerate(laptops):
+                try:
+                    features[index] = compiled.features_of(laptop)
+                except Exception as e:
+                    results[index] = MyException(e, sys)
+
+            todo = list(features)
+            keys = {}
+            if self.prediction_cache is not None and todo:
+                keys = {index: PredictionCache.make_key(features[index]) for index in todo}
+                cached = self.prediction_cache.get_many([keys[index] for index in todo], model_version)
+                for index, value in zip(todo, cached):
+                    results[index] = value
+                todo = [index for index in todo if results[index] is None]
+
+            if todo:
+                prices = model.predict_compiled_batch([features[index] for index in todo])
+                if self.prediction_cache is not None:
+                    self.prediction_cache.put_many([keys[index] for index in todo], prices, model_version)
+                for index, price in zip(todo, prices):
+                    results[index] = float(price)
+
+            return results
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    def _predict_frame_rows(self, laptops: List[LaptopData]) -> list:
+        """
+        predict_laptops for a model without compiled preprocessing: one stacked
+        DataFrame, with failing rows isolated by _predict_isolating.
+        """
+        return [
+            MyException(result, sys) if isinstance(result, Exception) else result
+            for result in self._predict_isolating(laptops)
+        ]
+
+    def _predict_isolating(self, laptops: List[LaptopData]) -> list:
+        """
+        Prices of laptops scored as one stacked DataFrame. When that fails, the
+        batch is split in halves and each half scored again, so k bad rows cost
+        O(k log n) stacked calls instead of one call per row. One result per
+        laptop, in order: the price, or the exception that laptop raised.
+        """
+        try:
+            return [float(price) for price in self._predict_with_cache(LaptopData.to_data_frame(laptops))]
+        except Exception as e:
+            if len(laptops) == 1:
+                return [e]
+            middle = len(laptops) // 2
+            return self._predict_isolating(laptops[:middle]) + self._predict_isolating(laptops[middle:])
+
+    def predict_batch(self, records: List[dict]) -> List[dict]:
+        """
+        Scores many records with a single model call.
+        Returns one result per record, in order: {"index", "price"} on success
+        or {"index", "error"} when that record could not be scored.
+        """
+        try:
+            logger.info(f"Entered predict_batch method of LaptopPredictor with {len(records)} records")
+
+            results: List[dict] = [None] * len(records)
+            valid_indices: List[int] = []
+            laptops: List[LaptopData] = []
+
+            for index, record in enumerate(records):
+                try:
+                    laptops.append(LaptopData.from_record(record))
+                    valid_indices.append(index)
+                except ValueError as e:
+                    results[index] = {"index": index, "error": str(e)}
+
+            if laptops:
+                # a model that cannot be loaded fails the request, not every row
+                self.model_cache.get_model_with_version()
+
+            # a bad value that slipped past validation only fails its own row
+            for index, result in zip(valid_indices, self._predict_isolating(laptops) if laptops else []):
+                if isinstance(result, Exception):
+                    results[index] = {"index": index, "error": error_message(result)}
+                else:
+                    results[index] = {"index": index, "price": round(result, 2)}
+
+            logger.info("Laptop batch prediction completed")
+            return results
+
+        except Exception as e:
+            raise MyException(e, sys) from e
@@ -0,0 +1,113 @@
+# pipeline_component/run_manifest.py
+
+import dataclasses
+import os
+import sys
+import threading
+import typing
+from typing import Optional
+
+import numpy as np
+
+from src.constants_component import RUN_MANIFEST_FILE_NAME, CURRENT_DATE_TIME
+from src.entity_component.config_entity import pipeline
+from src.exception_component import MyException
+from src.logging_component import logger
+from src.utils_component.main_utils import read_yaml_file, write_yaml_file
+
+
+def artifact_to_dict(artifact) -> dict:
+    """
+    Plain (YAML safe) dict of an artifact dataclass; numpy scalars become Python numbers.
+    """
+    def plain(value):
+        if isinstance(value, dict):
+            return {key: plain(item) for key, item in value.items()}
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    return plain(dataclasses.asdict(artifact))
+
+
+def artifact_from_dict(artifact_class, data: dict):
+    """
+    Rebuilds an artifact dataclass (nested ones included) from artifact_to_dict output.
+    """
+    hints = typing.get_type_hints(artifact_class)
+    values = {}
+    for field in dataclasses.fields(artifact_class):
+        if field.name not in data:
+            # field added after the manifest was written; keep its default
+            continue
+        value = data[field.name]
+        if dataclasses.is_dataclass(hints.get(field.name)) and isinstance(value, dict):
+            value = artifact_from_dict(hints[field.name], value)
+        values[field.name] = value
+    return artifact_class(**values)
+
+
+class RunManifest:
+    """
+    Record of one training run: the status of every stage and the artifact
+    of each completed one, stored in artifact/<run_id>/run_manifest.yaml.
+    It is rewritten after every stage, so a run that dies part way can be
+    resumed from its first incomplete stage.
+    """
+
+    def __init__(self, run_id: str = CURRENT_DATE_TIME, artifact_dir: str = pipeline.artifact_dir):
+        self.run_id = run_id
+        self.file_path = os.path.join(artifact_dir, run_id, RUN_MANIFEST_FILE_NAME)
+        self.stages: dict = {}
+        # stages running side by side record their results concurrently
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, run_id: str, artifact_dir: str = pipeline.artifact_dir) -> "RunManifest":
+        try:
+            manifest = cls(run_id, artifact_dir)
+            if not os.path.exists(manifest.file_path):
+                raise FileNotFoundError(f"No run manifest for run '{run_id}' at {manifest.file_path}")
+            manifest.stages = (read_yaml_file(manifest.file_path) or {}).get("stages", {})
+            return manifest
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    def save(self) -> None:
+        write_yaml_file(self.file_path, {"run_id": self.run_id, "stages": self.stages}, replace=True)
+
+    def record(self, stage: str, status: str, artifact=None, error: Optional[str] = None) -> None:
+        entry = {"status": status}
+        if artifact is not None:
+            entry["artifact"] = artifact_to_dict(artifact)
+        if error is not None:
+            entry["error"] = error
+        with self._lock:
+            self.stages[stage] = entry
+            self.save()
+
+    def completed_artifact(self, stage: str, artifact_class):
+        """
+        The artifact of stage if it completed and its files still exist, else None.
+        """
+        entry = self.stages.get(stage)
+        if not entry or entry.get("status") != "completed" or "artifact" not in entry:
+            return None
+
+        if any(not os.path.exists(path) for path in _path_values(entry["artifact"])):
+            logger.info(f"Run {self.run_id}: files of stage {stage} are gone, it will run again")
+            return None
+        return artifact_from_dict(artifact_class, entry["artifact"])
+
+
+def _path_values(data: dict) -> list:
+    """
+    String values of a serialized artifact that look like artifact paths.
+    """
+    paths = []
+    for value in data.values():
+        if isinstance(value, dict):
+            paths.extend(_path_values(value))
+        elif isinstance(value, str) and value.startswith(pipeline.artifact_dir + os.sep):
+            paths.append(value)
+    return paths
@@ -0,0 +1,159 @@
+# pipeline_component/shared_model_store.py
+
+import copy
+import fcntl
+import os
+import re
+import shutil
+import threading
+import time
+from typing import Callable
+
+import joblib
+
+from src.logging_component import logger
+from src.entity_component.estimator import ModelPredictor
+from src.entity_component.model_bundle import ModelBundle
+
+
+PREDICTOR_FILE_NAME = "predictor.joblib"
+BUNDLE_FILE_NAME = "model.bundle"
+ESTIMATOR_FILE_NAME = "estimator.joblib"
+LOCK_FILE_NAME = ".lock"
+
+
+class LazyEstimator:
+    """
+    Stand-in for ModelPredictor.trained_model_object that loads the estimator
+    from its shared file on first use. sklearn trees copy their node arrays
+    into private memory when unpickled, so a worker that only ever serves
+    small batches from the flat engine never pays for that copy.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._estimator = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._estimator is not None
+
+    @property
+    def estimator(self):
+        if self._estimator is None:
+            with self._lock:
+                if self._estimator is None:
+                    logger.info(f"Loading shared estimator {self.file_path}")
+                    self._estimator = joblib.load(self.file_path, mmap_mode="r")
+        return self._estimator
+
+    def predict(self, X):
+        return self.estimator.predict(X)
+
+    def __getattr__(self, name):
+        # only called for attributes LazyEstimator does not define itself
+        if name.startswith("__") or name in ("file_path", "_estimator", "_lock"):
+            raise AttributeError(name)
+        return getattr(self.estimator, name)
+
+    def __repr__(self):
+        return f"LazyEstimator({self.file_path}, loaded={self.is_loaded})"
+
+
+class SharedModelStore:
+    """
+    Local directory through which the worker processes of one host share a
+    model: the first worker to need a version downloads it and writes it out
+    once, uncompressed, and every worker then loads it with mmap_mode="r".
+
+    The NumPy arrays of the model (flat forest node arrays, scaler means and
+    scales) are memory-mapped, so all workers read the same page-cache pages
+    instead of each holding a private copy, and a worker (re)starting for a
+    version already on disk skips the download and most of the unpickling.
+    Models that can be bundled are stored as an uncompressed ModelBundle,
+    which maps with no unpickling at all.
+    Writers are serialized with a file lock; files are written to a temporary
+    directory and renamed into place, so readers never see a partial model.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    def version_dir(self, version: str) -> str:
+        return os.path.join(self.root_dir, re.sub(r"[^A-Za-z0-9._-]", "_", version))
+
+    def has_version(self, version: str) -> bool:
+        version_dir = self.version_dir(version)
+        return any(
+            os.path.exists(os.path.join(version_dir, name)) for name in (BUNDLE_FILE_NAME, PREDICTOR_FILE_NAME)
+        )
+
+    def _write(self, version: str, model: ModelPredictor) -> None:
+        target = self.version_dir(version)
+        temp_dir = f"{target}.tmp-{os.getpid()}"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+
+        if ModelBundle.supports(model):
+            # uncompressed, so every array is a view of the shared mapping
+            ModelBundle.dump(model, os.path.join(temp_dir, BUNDLE_FILE_NAME))
+        else:
+            # the estimator goes to its own file so workers can load it lazily
+            predictor = copy.copy(model)
+            predictor.trained_model_object = None
+            joblib.dump(model.trained_model_object, os.path.join(temp_dir, ESTIMATOR_FILE_NAME))
+            joblib.dump(predictor, os.path.join(temp_dir, PREDICTOR_FILE_NAME))
+
+        shutil.rmtree(target, ignore_errors=True)
+        os.rename(temp_dir, target)
+
+    def _remove_old_versions(self, version: str) -> None:
+        """
+        Keeps version and the one before it: workers still serving the previous
+        model may yet need to load its estimator. Mapped pages of removed
+        files stay valid for the workers that have them open.
+        """
+        keep = os.path.basename(self.version_dir(version))
+        others = sorted(
+            (path for path in (os.path.join(self.root_dir, name) for name in os.listdir(self.root_dir))
+             if os.path.isdir(path) and os.path.basename(path) != keep),
+            key=os.path.getmtime,
+        )
+        for path in others[:-1]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def load(self, version: str, download: Callable[[], ModelPredictor]) -> ModelPredictor:
+        """
+        The model for version, memory-mapped from the shared directory.
+        download() is called, by one worker only, when the version is not on disk yet.
+        """
+        if not self.has_version(version):
+            with open(os.path.join(self.root_dir, LOCK_FILE_NAME), "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    # another worker may have written it while we waited for the lock
+                    if not self.has_version(version):
+                        start = time.perf_counter()
+                        self._write(version, download())
+                        self._remove_old_versions(version)
+                        logger.info(
+                            f"Model version {version} written to shared store {self.root_dir} "
+                            f"in {time.perf_counter() - start:.3f}s"
+                        )
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        version_dir = self.version_dir(version)
+        bundle_file_path = os.path.join(version_dir, BUNDLE_FILE_NAME)
+        if os.path.exists(bundle_file_path):
+            return ModelBundle.load(bundle_file_path, mmap_mode="r")
+
+        model: ModelPredictor = joblib.load(os.path.join(version_dir, PREDICTOR_FILE_NAME), mmap_mode="r")
+        model.trained_model_object = LazyEstimator(os.path.join(version_dir, ESTIMATOR_FILE_NAME))
+        return model
+
+    def stats(self) -> dict:
+        versions = [name for name in os.listdir(self.root_dir) if os.path.isdir(os.path.join(self.root_dir, name))]
+        return {"root_dir": self.root_dir, "versions": sorted(versions)}
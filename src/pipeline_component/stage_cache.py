@@ -0,0 +1,244 @@
+# pipeline_component/stage_cache.py
+
+import dataclasses
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+import uuid
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from src.exception_component import MyException
+from src.logging_component import logger
+from src.utils_component.main_utils import save_object, load_object
+
+
+ARTIFACT_FILE_NAME = "artifact.pkl"
+SOURCE_DIR = "src"
+TEMP_DIR_PREFIX = ".tmp-"
+# temporary entry directories older than this were left behind by a crashed run
+STALE_TEMP_DIR_SECONDS = 3600
+
+
+def fingerprint_path(path: str) -> str:
+    """
+    sha256 of a file, or of every file under a directory (names and contents).
+    """
+    digest = hashlib.sha256()
+
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                digest.update(os.path.relpath(file_path, path).encode())
+                digest.update(fingerprint_path(file_path).encode())
+        return digest.hexdigest()
+
+    with open(path, "rb") as file_obj:
+        for block in iter(lambda: file_obj.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def code_fingerprint(source_dir: str = SOURCE_DIR) -> str:
+    """
+    Fingerprint of the pipeline source code; any code change invalidates every cached stage.
+    """
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(source_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".py"):
+                file_path = os.path.join(root, name)
+                digest.update(file_path.encode())
+                digest.update(fingerprint_path(file_path).encode())
+    return digest.hexdigest()
+
+
+def artifact_paths(artifact) -> list:
+    """
+    Existing files / directories referenced by an artifact dataclass (nested ones included).
+    """
+    paths = []
+    for field in dataclasses.fields(artifact):
+        value = getattr(artifact, field.name)
+        if dataclasses.is_dataclass(value):
+            paths.extend(artifact_paths(value))
+        elif isinstance(value, str) and value and os.path.exists(value):
+            paths.append(value)
+    return paths
+
+
+class StageCache:
+    """
+    Content-addressed cache of training pipeline stage artifacts.
+
+    A stage's key is a hash of everything it reads: the content of the upstream
+    artifact files, the config files it uses, its parameters and the code version.
+    Entries live in <cache_dir>/<stage>/<key>/ and hold a copy of the stage's
+    output files plus the artifact pointing at them, so a cached artifact stays
+    valid after the run directory that produced it is deleted.
+
+    Only the max_entries_per_stage most recently used entries of each stage are
+    kept; older ones are deleted after every put. The whole cache directory can
+    also be deleted at any time between runs, it is rebuilt on the next run.
+    """
+
+    def __init__(self, cache_dir: str, enabled: bool = True, max_entries_per_stage: Optional[int] = None):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.max_entries_per_stage = max_entries_per_stage
+        # DagExecutor runs independent stages on a thread pool
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def make_key(self, stage: str, input_paths: Iterable[str] = (), config_files: Iterable[str] = (),
+                 params: Optional[dict] = None) -> str:
+        try:
+            key = {
+                "stage": stage,
+                "inputs": [fingerprint_path(path) for path in input_paths],
+                "config_files": {path: fingerprint_path(path) for path in config_files},
+                "params": params or {},
+                "code": code_fingerprint(),
+            }
+            return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    def _entry_dir(self, stage: str, key: str) -> str:
+        return os.path.join(self.cache_dir, stage, key)
+
+    def get(self, stage: str, key: str):
+        """
+        The cached artifact for key, None on a miss.
+        """
+        if not self.enabled:
+            return None
+
+        entry_dir = self._entry_dir(stage, key)
+        artifact_file = os.path.join(entry_dir, ARTIFACT_FILE_NAME)
+        if not os.path.exists(artifact_file):
+            self._count(hit=False)
+            return None
+
+        try:
+            artifact = load_object(artifact_file)
+        except Exception as e:
+            logger.error(f"Ignoring unreadable cache entry {artifact_file}: {e}")
+            self._count(hit=False)
+            return None
+
+        if not all(os.path.exists(path) for path in artifact_paths(artifact)):
+            logger.error(f"Ignoring incomplete cache entry {artifact_file}")
+            self._count(hit=False)
+            return None
+
+        try:
+            # marks the entry as recently used for the retention limit
+            os.utime(entry_dir)
+        except OSError:
+            pass
+        self._count(hit=True)
+        return artifact
+
+    def _relocate(self, artifact, entry_dir: str, final_dir: str):
+        """
+        Copies the files of artifact into entry_dir and returns the artifact with
+        its paths rewritten to where they will live under final_dir.
+        """
+        changes = {}
+        for field in dataclasses.fields(artifact):
+            value = getattr(artifact, field.name)
+            if dataclasses.is_dataclass(value):
+                changes[field.name] = self._relocate(value, entry_dir, final_dir)
+            elif isinstance(value, str) and value and os.path.exists(value):
+                relative_path = os.path.join(field.name, os.path.basename(value.rstrip(os.sep)))
+                target = os.path.join(entry_dir, relative_path)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                if os.path.isdir(value):
+                    shutil.copytree(value, target)
+                else:
+                    shutil.copy2(value, target)
+                changes[field.name] = os.path.join(final_dir, relative_path)
+        return dataclasses.replace(artifact, **changes)
+
+    def put(self, stage: str, key: str, artifact):
+        """
+        Stores artifact under key and returns the cached copy.
+        The entry is assembled in a temporary directory and renamed into place,
+        so readers never see a half written entry.
+        """
+        if not self.enabled:
+            return artifact
+
+        final_dir = self._entry_dir(stage, key)
+        temp_dir = os.path.join(self.cache_dir, stage, f"{TEMP_DIR_PREFIX}{uuid.uuid4().hex}")
+        try:
+            cached_artifact = self._relocate(artifact, temp_dir, final_dir)
+            save_object(os.path.join(temp_dir, ARTIFACT_FILE_NAME), cached_artifact)
+            try:
+                os.rename(temp_dir, final_dir)
+            except OSError:
+                # another run stored the same key first; both copies are identical
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                cached = self.get(stage, key)
+                return cached if cached is not None else artifact
+            self._prune(stage, keep=key)
+            return cached_artifact
+
+        except Exception as e:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            logger.error(f"Could not cache {stage} artifact: {e}")
+            return artifact
+
+    def _prune(self, stage: str, keep: str) -> None:
+        """
+        Deletes the least recently used entries of stage beyond max_entries_per_stage,
+        and temporary directories left behind by crashed runs.
+        """
+        stage_dir = os.path.join(self.cache_dir, stage)
+        now = time.time()
+        entries = []
+        for name in os.listdir(stage_dir):
+            path = os.path.join(stage_dir, name)
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if name.startswith(TEMP_DIR_PREFIX):
+                if now - mtime > STALE_TEMP_DIR_SECONDS:
+                    shutil.rmtree(path, ignore_errors=True)
+            elif name != keep:
+                entries.append((mtime, path))
+
+        if self.max_entries_per_stage is None:
+            return
+        entries.sort(reverse=True)
+        # the entry just stored counts towards the limit
+        for _, path in entries[max(self.max_entries_per_stage - 1, 0):]:
+            logger.info(f"Removing old stage cache entry {path}")
+            shutil.rmtree(path, ignore_errors=True)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "cache_dir": self.cache_dir,
+            "max_entries_per_stage": self.max_entries_per_stage,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,160 @@
+# pipeline_component/training_job_runner.py
+
+import multiprocessing
+import queue
+import sys
+import threading
+import uuid
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from src.exception_component import MyException
+from src.logging_component import logger
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+@dataclass
+class TrainingJob:
+    job_id: str
+    status: str = "queued"  # queued / running / succeeded / failed
+    run_id: Optional[str] = None
+    resumed_from: Optional[str] = None
+    current_stage: Optional[str] = None
+    stages: Dict[str, str] = field(default_factory=dict)
+    submitted_at: str = field(default_factory=_now)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _run_training_job(events: multiprocessing.Queue, resume: Optional[str] = None) -> None:
+    """
+    Entry point of the training process. Runs the pipeline and streams
+    its run id and stage progress back to the parent through the events queue.
+    """
+    # imported here so the heavy training imports only happen in the child
+    from src.pipeline_component.training_pipeline import TrainingPipeline
+
+    try:
+        pipeline = TrainingPipeline(
+            progress_callback=lambda stage, status: events.put(("stage", stage, status))
+        )
+        events.put(("run", None, resume or pipeline.run_id))
+        pipeline.run_pipeline(resume=resume)
+        events.put(("succeeded", None, None))
+    except Exception as e:
+        events.put(("failed", None, str(e)))
+
+
+class TrainingJobRunner:
+    """
+    Runs TrainingPipeline in a separate process so training never blocks the
+    serving event loop. Only one job runs at a time; submitting while a job is
+    running returns that job instead of starting another.
+    """
+
+    def __init__(self):
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, TrainingJob] = {}
+        self._active_job_id: Optional[str] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    def submit(self, resume: Optional[str] = None) -> Tuple[dict, bool]:
+        """
+        Starts a training job, or resumes the run `resume` from its first incomplete stage.
+        Returns (job snapshot, created); created is False when an already running job is returned.
+        """
+        try:
+            with self._lock:
+                if self._active_job_id is not None:
+                    logger.info(f"Training job {self._active_job_id} already running, not starting another")
+                    return self._jobs[self._active_job_id].to_dict(), False
+
+                job = TrainingJob(job_id=uuid.uuid4().hex, resumed_from=resume)
+                events = self._context.Queue()
+                process = self._context.Process(
+                    target=_run_training_job,
+                    args=(events, resume),
+                    name=f"training-{job.job_id}",
+                )
+                process.start()
+
+                job.status = "running"
+                job.started_at = _now()
+                self._jobs[job.job_id] = job
+                self._active_job_id = job.job_id
+                self._process = process
+                snapshot = job.to_dict()
+
+            threading.Thread(
+                target=self._monitor,
+                args=(job, process, events),
+                name=f"training-monitor-{job.job_id}",
+                daemon=True,
+            ).start()
+
+            logger.info(f"Training job {job.job_id} started in process {process.pid}")
+            return snapshot, True
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    def _monitor(self, job: TrainingJob, process: multiprocessing.Process, events: multiprocessing.Queue) -> None:
+        """
+        Applies progress events from the training process until it finishes.
+        """
+        outcome = None
+        while outcome is None:
+            try:
+                kind, stage, detail = events.get(timeout=1.0)
+            except queue.Empty:
+                if not process.is_alive():
+                    outcome = ("failed", f"Training process exited with code {process.exitcode}")
+                continue
+
+            if kind == "stage":
+                with self._lock:
+                    job.stages[stage] = detail
+                    job.current_stage = stage
+            elif kind == "run":
+                with self._lock:
+                    job.run_id = detail
+            else:
+                outcome = (kind, detail)
+
+        process.join()
+
+        with self._lock:
+            job.status, job.error = outcome
+            job.finished_at = _now()
+            if self._active_job_id == job.job_id:
+                self._active_job_id = None
+                self._process = None
+
+        logger.info(f"Training job {job.job_id} finished with status {outcome[0]}")
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """
+        Snapshot of the job, taken under the lock the monitor thread updates it with.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job is not None else None
+
+    def shutdown(self) -> None:
+        """
+        Stops a running training process, e.g. when the app shuts down.
+        """
+        with self._lock:
+            process = self._process
+        if process is not None and process.is_alive():
+            logger.info("Terminating running training job")
+            process.terminate()
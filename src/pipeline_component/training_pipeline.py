@@ -1,10 +1,13 @@
 import sys
+import time
+import dataclasses
+from typing import Callable, Dict, List, Optional
 
 from src.Data_Ingestion_component import DataIngestion
 from src.Data_validation_component import DataValidation
 from src.Data_transformation_component import DataTransformation
 from src.Model_Trainer_component import ModelTrainer
-from src.Model_evaluation_component import ModelEvaluation
+from src.Model_evaluation_component import ModelEvaluation, NOT_FETCHED
 from src.Model_Pusher_component import ModelPusher
 
 from src.entity_component.config_entity import (
@@ -13,7 +16,10 @@ from src.entity_component.config_entity import (
     DataTransformationConfig,
     ModelTrainerConfig,
     ModelEvaluationConfig,
-    ModelPusherConfig
+    ModelPusherConfig,
+    StageCacheConfig,
+    for_run,
+    pipeline
 )
 
 from src.entity_component.artifact_entity import (
@@ -26,6 +32,10 @@ from src.entity_component.artifact_entity import (
     
 )
 
+from src.pipeline_component.stage_cache import StageCache, artifact_paths
+from src.pipeline_component.run_manifest import RunManifest
+from src.pipeline_component.dag_executor import DagExecutor, DagNode
+from src.constants_component import SCHEMA_FILE_PATH, MODEL_SCHEMA_FILE_PATH, PIPELINE_MAX_WORKERS
 from src.logging_component import logger
 from src.exception_component import MyException
 
@@ -37,18 +47,70 @@ class TrainingPipeline:
     - Takes config(s)
     - Consumes previous stage artifact(s)
     - Produces a new artifact
+
+    Validation, transformation and training are cached by content: when their
+    inputs, configs and the code are unchanged the stored artifact is reused.
+    Ingestion (MongoDB) and evaluation / pushing (the model in S3) depend on
+    external state and always run.
+
+    Every run keeps a manifest of its completed stage artifacts; a failed run
+    can be continued with run_pipeline(resume=<run_id>).
     """
 
-    def __init__(self):
+    STAGES = [
+        "data_ingestion",
+        "data_validation",
+        "data_transformation",
+        "model_trainer",
+        "model_evaluation",
+        "model_pusher",
+    ]
+
+    # stage -> stages whose artifacts it consumes
+    STAGE_DEPENDENCIES = {
+        "data_ingestion": [],
+        "data_validation": ["data_ingestion"],
+        "data_transformation": ["data_ingestion"],
+        "model_trainer": ["data_validation", "data_transformation"],
+        "model_evaluation": ["data_ingestion", "model_trainer"],
+        "model_pusher": ["model_evaluation"],
+    }
+
+    STAGE_ARTIFACTS = {
+        "data_ingestion": DataIngestionArtifact,
+        "data_validation": DataValidationArtifact,
+        "data_transformation": DataTransformationArtifact,
+        "model_trainer": ModelTrainerArtifact,
+        "model_evaluation": ModelEvaluationArtifact,
+        "model_pusher": ModelPusherArtifact,
+    }
+
+    def __init__(self, progress_callback: Optional[Callable[[str, str], None]] = None,
+                 max_workers: int = PIPELINE_MAX_WORKERS):
+        """
+        :param progress_callback: optional callable(stage, status) told when each
+                                  stage is running, completed, failed or skipped
+        :param max_workers: stages that may run at the same time; 1 runs them one by one
+        """
         try:
             logger.info("Initializing TrainingPipeline")
 
-            self.data_ingestion_config = DataIngestionConfig()
-            self.data_validation_config = DataValidationConfig()
-            self.data_transformation_config = DataTransformationConfig()
-            self.model_trainer_config = ModelTrainerConfig()
-            self.model_evaluation_config = ModelEvaluationConfig()
-            self.model_pusher_config = ModelPusherConfig()
+            self.progress_callback = progress_callback
+            self.max_workers = max_workers
+            self.stage_report: Dict[str, dict] = {}
+            self.critical_path: List[str] = []
+            self.run_manifest = RunManifest()
+            self.run_id = self.run_manifest.run_id
+            self._resuming = False
+            self._resumed_stages = set()
+            self._build_stage_configs(self.run_id)
+
+            stage_cache_config = StageCacheConfig()
+            self.stage_cache = StageCache(
+                stage_cache_config.cache_dir,
+                stage_cache_config.enabled,
+                stage_cache_config.max_entries_per_stage,
+            )
 
         except Exception as e:
             raise MyException(e, sys)
@@ -56,6 +118,18 @@ class TrainingPipeline:
 
 
 
+    def _build_stage_configs(self, run_id: str) -> None:
+        """
+        Stage configs writing into artifact/<run_id>, so the stages a resumed
+        run executes again write next to the artifacts it reuses.
+        """
+        self.data_ingestion_config = for_run(DataIngestionConfig(), run_id)
+        self.data_validation_config = for_run(DataValidationConfig(), run_id)
+        self.data_transformation_config = for_run(DataTransformationConfig(), run_id)
+        self.model_trainer_config = for_run(ModelTrainerConfig(), run_id)
+        self.model_evaluation_config = for_run(ModelEvaluationConfig(), run_id)
+        self.model_pusher_config = for_run(ModelPusherConfig(), run_id)
+
     def start_data_ingestion(self) -> DataIngestionArtifact:
         """
         Stage 1: Data Ingestion
@@ -139,14 +213,16 @@ class TrainingPipeline:
 
     
     def start_model_evaluation(self, data_ingestion_artifact: DataIngestionArtifact,
-                               model_trainer_artifact: ModelTrainerArtifact) -> ModelEvaluationArtifact:
+                               model_trainer_artifact: ModelTrainerArtifact,
+                               best_model=NOT_FETCHED) -> ModelEvaluationArtifact:
         """
         This method of TrainPipeline class is responsible for starting modle evaluation
         """
         try:
             model_evaluation = ModelEvaluation(model_eval_config=self.model_evaluation_config,
                                                data_ingestion_artifact=data_ingestion_artifact,
-                                               model_trainer_artifact=model_trainer_artifact)
+                                               model_trainer_artifact=model_trainer_artifact,
+                                               best_model=best_model)
             model_evaluation_artifact = model_evaluation.initiate_model_evaluation()
             return model_evaluation_artifact
         except Exception as e:
@@ -169,70 +245,206 @@ class TrainingPipeline:
         
 
         
-    def run_pipeline(self):
+    def _report(self, stage: str, status: str) -> None:
+        if self.progress_callback is not None:
+            try:
+                self.progress_callback(stage, status)
+            except Exception as e:
+                # progress reporting must never break a training run
+                logger.error(f"Progress callback failed for {stage}: {e}")
+
+    @staticmethod
+    def _config_params(config) -> dict:
         """
-        Runs the complete training pipeline sequentially.
+        Config values that affect a stage's output; paths into the run directory are left out.
         """
-        try:
-            logger.info("Training pipeline started")
-
-            # =========================
-            # Stage 1: Data Ingestion
-            # =========================
-            data_ingestion_artifact = self.start_data_ingestion()
+        return {
+            name: value for name, value in dataclasses.asdict(config).items()
+            if not (isinstance(value, str) and value.startswith(pipeline.artifact_dir))
+        }
 
-            # =========================
-            # Stage 2: Data Validation
-            # =========================
-            data_validation_artifact = self.start_data_validation(
-                data_ingestion_artifact=data_ingestion_artifact,
-                data_validation_config=self.data_validation_config,
+    def _run_stage(self, stage: str, stage_function, *args, cache_key: Optional[str] = None, **kwargs):
+        """
+        Runs one stage, reporting running / completed / failed (or cached) to the progress callback.
+        With a cache_key the stage is looked up in the stage cache first and stored after it ran.
+        When resuming, a stage the manifest records as completed is not run again
+        as long as every stage it depends on was reused too.
+        """
+        started = time.perf_counter()
+
+        if self._resuming and all(dep in self._resumed_stages for dep in self.STAGE_DEPENDENCIES[stage]):
+            artifact = self.run_manifest.completed_artifact(stage, self.STAGE_ARTIFACTS[stage])
+            if artifact is not None:
+                self._resumed_stages.add(stage)
+                self.stage_report[stage] = {"status": "resumed", "cache": "manifest", "seconds": 0.0}
+                logger.info(f"Stage {stage}: completed in run {self.run_id}, reusing {artifact}")
+                self._report(stage, "resumed")
+                return artifact
+            # this stage and everything downstream of it run again
+            logger.info(f"Resuming run {self.run_id} from stage {stage}")
+
+        cache_status = "disabled" if cache_key is None or not self.stage_cache.enabled else "miss"
+
+        if cache_status == "miss":
+            artifact = self.stage_cache.get(stage, cache_key)
+            if artifact is not None:
+                self.stage_report[stage] = {
+                    "status": "cached", "cache": "hit", "seconds": round(time.perf_counter() - started, 3)
+                }
+                logger.info(f"Stage {stage}: cache hit ({cache_key[:12]}), reusing {artifact}")
+                self.run_manifest.record(stage, "completed", artifact=artifact)
+                self._report(stage, "cached")
+                return artifact
+
+        self._report(stage, "running")
+        try:
+            artifact = stage_function(*args, **kwargs)
+        except Exception as e:
+            self.stage_report[stage] = {
+                "status": "failed", "cache": cache_status, "seconds": round(time.perf_counter() - started, 3)
+            }
+            self.run_manifest.record(stage, "failed", error=str(e))
+            self._report(stage, "failed")
+            raise
+
+        if cache_status == "miss":
+            artifact = self.stage_cache.put(stage, cache_key, artifact)
+
+        self.stage_report[stage] = {
+            "status": "completed", "cache": cache_status, "seconds": round(time.perf_counter() - started, 3)
+        }
+        self.run_manifest.record(stage, "completed", artifact=artifact)
+        self._report(stage, "completed")
+        return artifact
+
+    def _log_stage_report(self) -> None:
+        for stage in self.STAGES:
+            report = self.stage_report.get(stage)
+            if report is None:
+                continue
+            logger.info(f"Stage {stage:<20} {report['status']:<10} cache={report['cache']:<8} {report['seconds']}s")
+
+    def _validate(self, results: dict) -> DataValidationArtifact:
+        data_ingestion_artifact = results["data_ingestion"]
+        data_validation_artifact = self._run_stage(
+            "data_validation",
+            self.start_data_validation,
+            data_ingestion_artifact=data_ingestion_artifact,
+            data_validation_config=self.data_validation_config,
+            cache_key=self.stage_cache.make_key(
+                "data_validation",
+                input_paths=artifact_paths(data_ingestion_artifact),
+                config_files=[SCHEMA_FILE_PATH],
+            ),
+        )
+
+        if not data_validation_artifact.validation_status:
+            raise Exception(
+                f"Data validation failed: {data_validation_artifact.message}"
             )
-           
-
-            if not data_validation_artifact.validation_status:
-                raise Exception(
-                    f"Data validation failed: {data_validation_artifact.message}"
-                )
-            
-
-            #================================
-            # Stage 3: Data Transformation
-            #=================================
-
-            data_transformation_artifact = self.start_data_transformation(data_ingestion_artifact)
-
-
-
-            # ==================================
-            # stage 4  : Model trainer
-            # ==================================
-
-            model_trainer_artifact = self.start_model_trainer(data_transformation_artifact)
-
-            # ==================================
-            # Model Evaluation 
-            # ====================================
-
-            
-            model_evaluation_artifact = self.start_model_evaluation(data_ingestion_artifact=data_ingestion_artifact,
-                                                                    model_trainer_artifact=model_trainer_artifact)
-            
-            
-              
-            if not model_evaluation_artifact.is_model_accepted:
-                logger.info(f"Model not accepted.")
-                return None
-            
-
-            model_pusher_artifact = self.start_model_pusher(model_evaluation_artifact=model_evaluation_artifact)
-
-
-            logger.info(f"Pipeline completed successfully.")
-
-            
-        
-
+        return data_validation_artifact
+
+    def _transform(self, results: dict) -> DataTransformationArtifact:
+        data_ingestion_artifact = results["data_ingestion"]
+        return self._run_stage(
+            "data_transformation",
+            self.start_data_transformation,
+            data_ingestion_artifact,
+            cache_key=self.stage_cache.make_key(
+                "data_transformation",
+                input_paths=artifact_paths(data_ingestion_artifact),
+                config_files=[SCHEMA_FILE_PATH],
+            ),
+        )
+
+    def _train(self, results: dict) -> ModelTrainerArtifact:
+        data_transformation_artifact = results["data_transformation"]
+        return self._run_stage(
+            "model_trainer",
+            self.start_model_trainer,
+            data_transformation_artifact,
+            cache_key=self.stage_cache.make_key(
+                "model_trainer",
+                input_paths=artifact_paths(data_transformation_artifact),
+                config_files=[MODEL_SCHEMA_FILE_PATH],
+                params=self._config_params(self.model_trainer_config),
+            ),
+        )
+
+    def _prefetch_best_model(self, results: dict):
+        """
+        Downloads the production model while the trainer is still fitting.
+        """
+        if self._resuming and self.run_manifest.completed_artifact(
+                "model_evaluation", self.STAGE_ARTIFACTS["model_evaluation"]) is not None:
+            return NOT_FETCHED
+        return ModelEvaluation.fetch_best_model(self.model_evaluation_config)
+
+    def _evaluate(self, results: dict) -> ModelEvaluationArtifact:
+        return self._run_stage(
+            "model_evaluation",
+            self.start_model_evaluation,
+            data_ingestion_artifact=results["data_ingestion"],
+            model_trainer_artifact=results["model_trainer"],
+            best_model=results["best_model_prefetch"],
+        )
+
+    def _push(self, results: dict) -> Optional[ModelPusherArtifact]:
+        model_evaluation_artifact = results["model_evaluation"]
+        if not model_evaluation_artifact.is_model_accepted:
+            logger.info(f"Model not accepted.")
+            self.run_manifest.record("model_pusher", "skipped")
+            self._report("model_pusher", "skipped")
+            return None
+
+        return self._run_stage(
+            "model_pusher", self.start_model_pusher, model_evaluation_artifact=model_evaluation_artifact
+        )
+
+    def build_dag(self) -> List[DagNode]:
+        """
+        The pipeline as a DAG. Validation and transformation both only need the
+        ingested data and run side by side; the production model is fetched from
+        S3 while training runs.
+        """
+        return [
+            DagNode("data_ingestion", lambda results: self._run_stage("data_ingestion", self.start_data_ingestion)),
+            DagNode("data_validation", self._validate, self.STAGE_DEPENDENCIES["data_validation"]),
+            DagNode("data_transformation", self._transform, self.STAGE_DEPENDENCIES["data_transformation"]),
+            DagNode("model_trainer", self._train, self.STAGE_DEPENDENCIES["model_trainer"]),
+            DagNode("best_model_prefetch", self._prefetch_best_model),
+            DagNode("model_evaluation", self._evaluate,
+                    self.STAGE_DEPENDENCIES["model_evaluation"] + ["best_model_prefetch"]),
+            DagNode("model_pusher", self._push, self.STAGE_DEPENDENCIES["model_pusher"]),
+        ]
+
+    def run_pipeline(self, resume: Optional[str] = None):
+        """
+        Runs the complete training pipeline, independent stages concurrently.
+        The first failing stage stops the run: nothing new is started and its error is raised.
+        resume: run_id (the artifact/<run_id> directory name) of an earlier run to
+                continue from its first incomplete stage
+        """
+        try:
+            self.stage_report = {}
+            self._resumed_stages = set()
+            if resume is not None:
+                self.run_manifest = RunManifest.load(resume)
+                self._resuming = True
+            else:
+                self.run_manifest = RunManifest()
+                self._resuming = False
+            self.run_id = self.run_manifest.run_id
+            self._build_stage_configs(self.run_id)
+
+            logger.info(f"Training pipeline started, run_id: {self.run_id}")
+
+            dag_executor = DagExecutor(max_workers=self.max_workers)
+            try:
+                dag_executor.run(self.build_dag())
+            finally:
+                self.critical_path = dag_executor.critical_path
+                self._log_stage_report()
 
             logger.info("Training pipeline completed successfully")
 
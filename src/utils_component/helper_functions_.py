@@ -1,3 +1,12 @@
+import re
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.constants_component import FEATURE_CACHE_SIZE
+
 
 def categorize_cpu(cpu):
     cpu = str(cpu).lower()  # Convert to lowercase for consistency
@@ -15,19 +24,42 @@ def categorize_cpu(cpu):
 
 
 
+STORAGE_TYPES = ("ssd", "hdd", "flash", "hybrid")
+
+# "128GB SSD", "1.0TB Hybrid", "64GB Flash Storage" ... one match per storage device
+MEMORY_PART_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(gb|tb)\s+(ssd|hdd|flash|hybrid)")
+
+
+def parse_memory(memory) -> Tuple[int, int, int, int]:
+    """
+    Parses a Memory string in a single pass and returns the
+    (SSD, HDD, Flash_Storage, Hybrid) capacities in GB.
+    Compound strings add up, e.g. "256GB SSD +  256GB SSD" -> 512 SSD,
+    and decimal TB values are converted, e.g. "1.0TB Hybrid" -> 1000.
+    """
+    capacities = [0, 0, 0, 0]
+    for value, unit, storage_type in MEMORY_PART_PATTERN.findall(str(memory).lower()):
+        size = float(value) * (1000 if unit == "tb" else 1)
+        capacities[STORAGE_TYPES.index(storage_type)] += int(round(size))
+    return tuple(capacities)
+
+
+def parse_memory_column(memory: Iterable) -> np.ndarray:
+    """
+    Parses a whole Memory column into an (n_rows, 4) int64 matrix
+    with the SSD, HDD, Flash_Storage and Hybrid capacities.
+    Each distinct string is parsed once; missing values give zeros.
+    """
+    codes, uniques = pd.factorize(np.asarray(memory, dtype=object))
+    parsed = np.zeros((len(uniques) + 1, len(STORAGE_TYPES)), dtype=np.int64)
+    for i, value in enumerate(uniques):
+        parsed[i] = parse_memory(value)
+    return parsed[codes]  # code -1 (missing) picks the trailing row of zeros
+
+
 # Function to extract memory values
 def extract_memory(memory, storage_type):
-    memory = memory.lower()  # Convert to lowercase for consistency
-    if storage_type in memory:
-        # Extract the numeric value before the storage type
-        parts = memory.split()
-        for i, part in enumerate(parts):
-            if storage_type in part:
-                try:
-                    return int(parts[i-1].replace('gb', '').replace('tb', '000'))  # Convert TB to GB
-                except:
-                    return 0
-    return 0
+    return parse_memory(memory)[STORAGE_TYPES.index(storage_type)]
 
 
 
@@ -60,3 +92,61 @@ def categorize_opsys(ops):
         return "other"
 
 
+
+# "... 1920x1080": digits right before the first "x"
+RESOLUTION_WIDTH_PATTERN = re.compile(r"(\d+)$")
+
+
+def parse_screen_resolution(screen) -> Tuple[int, int, int, int]:
+    """
+    Returns (Touchscreen, IPS, X_res, Y_res) for a ScreenResolution string,
+    e.g. "IPS Panel Full HD 1920x1080" -> (0, 1, 1920, 1080).
+    """
+    before, _, after = screen.partition('x')
+    width = RESOLUTION_WIDTH_PATTERN.search(before)
+    if width is None:
+        raise ValueError(f"Could not read the resolution from {screen!r}")
+    return (
+        int('Touchscreen' in screen),
+        int('IPS' in screen),
+        int(width.group(1)),
+        int(after.split('x')[0]),
+    )
+
+
+# ----------------------------------------------------------------------
+# Memoized versions for the serving path. The same few dozen CPU / GPU /
+# screen / memory strings come back request after request.
+# ----------------------------------------------------------------------
+cached_categorize_cpu = lru_cache(maxsize=FEATURE_CACHE_SIZE)(categorize_cpu)
+cached_categorize_gpu = lru_cache(maxsize=FEATURE_CACHE_SIZE)(categorize_gpu)
+cached_categorize_opsys = lru_cache(maxsize=FEATURE_CACHE_SIZE)(categorize_opsys)
+cached_parse_screen_resolution = lru_cache(maxsize=FEATURE_CACHE_SIZE)(parse_screen_resolution)
+cached_parse_memory = lru_cache(maxsize=FEATURE_CACHE_SIZE)(parse_memory)
+
+CACHED_HELPERS = {
+    "categorize_cpu": cached_categorize_cpu,
+    "categorize_gpu": cached_categorize_gpu,
+    "categorize_opsys": cached_categorize_opsys,
+    "parse_screen_resolution": cached_parse_screen_resolution,
+    "parse_memory": cached_parse_memory,
+}
+
+
+def feature_cache_stats() -> dict:
+    """
+    Hits, misses and hit rate of each memoized helper.
+    """
+    stats = {}
+    for name, helper in CACHED_HELPERS.items():
+        info = helper.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+            "hit_rate": round(info.hits / lookups, 4) if lookups else None,
+        }
+    return stats
+
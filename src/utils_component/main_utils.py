@@ -1,9 +1,11 @@
 import os
+import shutil
 import sys
 
 import numpy as np
 import dill
 import yaml
+import pandas as pd
 from pandas import DataFrame
 
 
@@ -116,4 +118,116 @@ def drop_columns(df: DataFrame, cols: list)-> DataFrame:
         
         return df
     except Exception as e:
-        raise MyException(e, sys) from e
\ No newline at end of file
+        raise MyException(e, sys) from e
+
+
+
+# ----------------------------------------------------------------------
+# Feature store I/O. The format follows the file extension:
+# .parquet (a file, or a directory of part files), .arrow / .feather, .csv
+# ----------------------------------------------------------------------
+def get_file_format(file_path: str) -> str:
+    extension = os.path.splitext(file_path.rstrip(os.sep))[1].lstrip(".").lower()
+    return "arrow" if extension == "feather" else extension
+
+
+
+def save_dataframe(file_path: str, df: DataFrame) -> None:
+    """
+    Save a DataFrame in the typed columnar format given by the extension.
+    Parquet and Arrow keep dtypes (including categoricals); CSV is kept for exports.
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        file_format = get_file_format(file_path)
+
+        if file_format == "parquet":
+            df.to_parquet(file_path, index=False)
+        elif file_format == "arrow":
+            df.reset_index(drop=True).to_feather(file_path)
+        elif file_format == "csv":
+            df.to_csv(file_path, index=False, header=True)
+        else:
+            raise ValueError(f"Unsupported data file format: {file_path}")
+
+    except Exception as e:
+        raise MyException(e, sys) from e
+
+
+
+def load_dataframe(file_path: str, columns: list = None) -> DataFrame:
+    """
+    Load a DataFrame saved by save_dataframe / append_dataframe.
+    columns: optional projection; with Parquet / Arrow only those columns are read from disk.
+    """
+    try:
+        file_format = get_file_format(file_path)
+
+        if file_format == "parquet":
+            return pd.read_parquet(file_path, columns=columns)
+        elif file_format == "arrow":
+            return pd.read_feather(file_path, columns=columns)
+        elif file_format == "csv":
+            return pd.read_csv(file_path, usecols=columns)
+        else:
+            raise ValueError(f"Unsupported data file format: {file_path}")
+
+    except Exception as e:
+        raise MyException(e, sys) from e
+
+
+
+def load_dataframe_schema(file_path: str) -> DataFrame:
+    """
+    Empty DataFrame with the stored columns and dtypes, read without loading any rows.
+    CSV has no stored dtypes, so its columns come back as object.
+    """
+    try:
+        file_format = get_file_format(file_path)
+
+        if file_format == "parquet":
+            import pyarrow.dataset as ds
+            return ds.dataset(file_path, format="parquet").schema.empty_table().to_pandas()
+        elif file_format == "csv":
+            return pd.read_csv(file_path, nrows=0, dtype=object)
+        else:
+            return load_dataframe(file_path).head(0)
+
+    except Exception as e:
+        raise MyException(e, sys) from e
+
+
+
+def append_dataframe(dataset_path: str, df: DataFrame) -> None:
+    """
+    Append rows to a dataset without rewriting it.
+    Parquet datasets are directories and get one new part file per call; CSV files are appended to.
+    Arrow files cannot be appended to in place and are rewritten.
+    """
+    try:
+        file_format = get_file_format(dataset_path)
+
+        if file_format == "parquet":
+            os.makedirs(dataset_path, exist_ok=True)
+            part_number = len([name for name in os.listdir(dataset_path) if name.endswith(".parquet")])
+            df.to_parquet(os.path.join(dataset_path, f"part-{part_number:05d}.parquet"), index=False)
+        elif file_format == "csv":
+            os.makedirs(os.path.dirname(dataset_path), exist_ok=True)
+            df.to_csv(dataset_path, mode="a", index=False, header=not os.path.exists(dataset_path))
+        elif file_format == "arrow":
+            if os.path.exists(dataset_path):
+                df = pd.concat([load_dataframe(dataset_path), df], ignore_index=True)
+            save_dataframe(dataset_path, df)
+        else:
+            raise ValueError(f"Appending is not supported for {dataset_path}")
+
+    except Exception as e:
+        raise MyException(e, sys) from e
+
+
+
+def remove_dataset(dataset_path: str) -> None:
+    if os.path.isdir(dataset_path):
+        shutil.rmtree(dataset_path)
+    elif os.path.exists(dataset_path):
+        os.remove(dataset_path)
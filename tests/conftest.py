@@ -0,0 +1,13 @@
+import pandas as pd
+import pytest
+
+
+LAPTOP_DATA_FILE_PATH = "Notebook_experiments/laptop_data.csv"
+
+
+@pytest.fixture(scope="session")
+def laptop_data() -> pd.DataFrame:
+    """
+    The raw laptop dataset, with the schema columns only.
+    """
+    return pd.read_csv(LAPTOP_DATA_FILE_PATH).drop(columns=["Unnamed: 0"])
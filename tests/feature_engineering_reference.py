@@ -0,0 +1,56 @@
+"""
+The row-by-row feature engineering of laptop.ipynb, as DataTransformation ran
+it before it was vectorized: one .apply per derived column, a copy after every
+drop. Kept as the reference FeatureEngineering is checked and benchmarked against.
+Memory goes through extract_memory, whose parsing was fixed separately (user-005).
+"""
+
+from pandas import DataFrame
+
+from src.utils_component.helper_functions_ import (
+    categorize_cpu,
+    categorize_gpu,
+    categorize_opsys,
+    extract_memory,
+)
+
+
+def reference_feature_engineering(data: DataFrame, columns: list, training: bool) -> DataFrame:
+    data = data.copy()
+
+    data['Ram'] = data['Ram'].str.replace('GB', '', regex=False).astype(int)
+    data['Weight'] = data['Weight'].str.replace('kg', '', regex=False).astype(float)
+
+    if training:
+        q1 = data['Price'].quantile(0.25)
+        q3 = data['Price'].quantile(0.75)
+        iqr = q3 - q1
+        data = data[(data['Price'] >= q1 - 1.5 * iqr) & (data['Price'] <= q3 + 1.5 * iqr)]
+
+    data['Touchscreen'] = data['ScreenResolution'].apply(lambda x: 1 if 'Touchscreen' in x else 0)
+    data['IPS'] = data['ScreenResolution'].apply(lambda x: 1 if 'IPS' in x else 0)
+
+    res = data['ScreenResolution'].str.split('x', expand=True)
+    data['X_res'] = res[0].str.extract(r'(\d+)$').astype(int)
+    data['Y_res'] = res[1].astype(int)
+    data['ppi'] = ((data['X_res'] ** 2 + data['Y_res'] ** 2) ** 0.5) / data['Inches']
+    data = data.drop(columns=['ScreenResolution', 'X_res', 'Y_res', 'Inches'])
+
+    data['Cpu_Category'] = data['Cpu'].apply(categorize_cpu)
+    data = data.drop(columns=['Cpu'])
+
+    data['SSD'] = data['Memory'].apply(lambda x: extract_memory(x, 'ssd'))
+    data['HDD'] = data['Memory'].apply(lambda x: extract_memory(x, 'hdd'))
+    data['Flash_Storage'] = data['Memory'].apply(lambda x: extract_memory(x, 'flash'))
+    data['Hybrid'] = data['Memory'].apply(lambda x: extract_memory(x, 'hybrid'))
+    data = data.drop(columns=['Memory'])
+
+    data['Gpu_category'] = data['Gpu'].apply(categorize_gpu)
+    if training:
+        data = data[data['Gpu_category'] != 'other']
+    data = data.drop(columns=['Gpu'])
+
+    data['categorize_opsys'] = data['OpSys'].apply(categorize_opsys)
+    data = data.drop(columns=['OpSys'])
+
+    return data[columns].reset_index(drop=True)
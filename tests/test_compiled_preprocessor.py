@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import MinMaxScaler
+
+from src.Data_transformation_component import DataTransformation
+from src.entity_component.compiled_preprocessor import CompiledPreprocessor
+from src.entity_component.estimator import ModelPredictor
+from src.pipeline_component.prediction_pipeline import LaptopData
+
+
+def fit_preprocessor(laptop_data, sparse_threshold=0.3, handle_unknown="ignore") -> ColumnTransformer:
+    preprocessor = DataTransformation(None, None).get_data_transformer_object()
+    preprocessor.set_params(sparse_threshold=sparse_threshold, cat__onehot__handle_unknown=handle_unknown)
+    train = DataTransformation.apply_custom_feature_engineering(laptop_data)
+    return preprocessor.fit(train.drop(columns=DataTransformation.schema["target_column"]))
+
+
+def to_dense(matrix) -> np.ndarray:
+    return matrix.toarray() if sparse.issparse(matrix) else matrix
+
+
+@pytest.fixture(scope="module")
+def laptops(laptop_data):
+    records = laptop_data.drop(columns=["Price"]).to_dict("records")
+    # unseen at training time: "other" GPUs are dropped from the training rows
+    records += [
+        {**records[0], "Gpu": "Matrox G200"},
+        {**records[1], "Company": "Acme", "TypeName": "Tablet", "OpSys": "Haiku"},
+    ]
+    return [LaptopData.from_record(record) for record in records]
+
+
+@pytest.fixture(scope="module")
+def engineered(laptops):
+    return ModelPredictor(None, None).prepare_features(LaptopData.to_data_frame(laptops))
+
+
+@pytest.mark.parametrize("sparse_threshold", [0.0, 1.0])
+def test_matches_column_transformer(laptop_data, laptops, engineered, sparse_threshold):
+    preprocessor = fit_preprocessor(laptop_data, sparse_threshold=sparse_threshold)
+    compiled = CompiledPreprocessor(preprocessor)
+    expected = preprocessor.transform(engineered)
+
+    assert compiled.sparse_output == sparse.issparse(expected)
+
+    batch = compiled.transform(engineered)
+    assert sparse.issparse(batch) == sparse.issparse(expected)
+    assert np.array_equal(to_dense(batch), to_dense(expected))
+
+    rows = np.vstack([compiled.transform_record(laptop) for laptop in laptops])
+    assert np.array_equal(rows, to_dense(expected))
+
+
+def test_unseen_categories_are_ignored(laptop_data, laptops, engineered):
+    preprocessor = fit_preprocessor(laptop_data)
+    compiled = CompiledPreprocessor(preprocessor)
+    unseen = laptops[-2:]
+
+    expected = to_dense(preprocessor.transform(engineered.iloc[-2:]))
+    rows = np.vstack([compiled.transform_record(laptop) for laptop in unseen])
+    assert np.array_equal(rows, expected)
+    # the "other" GPU sets none of the Gpu_category outputs
+    assert rows[0].sum() < to_dense(preprocessor.transform(engineered.iloc[:1])).sum()
+
+
+def test_unseen_categories_raise_with_handle_unknown_error(laptop_data, laptops, engineered):
+    preprocessor = fit_preprocessor(laptop_data, handle_unknown="error")
+    compiled = CompiledPreprocessor(preprocessor)
+    unseen = engineered.iloc[-2:]
+
+    with pytest.raises(ValueError):
+        preprocessor.transform(unseen)
+    with pytest.raises(ValueError):
+        compiled.transform(unseen)
+    with pytest.raises(ValueError):
+        compiled.transform_record(laptops[-2])
+
+
+def test_state_round_trip(laptop_data, laptops, engineered):
+    compiled = CompiledPreprocessor(fit_preprocessor(laptop_data))
+    restored = CompiledPreprocessor.from_state(compiled.state(), mean=compiled.mean, scale=compiled.scale)
+
+    assert np.array_equal(to_dense(restored.transform(engineered)), to_dense(compiled.transform(engineered)))
+    assert np.array_equal(restored.transform_record(laptops[0]), compiled.transform_record(laptops[0]))
+
+
+def test_rejects_transformers_it_cannot_reproduce(laptop_data):
+    train = DataTransformation.apply_custom_feature_engineering(laptop_data)
+    numerical = DataTransformation.schema["numerical_features"]
+    preprocessor = ColumnTransformer([("num", MinMaxScaler(), numerical)]).fit(train)
+
+    with pytest.raises(ValueError):
+        CompiledPreprocessor(preprocessor)
+    with pytest.raises(ValueError):
+        CompiledPreprocessor(MinMaxScaler().fit(train[numerical]))
@@ -0,0 +1,22 @@
+import os
+
+from src.entity_component.config_entity import DataIngestionConfig, ModelTrainerConfig, for_run, pipeline
+
+
+RUN_ID = "01-01-2020_00_00_00"
+RUN_DIR = os.path.join(pipeline.artifact_dir, RUN_ID)
+
+
+def test_for_run_moves_run_directory_paths_only():
+    config = for_run(DataIngestionConfig(), RUN_ID)
+
+    assert config.data_ingestion_dir_name.startswith(RUN_DIR + os.sep)
+    assert config.training_file_path.startswith(RUN_DIR + os.sep)
+    assert config.test_file_path.startswith(RUN_DIR + os.sep)
+    # the feature store is shared by every run
+    assert config.data_ingestion_feature_store_file == DataIngestionConfig().data_ingestion_feature_store_file
+
+    trainer_config = for_run(ModelTrainerConfig(), RUN_ID)
+    assert trainer_config.trained_model_file_path.startswith(RUN_DIR + os.sep)
+    assert trainer_config.model_config_file_path == ModelTrainerConfig().model_config_file_path
+
@@ -0,0 +1,58 @@
+import os
+
+import mongomock
+import pytest
+
+from src.constants_component import COLLECTION_NAME, DATABASE_NAME
+from src.Data_Ingestion_component import DataIngestion
+from src.entity_component.config_entity import DataIngestionConfig
+from src.utils_component.main_utils import read_yaml_file, remove_dataset
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = DataIngestionConfig()
+    store_dir = tmp_path / "feature_store"
+    config.data_ingestion_feature_store_dir = str(store_dir)
+    config.data_ingestion_feature_store_file = str(store_dir / os.path.basename(config.data_ingestion_feature_store_file))
+    config.data_ingestion_watermark_file = str(store_dir / os.path.basename(config.data_ingestion_watermark_file))
+    config.incremental_ingestion = True
+    return config
+
+
+@pytest.fixture
+def collection():
+    return mongomock.MongoClient()[DATABASE_NAME][COLLECTION_NAME]
+
+
+def insert(collection, prices):
+    collection.insert_many([{"Company": "HP", "Price": float(price)} for price in prices])
+
+
+def test_wiped_feature_store_is_rebuilt_despite_the_watermark(config, collection):
+    ingestion = DataIngestion(config, mongo_client=collection.database.client)
+    insert(collection, [1, 2, 3])
+    assert len(ingestion.import_data_and_put_into_feature_store()) == 3
+
+    remove_dataset(config.data_ingestion_feature_store_file)
+    assert os.path.exists(config.data_ingestion_watermark_file)
+
+    # nothing new in the collection: the store is rebuilt instead of failing
+    assert len(ingestion.import_data_and_put_into_feature_store()) == 3
+
+    remove_dataset(config.data_ingestion_feature_store_file)
+    insert(collection, [4])
+    data = ingestion.import_data_and_put_into_feature_store()
+    assert sorted(data["Price"]) == [1.0, 2.0, 3.0, 4.0]
+
+    last_id = str(collection.find_one(sort=[("_id", -1)])["_id"])
+    assert read_yaml_file(config.data_ingestion_watermark_file)["last_id"] == last_id
+
+
+def test_incremental_run_appends_only_new_documents(config, collection):
+    ingestion = DataIngestion(config, mongo_client=collection.database.client)
+    insert(collection, [1, 2])
+    ingestion.import_data_and_put_into_feature_store()
+
+    insert(collection, [3])
+    assert sorted(ingestion.import_data_and_put_into_feature_store()["Price"]) == [1.0, 2.0, 3.0]
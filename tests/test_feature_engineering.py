@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.Data_transformation_component import DataTransformation
+from src.Data_transformation_component.FeatureEngineeringModule import FeatureEngineering, SCALAR_PATH_MAX_ROWS
+from src.pipeline_component.prediction_pipeline import LaptopData
+from tests.feature_engineering_reference import reference_feature_engineering
+
+
+TRAINING_COLUMNS = DataTransformation.schema["columns_after_transformation"]
+PREDICTION_COLUMNS = DataTransformation.schema["columns_after_transformation_for_prediction"]
+
+
+def in_chunks(data: pd.DataFrame, size: int) -> pd.DataFrame:
+    """
+    transform() applied chunk by chunk, so every chunk takes the path its size selects.
+    """
+    return pd.concat(
+        [
+            FeatureEngineering.transform(data.iloc[start:start + size], columns=PREDICTION_COLUMNS, training=False)
+            for start in range(0, len(data), size)
+        ],
+        ignore_index=True,
+    )
+
+
+def test_training_matches_reference(laptop_data):
+    expected = reference_feature_engineering(laptop_data, TRAINING_COLUMNS, training=True)
+    actual = DataTransformation.apply_custom_feature_engineering(laptop_data)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_prediction_matches_reference(laptop_data):
+    data = laptop_data.drop(columns=["Price"])
+    expected = reference_feature_engineering(data, PREDICTION_COLUMNS, training=False)
+    actual = DataTransformation.feature_engineering_for_prediction(data)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize("chunk_size", [1, SCALAR_PATH_MAX_ROWS, SCALAR_PATH_MAX_ROWS + 1])
+def test_scalar_and_vectorized_paths_agree(laptop_data, chunk_size):
+    """
+    Chunks up to SCALAR_PATH_MAX_ROWS go through the memoized scalar helpers,
+    larger ones through the vectorized kernels; both give the reference values.
+    """
+    data = laptop_data.drop(columns=["Price"])
+    expected = reference_feature_engineering(data, PREDICTION_COLUMNS, training=False)
+    pd.testing.assert_frame_equal(in_chunks(data, chunk_size), expected)
+
+
+def test_transform_record_matches_reference(laptop_data):
+    data = laptop_data.drop(columns=["Price"])
+    expected = reference_feature_engineering(data, PREDICTION_COLUMNS, training=False)
+
+    for index, record in enumerate(data.to_dict("records")):
+        engineered = FeatureEngineering.transform_record(LaptopData.from_record(record))
+        row = expected.iloc[index]
+        for column in PREDICTION_COLUMNS:
+            assert engineered[column] == row[column], (index, column)
+
+
+def test_unknown_strings_fall_back_to_other(laptop_data):
+    data = laptop_data.drop(columns=["Price"]).head(SCALAR_PATH_MAX_ROWS + 4).copy()
+    data.loc[:, "Cpu"] = "Apple M1"
+    data.loc[:, "Gpu"] = "Matrox G200"
+    data.loc[:, "OpSys"] = "Haiku"
+    data.loc[:, "Memory"] = "no drive"
+
+    for chunk_size in (1, len(data)):
+        frame = in_chunks(data, chunk_size)
+        assert (frame["Cpu_Category"] == 4).all()
+        assert (frame["Gpu_category"] == "other").all()
+        assert (frame["categorize_opsys"] == "other").all()
+        assert np.all(frame[["SSD", "HDD", "Flash_Storage", "Hybrid"]].to_numpy() == 0)
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.tree import DecisionTreeRegressor
+
+from src.entity_component.flat_forest import FlatForest
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(400, 8))
+    # a few one-hot style columns, like the ColumnTransformer output
+    X[:, 5:] = rng.random((400, 3)) > 0.7
+    y = X[:, 0] * 3 + np.sin(X[:, 1]) + X[:, 5] + rng.normal(scale=0.1, size=400)
+    return X, y
+
+
+def assert_same_predictions(model, X):
+    flat = FlatForest.from_estimator(model)
+    assert np.array_equal(flat.predict(X), model.predict(X))
+
+
+@pytest.mark.parametrize("model", [
+    RandomForestRegressor(n_estimators=25, random_state=0),
+    RandomForestRegressor(n_estimators=10, max_depth=3, random_state=0),
+    ExtraTreesRegressor(n_estimators=25, random_state=0),
+    DecisionTreeRegressor(random_state=0),
+    DecisionTreeRegressor(max_depth=1, random_state=0),
+])
+def test_predictions_match_estimator(model, data):
+    X, y = data
+    model.fit(X, y)
+    rng = np.random.default_rng(1)
+    assert_same_predictions(model, X)
+    assert_same_predictions(model, rng.normal(size=(300, X.shape[1])))
+    assert_same_predictions(model, X[:1])
+
+
+def test_single_leaf_tree(data):
+    X, _ = data
+    model = DecisionTreeRegressor().fit(X, np.full(len(X), 2.5))
+    flat = FlatForest.from_estimator(model)
+    assert flat.n_nodes == 1 and flat.max_depth == 0
+    assert np.array_equal(flat.predict(X), model.predict(X))
+
+
+def test_trees_of_different_depths(data):
+    X, y = data
+    # few rows and one feature per split give trees of different depths; rows stop at shallow leaves early
+    model = RandomForestRegressor(n_estimators=30, max_features=1, random_state=0).fit(X[:60], y[:60])
+    depths = {estimator.tree_.max_depth for estimator in model.estimators_}
+    assert len(depths) > 1
+    assert_same_predictions(model, X)
+
+
+def test_inputs_on_and_next_to_thresholds(data):
+    X, y = data
+    model = RandomForestRegressor(n_estimators=20, random_state=0).fit(X, y)
+    flat = FlatForest.from_estimator(model)
+
+    # every split threshold, exactly and one float32 step to either side, in its own feature
+    internal = flat.left != np.arange(flat.n_nodes)
+    features, thresholds = flat.feature[internal], flat.threshold[internal]
+    values = thresholds.astype(np.float32)
+    rows = np.tile(X.mean(axis=0), (3 * len(values), 1)).astype(np.float32)
+    for i, (feature, value) in enumerate(zip(features, values)):
+        rows[3 * i, feature] = value
+        rows[3 * i + 1, feature] = np.nextafter(value, np.float32(-np.inf))
+        rows[3 * i + 2, feature] = np.nextafter(value, np.float32(np.inf))
+
+    assert np.array_equal(flat.predict(rows), model.predict(rows))
+
+
+def test_extreme_and_sparse_inputs(data):
+    X, y = data
+    model = RandomForestRegressor(n_estimators=10, random_state=0).fit(X, y)
+    extreme = np.vstack([np.full(X.shape[1], 1e30), np.full(X.shape[1], -1e30), np.zeros(X.shape[1])])
+    assert_same_predictions(model, extreme)
+    assert_same_predictions(model, sparse.csr_matrix(X[:50]))
+
+
+def test_rejects_unsupported_models_and_wrong_shapes(data):
+    X, y = data
+    with pytest.raises(ValueError):
+        FlatForest.from_estimator(Ridge().fit(X, y))
+    with pytest.raises(ValueError):
+        FlatForest.from_estimator(RandomForestRegressor(n_estimators=2).fit(X, np.c_[y, y]))
+
+    flat = FlatForest.from_estimator(DecisionTreeRegressor(max_depth=2).fit(X, y))
+    with pytest.raises(ValueError):
+        flat.predict(X[:, :3])
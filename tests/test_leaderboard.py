@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from src.Model_Trainer_component import ModelFactoryModule
+from src.Model_Trainer_component.LeaderboardModule import Leaderboard
+from src.entity_component.flat_forest import FlatForest
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    y = X @ np.array([1.0, -2.0, 0.5, 3.0]) + rng.normal(scale=0.1, size=200)
+    return X[:150], y[:150], X[150:], y[150:]
+
+
+def leaderboard(*candidates) -> Leaderboard:
+    return Leaderboard({"candidates": list(candidates), "latency_repeats": 5})
+
+
+def test_skips_candidates_whose_library_is_missing(data, monkeypatch):
+    monkeypatch.setattr(ModelFactoryModule, "XGBRegressor", None)
+    model, board = leaderboard({"name": "XGBRegressor"}, {"name": "Ridge"}).run(*data)
+
+    assert list(board["model"]) == ["Ridge"]
+    assert board["selected"].all()
+
+
+def test_other_candidate_errors_propagate(data):
+    with pytest.raises(ValueError):
+        leaderboard({"name": "Ridge"}, {"name": "NotAModel"}).run(*data)
+    with pytest.raises(ValueError):
+        leaderboard({"name": "Ridge"}, {"name": "Ridge", "params": {"alpha": -1.0}}).run(*data)
+
+
+def test_tree_models_are_timed_through_the_flat_engine(data, monkeypatch):
+    flat_rows = []
+    predict = FlatForest.predict
+    monkeypatch.setattr(FlatForest, "predict", lambda self, X: flat_rows.append(X.shape[0]) or predict(self, X))
+
+    candidates = ({"name": "RandomForestRegressor", "params": {"n_estimators": 5}}, {"name": "Ridge"})
+    _, board = Leaderboard({"candidates": list(candidates), "latency_repeats": 5}, flat_forest=True).run(*data)
+
+    engines = dict(zip(board["model"], board["serving_engine"]))
+    assert engines == {"RandomForestRegressor": "flat_forest", "Ridge": "estimator"}
+    # single rows plus the 50-row test batch
+    assert set(flat_rows) == {1, 50}
+
+    _, board = leaderboard(*candidates).run(*data)
+    assert set(board["serving_engine"]) == {"estimator"}
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from src.utils_component.helper_functions_ import extract_memory, parse_memory, parse_memory_column
+
+
+@pytest.mark.parametrize("memory, expected", [
+    ("128GB SSD", (128, 0, 0, 0)),
+    ("1TB HDD", (0, 1000, 0, 0)),
+    ("64GB Flash Storage", (0, 0, 64, 0)),
+    # compound strings add up per storage type
+    ("128GB SSD +  1TB HDD", (128, 1000, 0, 0)),
+    ("256GB SSD +  256GB SSD", (512, 0, 0, 0)),
+    ("512GB SSD +  1.0TB Hybrid", (512, 0, 0, 1000)),
+    # decimal TB values
+    ("1.0TB Hybrid", (0, 0, 0, 1000)),
+    ("1.0TB HDD", (0, 1000, 0, 0)),
+    ("2TB HDD", (0, 2000, 0, 0)),
+    # nothing recognisable
+    ("no drive", (0, 0, 0, 0)),
+    (None, (0, 0, 0, 0)),
+])
+def test_parse_memory(memory, expected):
+    assert parse_memory(memory) == expected
+    assert [extract_memory(memory, storage) for storage in ("ssd", "hdd", "flash", "hybrid")] == list(expected)
+
+
+def test_parse_memory_column():
+    column = ["128GB SSD +  1TB HDD", None, "1.0TB Hybrid", np.nan, "128GB SSD +  1TB HDD"]
+    parsed = parse_memory_column(column)
+
+    assert parsed.dtype == np.int64
+    assert parsed.tolist() == [
+        [128, 1000, 0, 0],
+        [0, 0, 0, 0],
+        [0, 0, 0, 1000],
+        [0, 0, 0, 0],
+        [128, 1000, 0, 0],
+    ]
+
+
+def test_parse_memory_column_of_missing_values_only():
+    assert parse_memory_column([None, None]).tolist() == [[0, 0, 0, 0], [0, 0, 0, 0]]
+    assert parse_memory_column([]).shape == (0, 4)
@@ -0,0 +1,93 @@
+import json
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+
+from src.Data_transformation_component import DataTransformation
+from src.entity_component.estimator import ModelPredictor
+from src.entity_component.flat_forest import FlatForest
+from src.entity_component.model_bundle import HEADER, ModelBundle
+from src.pipeline_component.prediction_pipeline import LaptopData
+
+
+@pytest.fixture(scope="module")
+def model(laptop_data):
+    train = DataTransformation.apply_custom_feature_engineering(laptop_data)
+    target = DataTransformation.schema["target_column"]
+    preprocessor = DataTransformation(None, None).get_data_transformer_object()
+    X = preprocessor.fit_transform(train.drop(columns=target))
+    y = np.log(train[target].to_numpy().ravel())
+    forest = RandomForestRegressor(n_estimators=5, max_depth=8, random_state=0).fit(X, y)
+
+    model = ModelPredictor(preprocessing_object=preprocessor, trained_model_object=forest)
+    model.flat_model = FlatForest.from_estimator(forest)
+    return model.compile()
+
+
+@pytest.fixture(scope="module")
+def bundle(model):
+    return ModelBundle.dumps(model)
+
+
+@pytest.fixture(scope="module")
+def laptops(laptop_data):
+    return [LaptopData.from_record(record) for record in laptop_data.drop(columns=["Price"]).head(50).to_dict("records")]
+
+
+def set_array_value(bundle: bytes, name: str, index: int, value) -> bytes:
+    manifest, data_start = ModelBundle.read_manifest(bundle)
+    entry = manifest["arrays"][name]
+    data = bytearray(bundle)
+    array = np.frombuffer(data, dtype=entry["dtype"], count=entry["nbytes"] // np.dtype(entry["dtype"]).itemsize,
+                          offset=data_start + entry["offset"])
+    array[index] = value
+    return bytes(data)
+
+
+def set_model_info(bundle: bytes, key: str, value) -> bytes:
+    manifest, _ = ModelBundle.read_manifest(bundle)
+    _, _, length = HEADER.unpack_from(bundle)
+    manifest["model"][key] = value
+    # padded to the original length so the arrays stay where they are
+    manifest_bytes = json.dumps(manifest).encode("utf-8").ljust(length)
+    assert len(manifest_bytes) == length
+    return bundle[:HEADER.size] + manifest_bytes + bundle[HEADER.size + length:]
+
+
+def test_round_trip_predicts_like_the_model(model, bundle, laptops):
+    loaded = ModelBundle.loads(bundle)
+    expected = model.predict_compiled_batch([model.compiled_preprocessor.features_of(laptop) for laptop in laptops])
+    actual = loaded.predict_compiled_batch([loaded.compiled_preprocessor.features_of(laptop) for laptop in laptops])
+    assert np.array_equal(actual, expected)
+
+
+@pytest.mark.parametrize("name, index", [
+    ("flat_forest.feature", 0),
+    ("flat_forest.roots", 1),
+    ("flat_forest.left", 0),
+    ("flat_forest.right", 0),
+])
+def test_rejects_negative_indices(bundle, name, index):
+    with pytest.raises(ValueError, match=name):
+        ModelBundle.loads(set_array_value(bundle, name, index, -1))
+
+
+def test_rejects_indices_past_the_end(model, bundle):
+    flat = model.flat_model
+    with pytest.raises(ValueError, match="flat_forest.feature"):
+        ModelBundle.loads(set_array_value(bundle, "flat_forest.feature", 0, flat.n_features))
+    with pytest.raises(ValueError, match="flat_forest.roots"):
+        ModelBundle.loads(set_array_value(bundle, "flat_forest.roots", 0, flat.n_nodes))
+
+
+def test_rejects_a_max_depth_that_does_not_match_the_trees(model, bundle):
+    for max_depth in (model.flat_model.max_depth - 1, model.flat_model.max_depth + 1):
+        with pytest.raises(ValueError, match="max_depth"):
+            ModelBundle.loads(set_model_info(bundle, "max_depth", max_depth))
+
+
+def test_rejects_cycles(bundle):
+    # the first root's left child pointing back at the root
+    with pytest.raises(ValueError, match="cycle"):
+        ModelBundle.loads(set_array_value(bundle, "flat_forest.left", 0, 0))
@@ -0,0 +1,59 @@
+import boto3
+import pytest
+
+from src.cloud_storage.model_disk_cache import SHA256_METADATA_KEY, ModelDiskCache, file_sha256
+
+moto = pytest.importorskip("moto")
+
+BUCKET, KEY = "models", "model.pkl"
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def upload(s3_client, file_path) -> str:
+    sha256 = file_sha256(str(file_path))
+    s3_client.upload_file(str(file_path), BUCKET, KEY, ExtraArgs={"Metadata": {SHA256_METADATA_KEY: sha256}})
+    return sha256
+
+
+def test_put_caches_the_uploaded_version(s3_client, tmp_path):
+    cache = ModelDiskCache(str(tmp_path / "cache"), max_bytes=1 << 20)
+    model_file = tmp_path / "model.pkl"
+    model_file.write_bytes(b"our model")
+
+    path = cache.put(s3_client, BUCKET, KEY, str(model_file), upload(s3_client, model_file))
+
+    assert cache.get(s3_client, BUCKET, KEY) == path
+    assert cache.stats()["misses"] == 0
+
+
+def test_put_skips_a_model_replaced_since_the_upload(s3_client, tmp_path):
+    cache = ModelDiskCache(str(tmp_path / "cache"), max_bytes=1 << 20)
+    ours, theirs = tmp_path / "ours.pkl", tmp_path / "theirs.pkl"
+    ours.write_bytes(b"our model")
+    theirs.write_bytes(b"their model")
+
+    sha256 = upload(s3_client, ours)
+    upload(s3_client, theirs)  # another push lands before ours is cached
+
+    assert cache.put(s3_client, BUCKET, KEY, str(ours), sha256) is None
+    with open(cache.get(s3_client, BUCKET, KEY), "rb") as file:
+        assert file.read() == b"their model"
+
+
+def test_put_skips_a_deleted_model(s3_client, tmp_path):
+    cache = ModelDiskCache(str(tmp_path / "cache"), max_bytes=1 << 20)
+    model_file = tmp_path / "model.pkl"
+    model_file.write_bytes(b"our model")
+    sha256 = upload(s3_client, model_file)
+    s3_client.delete_object(Bucket=BUCKET, Key=KEY)
+
+    assert cache.put(s3_client, BUCKET, KEY, str(model_file), sha256) is None
@@ -0,0 +1,24 @@
+import pandas as pd
+
+from src.pipeline_component.prediction_cache import PredictionCache
+
+
+def test_frame_and_record_keys_match():
+    frame = pd.DataFrame({"Ram": [8, 16], "ppi": [141.21, 220.53], "Company": ["Apple", "HP"]})
+    keys = PredictionCache.make_keys(frame)
+
+    assert keys == [PredictionCache.make_key((8, 141.21, "Apple")), PredictionCache.make_key((16, 220.53, "HP"))]
+
+    cache = PredictionCache(max_size=10, ttl_seconds=60)
+    cache.put_many(keys, [1000.0, 2000.0], model_version=None)
+    assert cache.get_many([PredictionCache.make_key((16, 220.53, "HP"))], model_version=None) == [2000.0]
+
+
+def test_model_version_change_empties_the_cache():
+    cache = PredictionCache(max_size=10, ttl_seconds=60)
+    key = PredictionCache.make_key((8, 141.21, "Apple"))
+    cache.get_many([key], model_version="v1")
+    cache.put_many([key], [1000.0], model_version="v1")
+
+    assert cache.get_many([key], model_version="v2") == [None]
+    assert cache.stats()["invalidations"] == 1
@@ -0,0 +1,43 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from src.pipeline_component.stage_cache import StageCache
+
+
+@dataclass
+class Artifact:
+    file_path: str
+
+
+def make_artifact(tmp_path, name: str) -> Artifact:
+    path = tmp_path / "run" / name
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(name)
+    return Artifact(file_path=str(path))
+
+
+def test_keeps_the_most_recently_used_entries(tmp_path):
+    cache = StageCache(str(tmp_path / "cache"), max_entries_per_stage=2)
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.put("stage", key, make_artifact(tmp_path, key))
+        entry_dir = os.path.join(cache.cache_dir, "stage", key)
+        os.utime(entry_dir, (time.time() - 100 + index, time.time() - 100 + index))
+        if key == "b":
+            # a hit makes "a" the most recently used entry
+            assert cache.get("stage", "a") is not None
+
+    assert sorted(os.listdir(os.path.join(cache.cache_dir, "stage"))) == ["a", "c"]
+    cached = cache.get("stage", "c")
+    assert open(cached.file_path).read() == "c"
+
+
+def test_counters_are_exact_across_threads(tmp_path):
+    cache = StageCache(str(tmp_path / "cache"))
+    cache.put("stage", "hit", make_artifact(tmp_path, "hit"))
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda i: cache.get("stage", "hit" if i % 2 else "miss"), range(2000)))
+
+    assert (cache.hits, cache.misses) == (1000, 1000)
@@ -0,0 +1,16 @@
+from src.pipeline_component.training_job_runner import TrainingJob, TrainingJobRunner
+
+
+def test_get_returns_a_snapshot():
+    runner = TrainingJobRunner()
+    job = TrainingJob(job_id="job", status="running")
+    runner._jobs[job.job_id] = job
+
+    snapshot = runner.get("job")
+    job.stages["data_ingestion"] = "completed"
+    job.status = "succeeded"
+
+    assert snapshot["status"] == "running"
+    assert snapshot["stages"] == {}
+    assert runner.get("job")["stages"] == {"data_ingestion": "completed"}
+    assert runner.get("unknown") is None